@@ -0,0 +1,58 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import time
+
+from manim import *
+
+from backdrop_cache import BackdropCache, camera_fingerprint, mobject_fingerprint
+
+
+class BackdropCacheMixin:
+    # CairoRenderer har play/wait ki shuruaat mein static mobjects (plane,
+    # labels...) ko phir se rasterize karta hai. Yeh unka image plays ke
+    # beech cache karta hai: agar pichla static list (fingerprints ke saath)
+    # naye list ka prefix hai, toh cached image se shuru karke sirf naye
+    # mobjects draw hote hain. Koi bhi static layer badla toh cache khud reset.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.backdrop = BackdropCache()
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.static_image = None
+        # Skip ho rahe plays (-n, cached, parallel fast-forward) kuch draw nahi karte
+        if self.skip_animations:
+            return None
+        static_mobjects = list(static_mobjects or [])
+        if not static_mobjects:
+            return None
+
+        start = time.perf_counter()
+        key = camera_fingerprint(self.camera)
+        fingerprints = [mobject_fingerprint(mob) for mob in static_mobjects]
+        cached = self.backdrop.reusable(key, fingerprints)
+        if cached is not None:
+            self.camera.set_frame_to_background(self.backdrop.image)
+            self.camera.capture_mobjects(static_mobjects[cached:])
+        else:
+            self.camera.reset()
+            self.camera.capture_mobjects(static_mobjects)
+
+        self.static_image = self.get_frame()
+        self.backdrop.store(key, fingerprints, self.static_image, cached is not None, time.perf_counter() - start)
+        return self.static_image
+
+    def scene_finished(self, scene):
+        # saved = hits * (ek poore backdrop rasterize ka average) - hits ka apna time
+        backdrop = self.backdrop
+        logger.info(
+            "Backdrop cache for %(scene)s: %(hits)d hits, %(misses)d misses, ~%(saved).0f ms saved",
+            {
+                "scene": scene.__class__.__name__, "hits": backdrop.hits, "misses": backdrop.misses,
+                "saved": 1000 * backdrop.saved_seconds(),
+            },
+        )
+        super().scene_finished(scene)
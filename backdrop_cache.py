@@ -0,0 +1,84 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import numpy as np
+
+# Static backdrop cache ke pure-numpy tukde (backdrop.py inhe use karta hai).
+# Manim ke bina test ho sakte hain.
+STYLE_ARRAYS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "pixel_array")
+STYLE_VALUES = ("stroke_width", "background_stroke_width", "sheen_factor", "z_index")
+
+
+def mobject_fingerprint(mob):
+    # Poori family ke points + style ka hash: PolarPlane jaise VGroup ki
+    # koi bhi line zara bhi badli toh fingerprint badlega
+    parts = []
+    for member in mob.get_family():
+        parts += [id(member), np.asarray(member.points).tobytes()]
+        for attr in STYLE_ARRAYS:
+            value = getattr(member, attr, None)
+            if value is not None:
+                parts.append(np.asarray(value).tobytes())
+        for attr in STYLE_VALUES:
+            parts.append(getattr(member, attr, None))
+        parts.append(np.asarray(getattr(member, "sheen_direction", ())).tobytes())
+    return hash(tuple(parts))
+
+
+def camera_fingerprint(camera):
+    # Frame, background ya 3D orientation badle toh poora backdrop invalid
+    parts = [
+        str(camera.background_color),
+        camera.background_opacity,
+        tuple(np.asarray(camera.frame_center, dtype=float)),
+        camera.frame_width,
+        camera.frame_height,
+        camera.pixel_array.shape,
+    ]
+    if hasattr(camera, "get_phi"):
+        # ThreeDCamera
+        parts += [
+            camera.get_phi(),
+            camera.get_theta(),
+            camera.get_gamma(),
+            camera.get_focal_distance(),
+            camera.get_zoom(),
+        ]
+    return hash(tuple(parts))
+
+
+class BackdropCache:
+    # Pichla backdrop: camera key, har static mobject ka fingerprint aur image
+    def __init__(self):
+        self.key = None
+        self.fingerprints = []
+        self.image = None
+        self.hits = 0
+        self.misses = 0
+        self.hit_seconds = 0.0
+        self.miss_seconds = 0.0
+
+    def reusable(self, key, fingerprints):
+        # Cached image mein pehle se kitne mobjects hain (list ka prefix); None = sab dobara
+        cached = len(self.fingerprints)
+        if self.image is not None and key == self.key and fingerprints[:cached] == self.fingerprints:
+            return cached
+        return None
+
+    def store(self, key, fingerprints, image, hit, seconds):
+        self.key, self.fingerprints, self.image = key, fingerprints, image
+        if hit:
+            self.hits += 1
+            self.hit_seconds += seconds
+        else:
+            self.misses += 1
+            self.miss_seconds += seconds
+
+    def saved_seconds(self):
+        # Har hit ek poore rasterize (misses ka average) ki jagah
+        if not self.misses:
+            return 0.0
+        return self.hits * self.miss_seconds / self.misses - self.hit_seconds
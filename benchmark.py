@@ -0,0 +1,367 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from polar_geometry import TAU, rose_bezier_points_on_grid, rose_sample_count, theta_grid
+
+# python benchmark.py                       # saare scenes -ql + micro, baseline se compare
+# python benchmark.py -q l m --scenes PatternOfFive
+# python benchmark.py --micro-only
+# python benchmark.py --save-baseline       # render farm machine par naya baseline
+# Baseline se koi metric (1 + threshold) guna se zyada bura ho toh exit code 1.
+SCENES = {
+    "ChampaPolar": "Nature Decode",
+    "OddNumberSymmetry": "odd_symmetry.py",
+    "PatternOfFive": "pattern_of_five.py",
+    "HiddenFiveReveal": "hidden_five_reveal.py",
+    "SacredGeometryCinematic": "sacred_cinematic.py",
+    "CirclesToTempleFinalV3": "circles_to_temple_v3.py",
+}
+
+BASELINE_FILE = Path(__file__).with_name("benchmark_baseline.json")
+DEFAULT_THRESHOLD = 0.2
+
+# Jitna kam utna achha - inhi par regression check hota hai
+GATED_METRICS = ("wall_s", "frame_p50_ms", "frame_p99_ms", "peak_rss_mb", "us_per_call", "alloc_peak_kb")
+
+
+def bench_scene(scene_name, quality, media_dir):
+    # Alag (spawn) process mein: saaf config aur apna peak RSS
+    os.environ.pop("NATURE_PROFILE", None)
+    import profiling
+    from parallel_render import QUALITY_FLAGS, apply_config, load_scene_class
+
+    scene_file = Path(__file__).with_name(SCENES[scene_name])
+    apply_config(scene_file, {"quality": QUALITY_FLAGS[quality], "media_dir": media_dir})
+    from manim import config
+
+    # Cache hit benchmark ko jhootha bana dega
+    config.disable_caching = True
+    profiler = profiling.install(Path(media_dir) / "profile")
+
+    start = time.perf_counter()
+    load_scene_class(scene_file, scene_name)().render()
+    wall = time.perf_counter() - start
+
+    events = profiler.last_events
+    frames = np.array([event["dur"] / 1000 for event in events if event["cat"] == "frame"])
+    plays = [event for event in events if event["cat"] == "play"]
+    return {
+        "wall_s": wall,
+        "plays": len(plays),
+        "frames": len(frames),
+        "frame_p50_ms": float(np.percentile(frames, 50)) if len(frames) else 0.0,
+        "frame_p99_ms": float(np.percentile(frames, 99)) if len(frames) else 0.0,
+        # Linux par ru_maxrss KB mein
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "points": sum(
+            event["args"].get("points", 0) * max(event["args"]["frames"], 1) for event in plays
+        ),
+    }
+
+
+def micro_rose_curve():
+    # RoseCurve.update_curve ka hissa: ek frame par n=7 rose ke bezier points
+    thetas = theta_grid((0, TAU), rose_sample_count(7), 7)
+    cos_theta, sin_theta = np.cos(thetas), np.sin(thetas)
+    return lambda: rose_bezier_points_on_grid(7, 2.5, cos_theta, sin_theta, thetas)
+
+
+def rose_plane():
+    # odd_symmetry.polar_plane jaisa, bas coordinate labels ke bina (LaTeX nahi
+    # chahiye) - polar_to_point wahi rehta hai
+    from manim import TEAL, PolarPlane
+
+    return PolarPlane(
+        radius_max=3.5, size=7, azimuth_units="degrees", radius_step=1,
+        stroke_opacity=0.2, background_line_style={"stroke_color": TEAL},
+    )
+
+
+def micro_rose_always_redraw():
+    # Purana OddNumberSymmetry ka ek frame: always_redraw get_curve() aur
+    # get_glow() dono naye ParametricFunction banate the
+    from manim import PI, UR, YELLOW, ParametricFunction, ValueTracker
+
+    plane = rose_plane()
+    n_tracker = ValueTracker(3.5)
+
+    def get_curve():
+        n = n_tracker.get_value()
+        return ParametricFunction(
+            lambda t: plane.polar_to_point(2.5 * np.cos(n * t), t),
+            t_range=[0, 2 * PI],
+            color=YELLOW,
+            stroke_width=6,
+        ).set_stroke(opacity=1).set_sheen(0.5, direction=UR)
+
+    def get_glow():
+        n = n_tracker.get_value()
+        return ParametricFunction(
+            lambda t: plane.polar_to_point(2.5 * np.cos(n * t), t),
+            t_range=[0, 2 * PI],
+            color=YELLOW,
+            stroke_width=15,
+            stroke_opacity=0.3,
+        )
+
+    return lambda: (get_curve(), get_glow())
+
+
+def micro_rose_in_place():
+    # Naya: RoseCurve + glow layer, ek frame = update_curve()
+    from manim import UR, YELLOW, ValueTracker
+    from rose_curve import RoseCurve
+
+    graph = RoseCurve(
+        ValueTracker(3.5),
+        amplitude=2.5,
+        plane=rose_plane(),
+        n_samples=rose_sample_count(7),
+        color=YELLOW,
+        stroke_width=6,
+    ).set_stroke(opacity=1).set_sheen(0.5, direction=UR)
+    graph.add_layer(color=YELLOW, stroke_width=15, stroke_opacity=0.3)
+    return graph.update_curve
+
+
+def micro_glowing_stroke():
+    from manim import Circle
+    from sacred_cinematic import RICH_GOLD, make_glowing_stroke
+
+    circle = Circle(radius=2.5, color=RICH_GOLD, stroke_width=5)
+    return lambda: make_glowing_stroke(circle, RICH_GOLD, layers=3, max_width=12, base_opacity=0.2)
+
+
+def old_glowing_stroke(mobject, glow_color, layers=4, max_width=20, base_opacity=0.4):
+    # GlowStroke se pehle ka make_glowing_stroke: har layer source ki poori copy
+    from manim import VGroup
+
+    glow_group = VGroup()
+    for i in range(layers):
+        glow_layer = mobject.copy()
+        glow_layer.set_stroke(
+            width=max_width * (i + 1) / layers, color=glow_color, opacity=base_opacity * (1 - i / layers)
+        )
+        glow_layer.set_fill(opacity=0)
+        glow_group.add(glow_layer)
+    glow_group.add(mobject)
+    return glow_group
+
+
+def sacred_glows(make_glowing_stroke):
+    # SacredGeometryCinematic ke saare glows, dim ke baad wali state mein
+    from manim import DEGREES, UR, Circle, Polygon, Star, VGroup
+    from circle_geometry import circle_intersections, n_fold_centers, ring_polygon
+    from sacred_cinematic import AMBER_GLOW, DEEP_BRONZE, RICH_GOLD
+
+    radius = 2.5
+    center = Circle(radius=radius, color=RICH_GOLD, stroke_width=5).set_sheen(0.8, direction=UR)
+    circles = [make_glowing_stroke(center, RICH_GOLD, layers=3, max_width=12, base_opacity=0.2)]
+    centers = n_fold_centers(5, radius, 90 * DEGREES)
+    for position in centers:
+        circle = Circle(radius=radius, color=DEEP_BRONZE, stroke_width=3)
+        circles.append(
+            make_glowing_stroke(circle, DEEP_BRONZE, layers=2, max_width=8, base_opacity=0.15).move_to(position)
+        )
+    start_angle = (90 + 180 + 36) * DEGREES
+    points = ring_polygon(circle_intersections(np.vstack([np.zeros(3), centers]), radius), 5, start_angle=start_angle)
+    symmetry = VGroup(
+        Polygon(*points, color=AMBER_GLOW, stroke_width=6),
+        Star(n=5, outer_radius=np.linalg.norm(points[0]), start_angle=start_angle, color=AMBER_GLOW, stroke_width=4),
+    )
+    return VGroup(
+        VGroup(*circles).set_opacity(0.2),
+        make_glowing_stroke(symmetry, AMBER_GLOW, layers=6, max_width=40, base_opacity=0.5),
+    )
+
+
+def micro_glow_build(new):
+    from sacred_cinematic import make_glowing_stroke
+
+    return lambda: sacred_glows(make_glowing_stroke if new else old_glowing_stroke)
+
+
+def micro_glow_frame(new):
+    # Aakhri Rotate ka ek frame 1080p par: saare points ghoomte hain, phir rasterize
+    from manim import Camera
+    from multi_stroke import MultiStrokeCamera
+    from sacred_cinematic import make_glowing_stroke
+
+    group = sacred_glows(make_glowing_stroke if new else old_glowing_stroke)
+    camera = (MultiStrokeCamera if new else Camera)(pixel_width=1920, pixel_height=1080)
+    camera.background_color = "#050505"
+
+    def frame():
+        group.rotate(np.pi / 5 / 420)
+        camera.reset()
+        camera.capture_mobjects([group])
+
+    return frame
+
+
+def micro_temple_structure():
+    from circle_geometry import n_fold_centers
+    from circles_to_temple_v3 import create_temple_structure
+
+    # Scene jaise 5 shrines: ek beech mein, 4 corners par
+    positions = np.vstack([np.zeros(3), n_fold_centers(4, 1.28, np.pi / 4)])
+    scales = [0.96] + [0.56] * 4
+    return lambda: create_temple_structure(positions, scales, "#AA8C2C", "#D4AF37")
+
+
+MICROBENCHMARKS = {
+    "rose_curve": micro_rose_curve,
+    "rose_curve_always_redraw": micro_rose_always_redraw,
+    "rose_curve_in_place": micro_rose_in_place,
+    "make_glowing_stroke": micro_glowing_stroke,
+    "glow_copies_build": lambda: micro_glow_build(False),
+    "glow_stroke_build": lambda: micro_glow_build(True),
+    "glow_copies_frame_1080p": lambda: micro_glow_frame(False),
+    "glow_stroke_frame_1080p": lambda: micro_glow_frame(True),
+    "create_temple_structure": micro_temple_structure,
+}
+
+
+# (purana, naya) - dono ek saath print hote hain
+MICRO_PAIRS = (
+    ("rose_curve_always_redraw", "rose_curve_in_place"),
+    ("glow_copies_build", "glow_stroke_build"),
+    ("glow_copies_frame_1080p", "glow_stroke_frame_1080p"),
+)
+
+
+def measure_allocations(func):
+    # Ek call: peak extra memory, aur call ke baad bhi zinda naye blocks aur
+    # bytes (jaise har frame bane naye mobjects, ya bane hue glows ki memory). tracemalloc timing ke baad hi,
+    # warna woh khud call ko slow karta hai.
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = func()
+        end, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return {"alloc_peak_kb": (peak - start) / 1024, "alloc_kept_kb": (end - start) / 1024, "alloc_blocks": blocks}
+
+
+def run_micro(name, repeat=5):
+    func = MICROBENCHMARKS[name]()
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return {"us_per_call": best * 1e6, **measure_allocations(func)}
+
+
+def compare(results, baseline, threshold):
+    failures = []
+    for key, metrics in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        for metric in GATED_METRICS:
+            if metric in metrics and base.get(metric):
+                ratio = metrics[metric] / base[metric]
+                if ratio > 1 + threshold:
+                    failures.append(f"{key} {metric}: {base[metric]:.3f} -> {metrics[metric]:.3f} (x{ratio:.2f})")
+    return failures
+
+
+def print_results(results):
+    for key, metrics in results.items():
+        print(f"{key:<40}" + "  ".join(
+            f"{name}={value:.3f}" if isinstance(value, float) else f"{name}={value}"
+            for name, value in metrics.items()
+        ))
+
+
+def print_pairs(results):
+    for old_name, new_name in MICRO_PAIRS:
+        old, new = results.get(f"micro:{old_name}"), results.get(f"micro:{new_name}")
+        if not old or not new:
+            continue
+        print(
+            f"{old_name} -> {new_name}: "
+            f"{old['us_per_call']:.1f} -> {new['us_per_call']:.1f} us/call "
+            f"(x{old['us_per_call'] / new['us_per_call']:.1f}), "
+            f"peak {old['alloc_peak_kb']:.0f} -> {new['alloc_peak_kb']:.0f} KB, "
+            f"kept {old['alloc_kept_kb']:.0f} -> {new['alloc_kept_kb']:.0f} KB "
+            f"({old['alloc_blocks']} -> {new['alloc_blocks']} blocks)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Nature Decode scenes and hot helpers.")
+    parser.add_argument("--scenes", nargs="*", choices=sorted(SCENES), default=sorted(SCENES))
+    parser.add_argument("-q", "--quality", nargs="*", default=["l"], help="quality flags, e.g. l m h")
+    parser.add_argument("--micro-only", action="store_true")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=None, help=f"allowed slowdown, default {DEFAULT_THRESHOLD}")
+    parser.add_argument("--output", type=Path, default=None, help="write results JSON here")
+    args = parser.parse_args()
+
+    results = {}
+    for name in MICROBENCHMARKS:
+        results[f"micro:{name}"] = run_micro(name)
+
+    if not args.micro_only:
+        context = multiprocessing.get_context("spawn")
+        with tempfile.TemporaryDirectory(prefix="nature_bench_") as media_dir:
+            for scene_name in args.scenes:
+                for quality in args.quality:
+                    # Har scene naye process mein, taaki peak RSS sirf usi ka ho
+                    with ProcessPoolExecutor(1, mp_context=context) as pool:
+                        results[f"{scene_name}@{quality}"] = pool.submit(
+                            bench_scene, scene_name, quality, media_dir
+                        ).result()
+
+    print_results(results)
+    print_pairs(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if args.save_baseline:
+        threshold = DEFAULT_THRESHOLD if args.threshold is None else args.threshold
+        args.baseline.write_text(
+            json.dumps({"threshold": threshold, "results": results}, indent=2), encoding="utf-8"
+        )
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    threshold = baseline.get("threshold", DEFAULT_THRESHOLD) if args.threshold is None else args.threshold
+    failures = compare(results, baseline["results"], threshold)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    print(f"{len(failures)} regressions (threshold {threshold:.0%})")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,26 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+
+# Checkpoint index.json se frame window -> plays (checkpoints.py inhe use
+# karta hai). Manim ke bina test ho sakte hain.
+
+
+def plays_for_window(index, first, last):
+    # [first, last) frames: jis play mein first frame hai se jis mein last-1 hai tak
+    fps = index["frame_rate"]
+    starts = [round(entry["time"] * fps) for entry in index["plays"]]
+    end = round(index["end_time"] * fps)
+    if not 0 <= first < last <= end:
+        raise ValueError(f"Frame range {first}:{last} is outside 0:{end}")
+    from_play = max(k for k, start in enumerate(starts) if start <= first)
+    upto_play = max(k for k, start in enumerate(starts) if start < last)
+    return from_play, upto_play
+
+
+def parse_range(text, convert=float):
+    start, _, end = text.partition(":")
+    return convert(start), convert(end)
@@ -0,0 +1,300 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from manim import *
+from manim.utils.exceptions import EndSceneEarlyException
+from manim.utils.family import extract_mobject_family_members
+import numpy as np
+
+from checkpoint_index import parse_range, plays_for_window
+from render_cache import config_key
+
+# NATURE_CHECKPOINTS=1 manim -qh pattern_of_five.py PatternOfFive      # ek baar poora render
+# python checkpoints.py pattern_of_five.py PatternOfFive -q h --time 12:13
+# python checkpoints.py pattern_of_five.py PatternOfFive -q h --frames 720:780 --splice
+#
+# Poore render ke dauraan har play ki shuruaat par scene ki state ek chhoti
+# .npz file mein jaati hai: har mobject ke points, fill / stroke rgbas aur
+# widths (ValueTrackers bhi - unki value points mein hi hai, ambient rotation
+# wale camera trackers bhi), camera ki orientation, aur renderer ka time.
+# Range render mein construct() phir bhi chalta hai (Python function ko beech
+# se resume nahi kar sakte), par window se pehle ke plays skip hote hain - na
+# frames, na rasterize. Jis play mein window shuru hoti hai uski checkpoint
+# restore hoti hai, toh dt wale updaters (ambient rotation) aur time bilkul
+# original render jaise. Us play mein window se pehle ke frames sirf state
+# aage badhate hain; window ke baad wale plays chalte hi nahi.
+CHECKPOINTS_ENV = "NATURE_CHECKPOINTS"
+
+STYLE_ARRAYS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+STYLE_WIDTHS = ("stroke_width", "background_stroke_width")
+
+
+def checkpoints_enabled():
+    return os.environ.get(CHECKPOINTS_ENV, "0") not in ("", "0")
+
+
+def checkpoint_dir(scene_name):
+    # Resolution / fps badle toh frame numbers bhi badalte hain - alag folder
+    return Path(config.media_dir) / "checkpoints" / scene_name / config_key()
+
+
+def scene_family(scene):
+    return extract_mobject_family_members(list_update(scene.mobjects, scene.foreground_mobjects))
+
+
+def camera_state(camera):
+    state = list(camera.frame_center)
+    if isinstance(camera, ThreeDCamera):
+        state += [
+            camera.get_phi(), camera.get_theta(), camera.get_gamma(),
+            camera.get_focal_distance(), camera.get_zoom(),
+        ]
+    return np.array(state, dtype=float)
+
+
+def set_camera_state(camera, state):
+    camera.frame_center = state[:3]
+    if isinstance(camera, ThreeDCamera):
+        phi, theta, gamma, focal_distance, zoom = state[3:]
+        camera.set_phi(phi)
+        camera.set_theta(theta)
+        camera.set_gamma(gamma)
+        camera.set_focal_distance(focal_distance)
+        camera.set_zoom(zoom)
+
+
+def capture_state(scene, camera, renderer_time):
+    family = scene_family(scene)
+    arrays = {
+        "types": np.array([type(mob).__name__ for mob in family]),
+        "camera": camera_state(camera),
+        "time": np.array(renderer_time),
+    }
+    for i, mob in enumerate(family):
+        arrays[f"{i}.points"] = mob.points
+        for attr in STYLE_ARRAYS + STYLE_WIDTHS:
+            if hasattr(mob, attr):
+                arrays[f"{i}.{attr}"] = np.asarray(getattr(mob, attr))
+    return arrays
+
+
+def restore_state(scene, camera, arrays):
+    family = scene_family(scene)
+    types = [type(mob).__name__ for mob in family]
+    if types != list(arrays["types"]):
+        # Scene ka code checkpoint ke baad badla - fast-forward wali state hi sahi
+        logger.warning(
+            "Checkpoint does not match %(scene)s (%(saved)d saved vs %(live)d live mobjects); "
+            "rendering from the fast-forwarded state",
+            {"scene": type(scene).__name__, "saved": len(arrays["types"]), "live": len(family)},
+        )
+        return False
+    for i, mob in enumerate(family):
+        mob.points = np.array(arrays[f"{i}.points"])
+        for attr in STYLE_ARRAYS:
+            if f"{i}.{attr}" in arrays:
+                setattr(mob, attr, np.array(arrays[f"{i}.{attr}"]))
+        for attr in STYLE_WIDTHS:
+            if f"{i}.{attr}" in arrays:
+                setattr(mob, attr, float(arrays[f"{i}.{attr}"]))
+    set_camera_state(camera, arrays["camera"])
+    return True
+
+
+def load_index(scene_name):
+    index_path = checkpoint_dir(scene_name) / "index.json"
+    if not index_path.exists():
+        raise FileNotFoundError(
+            f"No checkpoints for {scene_name} at {config.pixel_width}x{config.pixel_height} "
+            f"{config.frame_rate}fps; render it once with {CHECKPOINTS_ENV}=1"
+        )
+    return json.loads(index_path.read_text(encoding="utf-8"))
+
+
+class CheckpointMixin:
+    # Renderer ke liye. NATURE_CHECKPOINTS ho toh har play se pehle state
+    # likho; render_window = (first, last, from_play, upto_play) ho toh sirf
+    # woh frames rasterize aur file writer ko bhejo.
+    render_window = None
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self.checkpoint_entries = None
+        self.window_restored = False
+        if self.render_window is not None:
+            # Cache wala partial movie poore play ka hai, window ka nahi
+            config.disable_caching = True
+        elif checkpoints_enabled() and not config.from_animation_number and not config.upto_animation_number:
+            # Cache hit plays skip hote hain (time sirf duration se badhta hai) -
+            # checkpoints har frame wale render se hi exact hain
+            config.disable_caching = True
+            logger.info("Checkpoints: render cache is off for this render")
+            self.checkpoint_entries = []
+            self.checkpoint_path = checkpoint_dir(type(scene).__name__)
+            self.checkpoint_path.mkdir(parents=True, exist_ok=True)
+
+    def frame_index(self):
+        return round(self.time * self.camera.frame_rate)
+
+    def play(self, scene, *args, **kwargs):
+        if self.checkpoint_entries is not None:
+            file_name = f"play_{self.num_plays:05}.npz"
+            np.savez_compressed(self.checkpoint_path / file_name, **capture_state(scene, self.camera, self.time))
+            self.checkpoint_entries.append({"play": self.num_plays, "time": self.time, "file": file_name})
+        elif self.render_window is not None:
+            _, _, from_play, upto_play = self.render_window
+            if self.num_plays > upto_play:
+                raise EndSceneEarlyException()
+            if self.num_plays == from_play and not self.window_restored:
+                self.restore_checkpoint(scene, from_play)
+        return super().play(scene, *args, **kwargs)
+
+    def restore_checkpoint(self, scene, play):
+        start = time.perf_counter()
+        path = checkpoint_dir(type(scene).__name__) / f"play_{play:05}.npz"
+        with np.load(path) as arrays:
+            if restore_state(scene, self.camera, arrays):
+                # Skip hue plays ka time frame-rounded nahi hota; original wala lo
+                self.time = float(arrays["time"])
+        self.window_restored = True
+        logger.info(
+            "Restored checkpoint %(path)s in %(elapsed).2fs",
+            {"path": path, "elapsed": time.perf_counter() - start},
+        )
+
+    def outside_window(self):
+        if self.render_window is None or self.skip_animations:
+            return False
+        first, last = self.render_window[:2]
+        return not first <= self.frame_index() < last
+
+    def render(self, scene, time, moving_mobjects):
+        if self.outside_window():
+            # Frame ginti aage, pixels nahi
+            self.time += 1 / self.camera.frame_rate
+            return
+        super().render(scene, time, moving_mobjects)
+
+    def add_frame(self, frame, num_frames=1):
+        if self.render_window is None or self.skip_animations:
+            return super().add_frame(frame, num_frames)
+        # Frozen wait ke N frames mein se sirf window wale
+        first, last = self.render_window[:2]
+        index = self.frame_index()
+        inside = max(0, min(index + num_frames, last) - max(index, first))
+        self.time += (num_frames - inside) / self.camera.frame_rate
+        if inside:
+            super().add_frame(frame, inside)
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        if self.checkpoint_entries is None:
+            return
+        index = {
+            "scene": type(scene).__name__,
+            "frame_rate": self.camera.frame_rate,
+            "end_time": self.time,
+            "plays": self.checkpoint_entries,
+        }
+        (self.checkpoint_path / "index.json").write_text(json.dumps(index, indent=1), encoding="utf-8")
+        logger.info(
+            "%(count)d checkpoints written to %(path)s",
+            {"count": len(self.checkpoint_entries), "path": self.checkpoint_path},
+        )
+
+
+def splice(original, clip, first, last, output):
+    # original[:first] + clip + original[last:]; cut keyframe par nahi hota,
+    # isliye -c copy nahi, re-encode
+    graph = (
+        f"[0:v]split[head][tail];"
+        f"[head]trim=end_frame={first},setpts=PTS-STARTPTS[a];"
+        f"[1:v]setpts=PTS-STARTPTS[b];"
+        f"[tail]trim=start_frame={last},setpts=PTS-STARTPTS[c];"
+        f"[a][b][c]concat=n=3:v=1:a=0[out]"
+    )
+    command = [
+        config.ffmpeg_executable,
+        "-y",
+        "-i", str(original),
+        "-i", str(clip),
+        "-filter_complex", graph,
+        "-map", "[out]",
+        "-loglevel", config.ffmpeg_loglevel.lower(),
+        "-vcodec", "libx264",
+        "-pix_fmt", "yuv420p",
+        str(output),
+    ]
+    subprocess.run(command, check=True)
+    return output
+
+
+def main():
+    from nature_renderer import enable_feature
+    from parallel_render import QUALITY_FLAGS, apply_config, load_scene_class
+
+    parser = argparse.ArgumentParser(description="Re-render a frame range of a scene from its checkpoints.")
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    window = parser.add_mutually_exclusive_group(required=True)
+    window.add_argument("--frames", metavar="A:B", help="frames A (inclusive) to B (exclusive)")
+    window.add_argument("--time", metavar="T0:T1", help="seconds")
+    parser.add_argument("--splice", nargs="?", const="", default=None, metavar="MOVIE",
+                        help="splice the range into MOVIE (default: the scene's full movie)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), default=None)
+    parser.add_argument("--media-dir", default=None)
+    args = parser.parse_args()
+
+    overrides = {}
+    if args.quality:
+        overrides["quality"] = QUALITY_FLAGS[args.quality]
+    if args.media_dir:
+        overrides["media_dir"] = args.media_dir
+    apply_config(args.scene_file, overrides)
+
+    index = load_index(args.scene_name)
+    if args.frames:
+        first, last = parse_range(args.frames, int)
+    else:
+        first, last = (round(t * index["frame_rate"]) for t in parse_range(args.time))
+    from_play, upto_play = plays_for_window(index, first, last)
+    logger.info(
+        "Frames %(first)d:%(last)d are in plays %(from_play)d..%(upto_play)d",
+        {"first": first, "last": last, "from_play": from_play, "upto_play": upto_play},
+    )
+
+    config.from_animation_number = from_play
+    config.output_file = f"{args.scene_name}_frames_{first}-{last}"
+    CheckpointMixin.render_window = (first, last, from_play, upto_play)
+    enable_feature("checkpoints")
+
+    start = time.perf_counter()
+    scene = load_scene_class(args.scene_file, args.scene_name)()
+    scene.render()
+    clip = scene.renderer.file_writer.movie_file_path
+    logger.info(
+        "%(frames)d frames re-rendered in %(elapsed).1fs -> %(path)s",
+        {"frames": last - first, "elapsed": time.perf_counter() - start, "path": clip},
+    )
+
+    if args.splice is not None:
+        original = Path(args.splice or Path(clip).with_name(f"{args.scene_name}{config.movie_file_extension}"))
+        output = original.with_name(f"{original.stem}_spliced{original.suffix}")
+        splice(original, clip, first, last, output)
+        logger.info("Spliced into %(path)s", {"path": output})
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
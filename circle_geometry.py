@@ -0,0 +1,254 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import math
+
+import numpy as np
+
+TAU = 2 * np.pi
+
+# manim ka Circle (Arc, num_components=9) = 8 bezier curves
+CIRCLE_CURVES = 8
+
+
+def n_fold_centers(n, ring_radius, angle_offset=0.0):
+    # n centers ek ring par, har ek 360/n degree rotated
+    angles = np.arange(n) * (TAU / n) + angle_offset
+    return np.column_stack([
+        ring_radius * np.cos(angles),
+        ring_radius * np.sin(angles),
+        np.zeros(n),
+    ])
+
+
+def circle_bezier_points(centers, radii, start_angle=0.0, n_curves=CIRCLE_CURVES):
+    # Saare circles ek saath: shape (N * n_curves * 4, 3), circle i ke points
+    # ek contiguous block mein. Handles bilkul manim ke Arc jaise (d_theta / 3).
+    centers = np.asarray(centers, dtype=float)
+    radii = np.broadcast_to(np.asarray(radii, dtype=float), (len(centers),))
+
+    angles = start_angle + np.linspace(0, TAU, n_curves + 1)
+    anchors = np.column_stack([np.cos(angles), np.sin(angles), np.zeros_like(angles)])
+    tangents = np.column_stack([-anchors[:, 1], anchors[:, 0], np.zeros_like(angles)])
+    d_theta = TAU / n_curves
+
+    unit = np.empty((n_curves, 4, 3))
+    unit[:, 0] = anchors[:-1]
+    unit[:, 1] = anchors[:-1] + (d_theta / 3) * tangents[:-1]
+    unit[:, 2] = anchors[1:] - (d_theta / 3) * tangents[1:]
+    unit[:, 3] = anchors[1:]
+
+    points = centers[:, None, None, :] + radii[:, None, None, None] * unit[None]
+    return points.reshape(-1, 3)
+
+
+def partial_bezier_blocks(points, proportions, n_curves=CIRCLE_CURVES):
+    # Har block (ek circle) ka sirf [0, proportion] hissa, baaki curves end
+    # point par collapse - pointwise_become_partial jaisa, par saare blocks ek saath
+    proportions = np.clip(np.asarray(proportions, dtype=float), 0, 1)
+    blocks = np.array(points, dtype=float).reshape(len(proportions), n_curves, 4, -1)
+    n_blocks = len(blocks)
+
+    scaled = proportions * n_curves
+    index = np.minimum(np.floor(scaled).astype(int), n_curves - 1)
+    t = (scaled - index)[:, None]
+
+    # De Casteljau se current curve ko t par split karo
+    p0, p1, p2, p3 = np.moveaxis(blocks[np.arange(n_blocks), index], 1, 0)
+    a = p0 + t * (p1 - p0)
+    b = p1 + t * (p2 - p1)
+    c = p2 + t * (p3 - p2)
+    d = a + t * (b - a)
+    e = b + t * (c - b)
+    end = d + t * (e - d)
+
+    blocks[np.arange(n_blocks), index] = np.stack([p0, a, d, end], axis=1)
+    after = np.arange(n_curves)[None, :] > index[:, None]
+    blocks[after] = np.repeat(end, after.sum(axis=1), axis=0)[:, None, :]
+    return blocks.reshape(-1, blocks.shape[-1])
+
+
+def staggered_proportions(rate_func, alpha, n, lag_ratio):
+    # lag_ratio wali group animation mein har member ka rate_func(sub_alpha).
+    # manim ke rate functions scalar hain (smooth mein min/max, there_and_back
+    # mein if) toh array par nahi chalte. Par clip ke baad zyada tar members
+    # 0 ya 1 par hote hain, isliye har alag value par sirf ek call.
+    full_length = (n - 1) * lag_ratio + 1
+    sub_alphas = np.clip(alpha * full_length - np.arange(n) * lag_ratio, 0, 1)
+    values, inverse = np.unique(sub_alphas, return_inverse=True)
+    return np.array([rate_func(value) for value in values], dtype=float)[inverse.reshape(-1)]
+
+
+# Grid mein padosi cells: poore 3x3, aur aadhe (har cell pair ek hi baar)
+NEIGHBOUR_CELLS = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+HALF_NEIGHBOUR_CELLS = ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+def grid_pairs(points_a, points_b, cell_size):
+    # Spatial grid index: (i, j) jinke points ek hi ya padosi cells mein hain.
+    # points_b None ho toh points_a ke andar ke pairs, har pair ek hi baar
+    # ((0,0) cell mein j > i, aur aadhe padosi offsets).
+    same = points_b is None
+    if same:
+        points_b = points_a
+    if len(points_a) == 0 or len(points_b) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    cell_size = max(cell_size, 1e-12)
+    cells_a = np.floor(points_a[:, :2] / cell_size).astype(np.int64)
+    cells_b = np.floor(points_b[:, :2] / cell_size).astype(np.int64)
+    low = np.minimum(cells_a.min(axis=0), cells_b.min(axis=0)) - 1
+    width = max(cells_a[:, 1].max(), cells_b[:, 1].max()) - low[1] + 2
+    keys_a = (cells_a[:, 0] - low[0]) * width + (cells_a[:, 1] - low[1])
+    keys_b = (cells_b[:, 0] - low[0]) * width + (cells_b[:, 1] - low[1])
+
+    order = np.argsort(keys_b, kind="stable")
+    sorted_keys = keys_b[order]
+    if same:
+        query_keys, query_index, offsets = sorted_keys, order, HALF_NEIGHBOUR_CELLS
+    else:
+        query_keys, query_index, offsets = keys_a, np.arange(len(keys_a)), NEIGHBOUR_CELLS
+
+    first, second = [], []
+    for dx, dy in offsets:
+        target = query_keys + dx * width + dy
+        start = np.searchsorted(sorted_keys, target, side="left")
+        end = np.searchsorted(sorted_keys, target, side="right")
+        if same and dx == 0 and dy == 0:
+            start = np.maximum(start, np.arange(len(query_keys)) + 1)
+        counts = np.maximum(end - start, 0)
+
+        offsets_in_cell = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        first.append(np.repeat(query_index, counts))
+        second.append(order[np.repeat(start, counts) + offsets_in_cell])
+    return np.concatenate(first), np.concatenate(second)
+
+
+def radius_classes(radii):
+    # Radius ke hisaab se groups, har group mein radii 2x ke andar
+    # (log2 buckets). Ek bada circle baaki sab ka cell size nahi bigaadta.
+    radii = np.asarray(radii, dtype=float)
+    floor = max(radii.max(), 1e-12) * 1e-9
+    classes = np.floor(np.log2(np.maximum(radii, floor))).astype(np.int64)
+    return [np.flatnonzero(classes == c) for c in np.unique(classes)]
+
+
+def candidate_pairs(centers, radii):
+    # Woh (i, j) pairs jo shaayad katte hon (d <= r_i + r_j), har pair ek baar.
+    # Har radius class apne grid mein (cell = class ka sabse bada diameter),
+    # aur do classes ke beech ek grid jiska cell = dono ke max radius ka jod -
+    # toh chhote circles ek bade circle ki wajah se ek hi cell mein nahi bharte.
+    centers = np.asarray(centers, dtype=float)
+    radii = np.broadcast_to(np.asarray(radii, dtype=float), (len(centers),))
+    groups = radius_classes(radii)
+    reach = [radii[group].max() for group in groups]
+
+    first, second = [], []
+    for a, group_a in enumerate(groups):
+        i, j = grid_pairs(centers[group_a], None, 2 * reach[a])
+        first.append(group_a[i])
+        second.append(group_a[j])
+        for b in range(a + 1, len(groups)):
+            group_b = groups[b]
+            i, j = grid_pairs(centers[group_a], centers[group_b], reach[a] + reach[b])
+            first.append(group_a[i])
+            second.append(group_b[j])
+    return np.concatenate(first), np.concatenate(second)
+
+
+def dedupe_points(points, tol=1e-6):
+    # Kisi pehle wale point se tol ke andar ho toh duplicate (order stable).
+    # Padosi cells bhi dekhe jaate hain, toh cell boundary ke dono taraf
+    # wale near-duplicates bhi mil jaate hain.
+    if len(points) < 2:
+        return points
+    i, j = grid_pairs(points, None, tol)
+    close = np.linalg.norm(points[i] - points[j], axis=1) <= tol
+    keep = np.ones(len(points), dtype=bool)
+    keep[np.maximum(i[close], j[close])] = False
+    return points[keep]
+
+
+def circle_intersections(centers, radii, tol=1e-6):
+    # Saare circles ke aapas ke intersection points, shape (M, 3), z = 0.
+    # Pairs grid index se aate hain, math poora vectorized hai.
+    centers = np.asarray(centers, dtype=float)
+    if centers.shape[1] == 2:
+        centers = np.column_stack([centers, np.zeros(len(centers))])
+    radii = np.broadcast_to(np.asarray(radii, dtype=float), (len(centers),))
+    if len(centers) < 2:
+        return np.zeros((0, 3))
+
+    i, j = candidate_pairs(centers, radii)
+    c1, c2 = centers[i, :2], centers[j, :2]
+    r1, r2 = radii[i], radii[j]
+    delta = c2 - c1
+    d = np.linalg.norm(delta, axis=1)
+
+    # Sirf woh pairs jo sach mein katte (ya chhoote) hain
+    hit = (d > tol) & (d <= r1 + r2 + tol) & (d >= np.abs(r1 - r2) - tol)
+    c1, delta, d, r1, r2 = c1[hit], delta[hit], d[hit], r1[hit], r2[hit]
+
+    a = (r1 ** 2 - r2 ** 2 + d ** 2) / (2 * d)
+    h = np.sqrt(np.maximum(r1 ** 2 - a ** 2, 0))
+    unit = delta / d[:, None]
+    base = c1 + a[:, None] * unit
+    perp = np.column_stack([-unit[:, 1], unit[:, 0]]) * h[:, None]
+
+    points = np.concatenate([base + perp, base - perp])
+    points = np.column_stack([points, np.zeros(len(points))])
+    return dedupe_points(points, tol)
+
+
+def intersection_rings(points, center=(0, 0, 0), start_angle=0.0, tol=1e-6):
+    # Points ko center se doori ke hisaab se rings mein baanto (andar se bahar).
+    # Har ring ke vertices counter-clockwise, start_angle se shuru.
+    points = np.asarray(points, dtype=float)
+    offsets = points[:, :2] - np.asarray(center, dtype=float)[:2]
+    radii = np.linalg.norm(offsets, axis=1)
+    angles = (np.arctan2(offsets[:, 1], offsets[:, 0]) - start_angle + tol) % TAU
+
+    order = np.lexsort((angles, radii))
+    radii, angles, points = radii[order], angles[order], points[order]
+    breaks = np.flatnonzero(np.diff(radii) > tol) + 1
+
+    rings = []
+    for ring in np.split(np.arange(len(points)), breaks):
+        ring = ring[np.argsort(angles[ring], kind="stable")]
+        rings.append((radii[ring].mean(), points[ring]))
+    return rings
+
+
+def ring_polygon(points, n, center=(0, 0, 0), start_angle=0.0, index=0, tol=1e-6):
+    # 'index'-va (andar se) ring jisme theek n vertices hain - jaise pentagon
+    # ke liye n = 5. Ring na mile toh ValueError.
+    rings = [
+        vertices for radius, vertices in intersection_rings(points, center, start_angle, tol)
+        if len(vertices) == n and radius > tol
+    ]
+    if index >= len(rings):
+        raise ValueError(f"Only {len(rings)} rings with {n} intersection points, asked for index {index}")
+    return rings[index]
+
+
+def star_cycles(n, density=2):
+    # {n/density} star ke vertex cycles. gcd(n, density) = g > 1 ho toh ek
+    # cycle saare vertices tak nahi pahunchta: compound star, g alag polygons
+    # (n = 6 -> do triangles / hexagram, n = 8 -> do squares, n = 4 -> do diagonals)
+    density %= n
+    if density == 0:
+        raise ValueError(f"Star density must not be a multiple of n={n}")
+    g = math.gcd(n, density)
+    return [[(start + i * density) % n for i in range(n // g)] for start in range(g)]
+
+
+def star_order(n, density=2):
+    # Ek hi cycle wala star: n = 5, density = 2 -> [0, 2, 4, 1, 3]
+    cycles = star_cycles(n, density)
+    if len(cycles) > 1:
+        raise ValueError(
+            f"{{{n}/{density}}} is a compound star of {len(cycles)} polygons; use star_cycles"
+        )
+    return cycles[0]
@@ -7,35 +7,51 @@ YouTube: https://www.youtube.com/@MathRize
 from manim import *
 import numpy as np
 
+from draft import draft_resolution
+from multi_stroke import MultiStrokeThreeDCamera
+from nature_renderer import NatureRenderer
+from rosette import CircleRosette, CreateRosette
+from shrine import RiseShrines, ShrineInstances
+
 # --- CUSTOM TEMPLE SHAPE FUNCTION ---
-def create_temple_structure(pos, scale_val, main_color, accent_color):
-    # 1. The Base (Chabootra)
-    base = Cube(side_length=0.7 * scale_val, fill_color=main_color, fill_opacity=1, stroke_color=accent_color, stroke_width=1)
-    base.stretch(0.4, dim=2) 
-    base.move_to(pos + np.array([0,0,0.15*scale_val])) 
-
-    # 2. The Spire (Shikhara)
-    spire = Cone(base_radius=0.35 * scale_val, height=0.8 * scale_val, direction=OUT)
-    spire.set_fill(main_color, opacity=1)
-    spire.set_stroke(accent_color, width=1)
-    spire.next_to(base, OUT, buff=0) 
-
-    return VGroup(base, spire)
+def create_temple_structure(positions, scales, main_color, accent_color):
+    # Base (Chabootra) + Spire (Shikhara), har position par ek shrine.
+    # Geometry ek hi baar banti hai, har shrine sirf position + scale hai
+    # (dekho shrine.py) - dozens/hundreds of shrines bhi ek hi mobject.
+    return ShrineInstances(
+        positions,
+        scales,
+        fill_color=main_color,
+        fill_opacity=1,
+        stroke_color=accent_color,
+        stroke_width=1
+    )
 # ------------------------------------
 
 
 class CirclesToTempleFinalV3(ThreeDScene):
+    # Sweep parameters (dekho sweep.py)
+    # --- COLOR THEME ---
+    MAIN_GOLD = "#D4AF37"
+    DEEP_GOLD = "#AA8C2C"
+    GLOW_COLOR = "#FFFFF0"
+    SCALE_FACTOR = 0.8
+    BACKGROUND = "#0a0a0a"
+
+    def __init__(self, renderer=None, **kwargs):
+        super().__init__(
+            renderer=renderer or NatureRenderer(camera_class=MultiStrokeThreeDCamera),
+            camera_class=MultiStrokeThreeDCamera,
+            **kwargs
+        )
+
     def construct(self):
         # 1. SETUP
-        self.camera.background_color = "#0a0a0a" 
+        self.camera.background_color = self.BACKGROUND
         self.set_camera_orientation(phi=0*DEGREES, theta=-90*DEGREES)
 
-        # --- COLOR THEME ---
-        MAIN_GOLD = "#D4AF37" 
-        DEEP_GOLD = "#AA8C2C" 
-        GLOW_COLOR = "#FFFFF0" 
-
-        SCALE_FACTOR = 0.8 
+        MAIN_GOLD, DEEP_GOLD, GLOW_COLOR = self.MAIN_GOLD, self.DEEP_GOLD, self.GLOW_COLOR
+        SCALE_FACTOR = self.SCALE_FACTOR
 
         # =========================================
         # PHASE 1: SACRED GEOMETRY (The Circles)
@@ -44,18 +60,21 @@ class CirclesToTempleFinalV3(ThreeDScene):
 
         center_circle = Circle(radius=R, color=MAIN_GOLD, stroke_width=3, stroke_opacity=0.8)
         
-        outer_circles = VGroup()
-        for i in range(4):
-            angle = i * PI / 2
-            center_pos = [R * np.cos(angle), R * np.sin(angle), 0]
-            outer_circles.add(Circle(radius=R, color=DEEP_GOLD, stroke_width=2, stroke_opacity=0.5).move_to(center_pos))
+        outer_circles = CircleRosette.n_fold(
+            4,
+            radius=R,
+            ring_radius=R,
+            color=DEEP_GOLD,
+            stroke_width=2,
+            stroke_opacity=0.5
+        )
 
         geometry_group = VGroup(center_circle, outer_circles)
 
         # ANIMATION 1
         self.play(
             Create(center_circle),
-            Create(outer_circles, lag_ratio=0.1),
+            CreateRosette(outer_circles, lag_ratio=0.1),
             run_time=2.5,
             rate_func=smooth
         )
@@ -67,7 +86,9 @@ class CirclesToTempleFinalV3(ThreeDScene):
         # =========================================
         points_group = VGroup()
         center_point_pos = ORIGIN
-        points_group.add(Dot3D(center_point_pos, color=GLOW_COLOR, radius=0.1*SCALE_FACTOR))
+        # Dot3D ki default (8, 8) tessellation; draft mein kam (dekho draft.py)
+        dot_resolution = draft_resolution((8, 8))
+        points_group.add(Dot3D(center_point_pos, color=GLOW_COLOR, radius=0.1*SCALE_FACTOR, resolution=dot_resolution))
 
         corner_dist = R * 0.8 
         corner_positions = []
@@ -75,7 +96,7 @@ class CirclesToTempleFinalV3(ThreeDScene):
             angle = i * PI / 2 + PI/4 
             pos = [corner_dist * np.cos(angle), corner_dist * np.sin(angle), 0]
             corner_positions.append(pos)
-            points_group.add(Dot3D(pos, color=MAIN_GOLD, radius=0.08*SCALE_FACTOR))
+            points_group.add(Dot3D(pos, color=MAIN_GOLD, radius=0.08*SCALE_FACTOR, resolution=dot_resolution))
 
         # ANIMATION 2
         self.play(
@@ -90,16 +111,18 @@ class CirclesToTempleFinalV3(ThreeDScene):
         # PHASE 3: THE TEMPLE RISE
         # =========================================
         
-        main_shrine_3d = create_temple_structure(center_point_pos, 1.2*SCALE_FACTOR, DEEP_GOLD, MAIN_GOLD)
-        
-        corner_shrines_3d = VGroup()
-        for pos in corner_positions:
-            shrine = create_temple_structure(pos, 0.7*SCALE_FACTOR, DEEP_GOLD, MAIN_GOLD)
-            corner_shrines_3d.add(shrine)
+        # Pehla shrine main (center), baaki 4 corners
+        shrines_3d = create_temple_structure(
+            [center_point_pos] + corner_positions,
+            [1.2*SCALE_FACTOR] + [0.7*SCALE_FACTOR] * 4,
+            DEEP_GOLD,
+            MAIN_GOLD
+        )
+        plinth_centers = shrines_3d.get_plinth_centers()
 
         plan_lines = VGroup()
-        for corner in corner_shrines_3d:
-            line = Line(start=main_shrine_3d[0].get_center(), end=corner[0].get_center(), color=MAIN_GOLD, stroke_opacity=0.4, stroke_width=1.5)
+        for corner in plinth_centers[1:]:
+            line = Line(start=plinth_centers[0], end=corner, color=MAIN_GOLD, stroke_opacity=0.4, stroke_width=1.5)
             plan_lines.add(line)
 
         # ANIMATION 3: 3D Camera Move & Rising Effect
@@ -110,11 +133,8 @@ class CirclesToTempleFinalV3(ThreeDScene):
         self.play(
             Create(plan_lines),
             # 'smooth' animation use kiya hai jo kabhi error nahi dega
-            GrowFromPoint(main_shrine_3d, main_shrine_3d.get_bottom()),
-            GrowFromPoint(corner_shrines_3d[0], corner_shrines_3d[0].get_bottom()),
-            GrowFromPoint(corner_shrines_3d[1], corner_shrines_3d[1].get_bottom()),
-            GrowFromPoint(corner_shrines_3d[2], corner_shrines_3d[2].get_bottom()),
-            GrowFromPoint(corner_shrines_3d[3], corner_shrines_3d[3].get_bottom()),
+            # Har shrine apne base se upar uthta hai
+            RiseShrines(shrines_3d),
             run_time=2.5,
             rate_func=smooth 
         )
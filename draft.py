@@ -0,0 +1,125 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import argparse
+import os
+import sys
+import time
+
+from manim import *
+
+from draft_levels import (
+    DEFAULT_BUDGET_MS,
+    DRAFT_ENV,
+    draft_budget,
+    draft_level,
+    draft_lod_bias,
+    draft_resolution,
+    draft_sample_count,
+    draft_settings,
+    escalate_draft_level,
+    glow_layer_indices,
+    log_degradation,
+    reset_draft_level,
+)
+
+# NATURE_DRAFT=40 manim -ql sacred_cinematic.py SacredGeometryCinematic   # 40 ms/frame budget
+# python draft.py --all -q l                                            # saare scenes ka preview
+# python draft.py ChampaPolar --budget 20
+#
+# Draft mode: -ql kam pixels deta hai, par mehenge effects phir bhi poore
+# chalte hain. Yahan har effect ka ek sasta version hai. Level 1 se shuru
+# hota hai; kisi play ka average frame time budget se zyada ho toh agle
+# level par. Plays, run_times aur mobjects wahi rehte hain, toh layout aur
+# timing final render jaisi hi hai - sirf detail kam hoti hai.
+#
+# Do tarah ke knobs:
+# - draw time (turant lagte hain): GlowStroke ki layers, shrine LOD
+# - build time (aage bane mobjects par): rose curve samples, Dot3D
+#   tessellation, set_sheen
+
+
+def apply_sheen(mobject, factor, direction=UR):
+    # set_sheen ka draft version: draft mein sheen nahi, color wahi
+    if draft_settings()["sheen"]:
+        return mobject.set_sheen(factor, direction=direction)
+    log_degradation("sheen", factor, 0)
+    return mobject
+
+
+class DraftBudgetMixin:
+    # Renderer ke liye: har play ke frames ka average time budget se zyada
+    # ho toh draft level badhao. Draft mode band ho toh kuch nahi.
+    def __init__(self, *args, **kwargs):
+        # Har scene ka renderer naya: pichle scene ka level (daemon, sweep worker) nahi
+        reset_draft_level()
+        super().__init__(*args, **kwargs)
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        if draft_budget() is not None:
+            # Glow layers aur LOD draw time par badalte hain, play ke hash mein
+            # nahi aate - draft partial movie final render ke cache mein na jaaye
+            config.disable_caching = True
+
+    def play(self, scene, *args, **kwargs):
+        self.draft_frame_times = []
+        super().play(scene, *args, **kwargs)
+        escalate_draft_level(self.draft_frame_times, self.num_plays - 1)
+
+    def render(self, scene, time_, moving_mobjects):
+        if draft_budget() is None or self.skip_animations:
+            return super().render(scene, time_, moving_mobjects)
+        start = time.perf_counter()
+        super().render(scene, time_, moving_mobjects)
+        self.draft_frame_times.append(time.perf_counter() - start)
+
+
+def main():
+    from parallel_render import QUALITY_FLAGS, apply_config, load_scene_class
+    from render_daemon import discover_scenes
+
+    parser = argparse.ArgumentParser(description="Render fast draft previews with degraded effects.")
+    parser.add_argument("scenes", nargs="*", help="scene class names")
+    parser.add_argument("--all", action="store_true", help="every scene in the repo")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_MS, help="target ms per frame")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), default="l")
+    parser.add_argument("--media-dir", default=None)
+    args = parser.parse_args()
+
+    scenes = discover_scenes()
+    names = sorted(scenes) if args.all else args.scenes
+    unknown = [name for name in names if name not in scenes]
+    if not names or unknown:
+        parser.error(f"unknown scene(s) {', '.join(unknown) or '-'}; known: {', '.join(sorted(scenes))}")
+
+    os.environ[DRAFT_ENV] = str(args.budget)
+    overrides = {"quality": QUALITY_FLAGS[args.quality]}
+    if args.media_dir:
+        overrides["media_dir"] = args.media_dir
+
+    total = time.perf_counter()
+    for name in names:
+        reset_draft_level()
+        apply_config(scenes[name], overrides)
+        # Draft movie final wali ko overwrite na kare
+        config.output_file = f"{name}_draft"
+        start = time.perf_counter()
+        scene = load_scene_class(scenes[name], name)()
+        scene.render()
+        logger.info(
+            "%(name)s draft in %(elapsed).1fs (level %(level)d) -> %(path)s",
+            {
+                "name": name, "elapsed": time.perf_counter() - start, "level": draft_level(),
+                "path": scene.renderer.file_writer.movie_file_path,
+            },
+        )
+    logger.info("%(count)d drafts in %(elapsed).1fs", {"count": len(names), "elapsed": time.perf_counter() - total})
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import logging
+import os
+
+import numpy as np
+
+# Draft levels aur unke knobs (dekho draft.py), manim ke bina
+logger = logging.getLogger("manim")
+
+DRAFT_ENV = "NATURE_DRAFT"
+DEFAULT_BUDGET_MS = 40.0
+
+# Level 0 = final render
+DRAFT_LEVELS = (
+    {"glow_layers": None, "sample_scale": 1.0, "lod_bias": 0, "dot_resolution": None, "sheen": True},
+    {"glow_layers": 3, "sample_scale": 0.5, "lod_bias": 1, "dot_resolution": (6, 6), "sheen": False},
+    {"glow_layers": 2, "sample_scale": 0.25, "lod_bias": 2, "dot_resolution": (4, 4), "sheen": False},
+    {"glow_layers": 1, "sample_scale": 0.125, "lod_bias": 3, "dot_resolution": (3, 3), "sheen": False},
+)
+MIN_DRAFT_SAMPLES = 24
+
+_level = None
+_logged = set()
+
+
+def draft_budget():
+    # ms per frame; None = draft mode band
+    value = os.environ.get(DRAFT_ENV, "")
+    if value in ("", "0"):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return DEFAULT_BUDGET_MS
+
+
+def draft_level():
+    global _level
+    if _level is None:
+        _level = 0 if draft_budget() is None else 1
+    return _level
+
+
+def reset_draft_level():
+    # Agla scene phir budget ke hisaab se level 1 (ya 0) se, aur apne logs ke saath
+    global _level
+    _level = None
+    _logged.clear()
+
+
+def set_draft_level(level, reason):
+    global _level
+    level = min(level, len(DRAFT_LEVELS) - 1)
+    if level != draft_level():
+        logger.info("Draft level %(old)d -> %(new)d (%(reason)s)", {"old": _level, "new": level, "reason": reason})
+        _level = level
+
+
+def escalate_draft_level(frame_times, play):
+    # Play ke frames ka average budget se zyada ho toh agla level
+    budget = draft_budget()
+    if budget is None or not frame_times:
+        return
+    frame_ms = 1000 * np.mean(frame_times)
+    if frame_ms > budget:
+        set_draft_level(
+            draft_level() + 1, f"play {play}: {frame_ms:.1f} ms/frame, budget {budget:.0f} ms"
+        )
+
+
+def draft_settings():
+    return DRAFT_LEVELS[draft_level()]
+
+
+def log_degradation(effect, final, draft):
+    # Har (effect, final -> draft) ek hi baar log hota hai
+    key = (draft_level(), effect, str(final), str(draft))
+    if key not in _logged:
+        _logged.add(key)
+        logger.info("Draft: %(effect)s %(final)s -> %(draft)s", {"effect": effect, "final": final, "draft": draft})
+
+
+def glow_layer_indices(layers):
+    # GlowStroke ki kaun si layers draw hon: barabar faasle par, patli se moti
+    cap = draft_settings()["glow_layers"]
+    if cap is None or cap >= layers:
+        return range(layers)
+    log_degradation("glow layers", layers, cap)
+    return np.unique(np.round(np.linspace(0, layers - 1, cap)).astype(int))
+
+
+def draft_sample_count(n_samples):
+    scale = draft_settings()["sample_scale"]
+    if scale == 1.0:
+        return n_samples
+    draft = max(MIN_DRAFT_SAMPLES, int(n_samples * scale))
+    if draft < n_samples:
+        log_degradation("curve samples", n_samples, draft)
+    return min(draft, n_samples)
+
+
+def draft_lod_bias():
+    bias = draft_settings()["lod_bias"]
+    if bias:
+        log_degradation("shrine LOD bias", 0, bias)
+    return bias
+
+
+def draft_resolution(resolution):
+    # Dot3D / Surface ki (u, v) resolution
+    draft = draft_settings()["dot_resolution"]
+    if draft is None:
+        return resolution
+    draft = tuple(min(d, r) for d, r in zip(draft, resolution))
+    if draft != tuple(resolution):
+        log_degradation("surface resolution", tuple(resolution), draft)
+    return draft
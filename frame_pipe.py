@@ -0,0 +1,161 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import argparse
+import subprocess
+import sys
+import time
+import weakref
+
+from manim import *
+from manim.utils.file_ops import is_png_format, write_to_movie
+import numpy as np
+
+from frame_ring import FrameRing, ring_slots
+from held_frames import HoldFrameFileWriter, encoder_command
+
+# NATURE_FRAME_RING=8 manim -qk sacred_cinematic.py SacredGeometryCinematic
+# python frame_pipe.py --size 3840x2160 --frames 240       # pipe vs ring, synthetic frames
+#
+# Ring khud (FrameRing, encoder process) frame_ring.py mein hai; yahan
+# manim ka file writer aur renderer usse jude hain.
+
+
+class FramePipeFileWriter(HoldFrameFileWriter):
+    # NATURE_FRAME_RING=<slots> ho toh frames shared-memory ring se encoder
+    # process ko; warna bilkul HoldFrameFileWriter jaisa
+    def init_output_directories(self, scene_name):
+        super().init_output_directories(scene_name)
+        self.frame_ring = None
+        slots = ring_slots()
+        if not slots or not write_to_movie() or is_png_format():
+            return
+        camera = self.renderer.camera
+        self.frame_ring = FrameRing(camera.pixel_array.shape, slots)
+        self.frame_ring.current[:] = camera.pixel_array
+        camera.pixel_array = self.frame_ring.current
+        self.frame_ring_finalizer = weakref.finalize(self, self.frame_ring.shutdown)
+
+    def open_encoder(self, command):
+        if getattr(self, "frame_ring", None) is None:
+            return super().open_encoder(command)
+        self.frame_ring.open(command)
+
+    def open_movie_pipe(self, file_path=None):
+        if getattr(self, "frame_ring", None) is None:
+            return super().open_movie_pipe(file_path)
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+        self.open_encoder(encoder_command(config["pixel_width"], config["pixel_height"], file_path))
+
+    def write_frame(self, frame_or_renderer):
+        ring = getattr(self, "frame_ring", None)
+        if ring is None or not write_to_movie():
+            return super().write_frame(frame_or_renderer)
+        # Pehla frame aaye tabhi ffmpeg (dekho held_frames.py)
+        self.open_pending_pipe()
+        if frame_or_renderer is ring.last:
+            ring.repeat()
+            return
+        if frame_or_renderer is not ring.current:
+            ring.current[:] = frame_or_renderer
+        # Camera agle slot mein draw karega
+        self.renderer.camera.pixel_array = ring.submit()
+
+    def close_movie_pipe(self):
+        if getattr(self, "frame_ring", None) is None:
+            return super().close_movie_pipe()
+        self.frame_ring.close()
+        logger.info(
+            f"Animation {self.renderer.num_plays} : Partial movie file written in %(path)s",
+            {"path": f"'{self.partial_movie_file_path}'"},
+        )
+
+    def finish(self):
+        if getattr(self, "frame_ring", None) is not None:
+            # save_last_frame jaise baad ke draws ke liye camera ki apni copy
+            camera = self.renderer.camera
+            camera.pixel_array = np.array(camera.pixel_array)
+            self.frame_ring_finalizer()
+            self.frame_ring = None
+        super().finish()
+
+
+class FramePipeMixin:
+    # Renderer ke liye: ring mode mein frame ki copy (get_frame) nahi -
+    # camera ka pixel_array (jo ring slot hi hai) seedha file writer ko
+    def uses_frame_ring(self):
+        return getattr(self.file_writer, "frame_ring", None) is not None
+
+    def render(self, scene, time, moving_mobjects):
+        if not self.uses_frame_ring():
+            return super().render(scene, time, moving_mobjects)
+        self.update_frame(scene, moving_mobjects)
+        self.add_frame(self.camera.pixel_array)
+
+    def freeze_current_frame(self, duration):
+        if not self.uses_frame_ring():
+            return super().freeze_current_frame(duration)
+        dt = 1 / self.camera.frame_rate
+        self.add_frame(self.camera.pixel_array, num_frames=int(duration / dt))
+
+
+def bench_pipe(shape, n_frames, slots, sink):
+    # Rasterizer ki jagah: har frame background copy + thoda draw, phir output
+    background = np.full(shape, 16, dtype=np.uint8)
+
+    start = time.perf_counter()
+    pixel_array = background.copy()
+    process = subprocess.Popen(sink, stdin=subprocess.PIPE)
+    for i in range(n_frames):
+        pixel_array[:] = background
+        pixel_array[i % shape[0]] = 255
+        frame = np.array(pixel_array)
+        process.stdin.write(frame.tobytes())
+    process.stdin.close()
+    process.wait()
+    pipe = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ring = FrameRing(shape, slots)
+    ring.open(sink)
+    pixel_array = ring.current
+    for i in range(n_frames):
+        pixel_array[:] = background
+        pixel_array[i % shape[0]] = 255
+        pixel_array = ring.submit()
+    ring.close()
+    ring.shutdown()
+    shared = time.perf_counter() - start
+    return pipe, shared
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the ffmpeg pipe with the shared-memory frame ring.")
+    parser.add_argument("--size", default="3840x2160")
+    parser.add_argument("--frames", type=int, default=240)
+    parser.add_argument("--slots", type=int, default=8)
+    parser.add_argument("--sink", choices=["null", "ffmpeg"], default="ffmpeg",
+                        help="null: only the transport (cat > /dev/null); ffmpeg: real x264 encode")
+    args = parser.parse_args()
+
+    width, height = (int(value) for value in args.size.lower().split("x"))
+    shape = (height, width, 4)
+    if args.sink == "null":
+        sink = ["sh", "-c", "cat > /dev/null"]
+    else:
+        sink = encoder_command(width, height, "-")[:-1] + ["-f", "null", "-"]
+    pipe, shared = bench_pipe(shape, args.frames, args.slots, sink)
+    mb = args.frames * np.prod(shape) / 2**20
+    print(f"{args.frames} frames {width}x{height} ({mb:.0f} MB), sink={args.sink}")
+    print(f"pipe: {pipe:.2f}s ({args.frames / pipe:.1f} fps)")
+    print(f"ring: {shared:.2f}s ({args.frames / shared:.1f} fps), {args.slots} slots")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import logging
+import multiprocessing
+import os
+import subprocess
+from multiprocessing import shared_memory
+
+import numpy as np
+
+logger = logging.getLogger("manim")
+
+# Shared-memory frame ring (frame_pipe.py ka transport), manim ke bina.
+#
+# Normal raasta: har frame get_frame() ki copy, phir tobytes() ki copy, phir
+# ffmpeg pipe mein write - aur write tab tak blocked jab tak ffmpeg poora
+# frame pipe se padh na le. Ring mode mein camera ka pixel_array hi shared
+# memory ka ek slot hai: cairo seedha slot mein draw karta hai, frame khatam
+# hone par sirf slot number encoder process ko jaata hai aur camera agle
+# free slot par chala jaata hai. Encoder process slot se ffmpeg pipe mein
+# likhta hai, toh rasterize aur encode saath-saath chalte hain. Saare slots
+# bhare hon toh renderer rukta hai (backpressure). Pichla submit kiya slot
+# agle submit tak producer ke paas rehta hai, kyunki repeat() usi ko dobara
+# bhejta hai - isliye kam se kam 3 slots.
+#
+# Encoder mein koi bhi error (ffmpeg nahi mila, ffmpeg beech mein band) result
+# pipe se producer tak aata hai aur wahan RuntimeError banta hai; producer
+# kabhi bina timeout ke intezaar nahi karta, toh encoder process mar jaaye
+# tab bhi render atakta nahi.
+RING_ENV = "NATURE_FRAME_RING"
+MIN_RING_SLOTS = 3
+RING_TIMEOUT = 1.0
+
+
+def encoder_loop(buffer, frame_bytes, free, messages, results):
+    # Encoder process: slot -> ffmpeg stdin; "release" par slot wapas free.
+    # Error aaye toh producer ko batao, phir bhi messages padhte raho aur
+    # slots free karte raho - producer free.acquire() par na atke
+    process = None
+    failed = False
+    while (message := messages.get()) is not None:
+        kind = message[0]
+        if kind == "release":
+            free.release()
+            continue
+        try:
+            if kind == "open":
+                process, failed = None, False
+                process = subprocess.Popen(message[1], stdin=subprocess.PIPE)
+            elif kind == "close":
+                code = None
+                if process is not None:
+                    try:
+                        process.stdin.close()
+                    except OSError:
+                        # ffmpeg pehle hi band ho chuka; exit code wait() se
+                        pass
+                    code = process.wait()
+                process = None
+                results.send(("closed", code))
+            elif not failed:
+                start = message[1] * frame_bytes
+                process.stdin.write(buffer[start:start + frame_bytes])
+        except Exception as error:
+            failed = True
+            results.send(("error", f"{type(error).__name__}: {error}"))
+
+
+class FrameRing:
+    def __init__(self, frame_shape, slots):
+        # fork: child ko shared memory ka mapping seedha milta hai (attach nahi)
+        context = multiprocessing.get_context("fork")
+        self.frame_bytes = int(np.prod(frame_shape))
+        self.memory = shared_memory.SharedMemory(create=True, size=self.frame_bytes * slots)
+        self.slots = [
+            np.ndarray(frame_shape, dtype=np.uint8, buffer=self.memory.buf, offset=i * self.frame_bytes)
+            for i in range(slots)
+        ]
+        self.free = context.Semaphore(slots)
+        self.messages = context.SimpleQueue()
+        # Pipe, queue nahi: producer poll(timeout) kar sake
+        self.results, results = context.Pipe(duplex=False)
+        self.process = context.Process(
+            target=encoder_loop,
+            args=(self.memory.buf, self.frame_bytes, self.free, self.messages, results),
+            daemon=True,
+        )
+        self.process.start()
+        results.close()
+        # Producer hamesha ek slot ka maalik hai - usi mein draw hota hai
+        self.acquire()
+        self.index = 0
+        self.last_index = None
+
+    @property
+    def current(self):
+        return self.slots[self.index]
+
+    @property
+    def last(self):
+        return None if self.last_index is None else self.slots[self.last_index]
+
+    def check_alive(self):
+        if not self.process.is_alive():
+            self.process.join()
+            raise RuntimeError(f"Frame ring encoder process died (exit code {self.process.exitcode})")
+
+    def recv(self):
+        try:
+            return self.results.recv()
+        except EOFError:
+            # Pipe ka doosra sira band = encoder process khatam
+            self.process.join(RING_TIMEOUT)
+            self.check_alive()
+            raise RuntimeError("Frame ring encoder process exited") from None
+
+    def check_errors(self):
+        # Encoder ne beech mein error bheja ho toh yahin raise
+        while self.results.poll():
+            kind, value = self.recv()
+            if kind == "error":
+                raise RuntimeError(f"Frame ring encoder failed: {value}")
+
+    def receive(self):
+        while not self.results.poll(RING_TIMEOUT):
+            self.check_alive()
+        return self.recv()
+
+    def acquire(self):
+        # Backpressure: agla slot free hone tak ruko - par encoder fail ho
+        # gaya ya mar gaya toh nahi
+        while not self.free.acquire(timeout=RING_TIMEOUT):
+            self.check_errors()
+            self.check_alive()
+
+    def release_last(self):
+        # Pichla slot ab repeat nahi hoga; encoder uske frames likhne ke baad free kare
+        if self.last_index is not None:
+            self.messages.put(("release", self.last_index))
+            self.last_index = None
+
+    def open(self, command):
+        self.messages.put(("open", command))
+
+    def submit(self):
+        self.check_errors()
+        self.messages.put(("frame", self.index))
+        self.release_last()
+        self.last_index = self.index
+        self.acquire()
+        self.index = (self.index + 1) % len(self.slots)
+        return self.current
+
+    def repeat(self):
+        # Pichla slot dobara - wo agle submit tak producer ke paas hai, toh
+        # encoder tak pahunchne se pehle overwrite nahi ho sakta
+        self.check_errors()
+        self.messages.put(("frame", self.last_index))
+
+    def close(self):
+        self.release_last()
+        self.messages.put(("close",))
+        error = None
+        while (message := self.receive())[0] == "error":
+            error = error or message[1]
+        if error is not None:
+            raise RuntimeError(f"Frame ring encoder failed: {error}")
+        if message[1] != 0:
+            raise RuntimeError(f"ffmpeg exited with code {message[1]}")
+        return message[1]
+
+    def shutdown(self):
+        self.messages.put(None)
+        self.process.join(RING_TIMEOUT)
+        if self.process.is_alive():
+            # Encoder kisi atke hue ffmpeg write par - ab intezaar nahi
+            self.process.terminate()
+            self.process.join()
+        self.results.close()
+        self.slots = []
+        self.memory.unlink()
+        try:
+            self.memory.close()
+        except BufferError:
+            # Cairo surface ab bhi slot ka view pakde hai; mapping process ke saath jaayega
+            pass
+
+
+def ring_slots():
+    # NATURE_FRAME_RING: slots ki ginti; khaali / 0 = ring band. Galat ya
+    # MIN_RING_SLOTS se kam value par warning aur normal ffmpeg pipe
+    value = os.environ.get(RING_ENV, "").strip()
+    if value in ("", "0"):
+        return 0
+    try:
+        slots = int(value)
+    except ValueError:
+        logger.warning(
+            "%(env)s=%(value)r is not a slot count; using the normal ffmpeg pipe",
+            {"env": RING_ENV, "value": value},
+        )
+        return 0
+    if slots < MIN_RING_SLOTS:
+        logger.warning(
+            "%(env)s=%(slots)d is below the minimum of %(min)d slots; using the normal ffmpeg pipe",
+            {"env": RING_ENV, "slots": slots, "min": MIN_RING_SLOTS},
+        )
+        return 0
+    return slots
@@ -0,0 +1,68 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+from manim import *
+import numpy as np
+
+from draft import glow_layer_indices
+
+
+class GlowPath(VMobject):
+    # Source ke ek member (jaise pentagon) ki saari glow layers: geometry sirf
+    # ek baar. Har layer ka color/opacity stroke_rgbas ki ek row hai, aur uski
+    # width stroke_width ka ek hissa. MultiStrokeCamera isi path ko N baar
+    # stroke karta hai.
+    # Fill (jaise set_opacity ke baad) bhi har layer ke liye alag, pehle ki
+    # copies jaisa (dekho multi_stroke.py).
+    fill_each_pass = True
+
+    def __init__(self, member, glow_color, layers=4, max_width=20, base_opacity=0.4, **kwargs):
+        # Fill color aur sheen source ke hi (mobject.copy() mein bhi wahi the)
+        kwargs.setdefault("fill_color", member.get_fill_color())
+        kwargs.setdefault("sheen_factor", member.get_sheen_factor())
+        kwargs.setdefault("sheen_direction", member.get_sheen_direction())
+        super().__init__(stroke_color=glow_color, stroke_width=max_width, fill_opacity=0, **kwargs)
+        self.set_points(member.points.copy())
+
+        # Har layer pichli se thodi moti aur zyada transparent hogi
+        self.width_fractions = (np.arange(layers) + 1) / layers
+        opacities = base_opacity * (1 - np.arange(layers) / layers)
+        glow_rgba = ManimColor(glow_color).to_rgba()
+        self.stroke_rgbas = np.array([[*glow_rgba[:3], opacity] for opacity in opacities])
+
+    def get_glow_widths(self):
+        return self.stroke_width * self.width_fractions
+
+    def get_layer_rgbas(self, rgba):
+        # Sheen wale source ki copy par set_stroke do rows deta tha: color aur
+        # chamakti color, jinka gradient sheen_direction mein
+        factor = self.get_sheen_factor()
+        if factor == 0:
+            return rgba[np.newaxis]
+        light = rgba.copy()
+        light[:3] = np.clip(light[:3] + factor, 0, 1)
+        return np.array([rgba, light])
+
+    def get_stroke_passes(self):
+        # Saari layers ek hi subpaths object share karti hain. Draft mode
+        # mein sirf kuch layers (dekho draft.py)
+        subpaths = self.get_subpaths()
+        rgbas, widths = self.get_stroke_rgbas(), self.get_glow_widths()
+        layers = min(len(rgbas), len(widths))
+        return [(subpaths, self.get_layer_rgbas(rgbas[i]), widths[i]) for i in glow_layer_indices(layers)]
+
+
+class GlowStroke(VGroup):
+    # Source ke har member ka ek GlowPath. Members alag rehte hain, toh
+    # pentagon aur star jahan katate hain wahan glow pehle ki copies jaisa
+    # do baar blend hota hai, aur Create har member par saath chalta hai.
+    # Layers ek hi glow color ki hain, toh member ke andar layer order se
+    # result nahi badalta.
+    def __init__(self, mobject, glow_color, layers=4, max_width=20, base_opacity=0.4, **kwargs):
+        super().__init__(*[
+            GlowPath(member, glow_color, layers, max_width, base_opacity, **kwargs)
+            for member in mobject.family_members_with_points()
+        ])
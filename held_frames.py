@@ -0,0 +1,113 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import subprocess
+
+from manim import *
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_png_format, is_webm_format, write_to_movie
+
+
+def encoder_command(width, height, file_path, filters=None):
+    # SceneFileWriter.open_movie_pipe (Cairo) jaisa hi ffmpeg command, bas
+    # size aur -vf filters apne
+    fps = config["frame_rate"]
+    if fps == int(fps):
+        fps = int(fps)
+
+    command = [
+        config.ffmpeg_executable,
+        "-y",
+        "-f", "rawvideo",
+        "-s", "%dx%d" % (width, height),
+        "-pix_fmt", "rgba",
+        "-r", str(fps),
+        "-i", "-",
+        "-an",
+        "-loglevel", config["ffmpeg_loglevel"].lower(),
+    ]
+    if filters:
+        command += ["-vf", filters]
+    if is_webm_format():
+        command += ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"]
+    elif config["transparent"]:
+        command += ["-vcodec", "qtrle"]
+    else:
+        command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+    return command + [str(file_path)]
+
+
+class HoldFrameFileWriter(SceneFileWriter):
+    # ffmpeg pipe tabhi khulta hai jab pehla frame aaye. Frozen wait (kuch bhi
+    # nahi badal raha) ho toh sirf ek frame bhejte hain aur ffmpeg ka tpad
+    # filter usi ko baaki duration ke liye clone karta hai - N baar same
+    # 8MB frame pipe mein likhne ki zaroorat nahi.
+    #
+    # segment_only: parallel_render.py ke workers sirf apne plays ki partial
+    # files likhte hain - poori movie combine karna aur cache saaf karna
+    # main process ka kaam hai.
+    segment_only = False
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        self.pending_pipe = write_to_movie() and allow_write
+        self.pending_file_path = file_path
+
+    def open_pending_pipe(self, hold_frames=1):
+        if not getattr(self, "pending_pipe", False):
+            return
+        self.pending_pipe = False
+        if hold_frames > 1:
+            self.open_held_movie_pipe(hold_frames, file_path=self.pending_file_path)
+        else:
+            self.open_movie_pipe(file_path=self.pending_file_path)
+
+    def write_frame(self, frame_or_renderer):
+        self.open_pending_pipe()
+        super().write_frame(frame_or_renderer)
+
+    def write_held_frame(self, frame, num_frames):
+        # Pipe pehle hi khul chuka ho ya PNG output ho toh purana tareeka
+        if not getattr(self, "pending_pipe", False) or is_png_format():
+            for _ in range(num_frames):
+                self.write_frame(frame)
+            return
+        self.open_pending_pipe(hold_frames=num_frames)
+        # self se, taaki upar wale writers (frame_pipe.py) bhi yeh frame dekhein
+        self.write_frame(frame)
+
+    def end_animation(self, allow_write=False):
+        self.open_pending_pipe()
+        super().end_animation(allow_write)
+
+    def finish(self):
+        if self.segment_only:
+            return
+        super().finish()
+
+    def open_held_movie_pipe(self, hold_frames, file_path=None):
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+
+        command = encoder_command(
+            config["pixel_width"], config["pixel_height"], file_path,
+            filters=f"tpad=stop_mode=clone:stop={hold_frames - 1}",
+        )
+        self.open_encoder(command)
+
+    def open_encoder(self, command):
+        self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+
+class HoldFrameMixin:
+    # freeze_current_frame -> add_frame(frame, num_frames=N): N copies ki
+    # jagah file writer ko ek hi frame "hold" karne ko bolo
+    def add_frame(self, frame, num_frames=1):
+        if num_frames > 1 and not self.skip_animations and hasattr(self.file_writer, "write_held_frame"):
+            self.time += num_frames / self.camera.frame_rate
+            self.file_writer.write_held_frame(frame, num_frames)
+        else:
+            super().add_frame(frame, num_frames)
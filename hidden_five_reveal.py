@@ -7,47 +7,79 @@ YouTube: https://www.youtube.com/@MathRize
 from manim import *
 import numpy as np
 
+from circle_geometry import circle_intersections, ring_polygon, star_cycles
+from multi_stroke import MultiStrokeCamera
+from nature_renderer import NatureRenderer
+from rosette import CircleRosette, CreateRosette
+
 class HiddenFiveReveal(Scene):
+    # Sweep parameters (dekho sweep.py): FOLDS circles, FOLDS-pointed star
+    FOLDS = 5
+    STAR_DENSITY = 2
+    R = 2.0
+    GOLD_COLOR = "#FFD700"
+    GLOW_COLOR = "#FFFFE0"
+    STAR_COLOR = "#FF4500" # Thoda orange-red taaki alag dikhe
+    BACKGROUND = "#050505"
+
+    def __init__(self, renderer=None, **kwargs):
+        super().__init__(
+            renderer=renderer or NatureRenderer(camera_class=MultiStrokeCamera),
+            camera_class=MultiStrokeCamera,
+            **kwargs
+        )
+
+    @classmethod
+    def check_parameters(cls):
+        # Sweep overrides: kam se kam triangle, aur density FOLDS ka multiple nahi
+        if cls.FOLDS < 3:
+            raise ValueError(f"{cls.__name__}: FOLDS must be at least 3, got {cls.FOLDS}")
+        if cls.STAR_DENSITY % cls.FOLDS == 0:
+            raise ValueError(f"{cls.__name__}: STAR_DENSITY={cls.STAR_DENSITY} is a multiple of FOLDS={cls.FOLDS}")
+
     def construct(self):
-        # 1. SETUP: Dark Background for Cinematic feel
-        self.camera.background_color = "#050505"
+        self.check_parameters()
 
-        # COLORS
-        GOLD_COLOR = "#FFD700"
-        GLOW_COLOR = "#FFFFE0"
-        STAR_COLOR = "#FF4500" # Thoda orange-red taaki alag dikhe
+        # 1. SETUP: Dark Background for Cinematic feel
+        self.camera.background_color = self.BACKGROUND
 
         # 2. CREATE CIRCLES (The "Drawing" Phase)
         # Hum 5 circles banayenge jo 72 degrees par rotated honge (Perfect 5 symmetry)
-        circles = VGroup()
-        R = 2.0 
-        
-        for i in range(5):
-            angle = i * (2 * PI / 5) + PI/2 # 72 degrees rotation
-            # Center of the new circle
-            center = [R * 0.6 * np.cos(angle), R * 0.6 * np.sin(angle), 0]
-            circle = Circle(radius=R, color=GOLD_COLOR, stroke_width=2, stroke_opacity=0.6).move_to(center)
-            circles.add(circle)
+        R = self.R
+
+        # Saare circles ek hi mobject mein (centers R*0.6 ki ring par, 90 degree se shuru)
+        circles = CircleRosette.n_fold(
+            self.FOLDS,
+            radius=R,
+            ring_radius=R * 0.6,
+            angle_offset=PI/2,
+            color=self.GOLD_COLOR,
+            stroke_width=2,
+            stroke_opacity=0.6
+        )
 
         # 3. CREATE THE HIDDEN STAR (The "Reveal" Phase)
         # Yeh star unn circles ke intersection points par banega
-        star_points = []
-        inner_radius = R * 0.4 # Adjust to fit inside intersections
-        
-        # Star ke 5 points nikaalne ka math
-        for i in range(5):
-            angle = i * (2 * PI / 5) + PI/2
-            star_points.append([inner_radius * np.cos(angle), inner_radius * np.sin(angle), 0])
+        # Star ke 5 points = sabse andar wali 5 intersections ki ring (90 degree se shuru)
+        intersections = circle_intersections(circles.centers, circles.radii)
+        star_points = ring_polygon(intersections, self.FOLDS, start_angle=PI/2)
         
         # Star polygon banana (Pentagram)
         # Order: 0 -> 2 -> 4 -> 1 -> 3 -> 0 (Star drawing pattern)
-        star_order = [0, 2, 4, 1, 3]
-        ordered_points = [star_points[i] for i in star_order]
+        # gcd(FOLDS, STAR_DENSITY) > 1 ho (jaise FOLDS = 6) toh compound star:
+        # kai polygons, ek Polygram mein
+        cycles = star_cycles(self.FOLDS, self.STAR_DENSITY)
+        if len(cycles) > 1:
+            logger.info(
+                "FOLDS=%(folds)d, STAR_DENSITY=%(density)d: compound star of %(count)d polygons",
+                {"folds": self.FOLDS, "density": self.STAR_DENSITY, "count": len(cycles)},
+            )
+        ordered_points = [[star_points[i] for i in cycle] for cycle in cycles]
         
-        hidden_star = Polygon(*ordered_points, color=STAR_COLOR, stroke_width=4).set_fill(STAR_COLOR, opacity=0.3)
+        hidden_star = Polygram(*ordered_points, color=self.STAR_COLOR, stroke_width=4).set_fill(self.STAR_COLOR, opacity=0.3)
         
         # Ek glowing effect star ke liye
-        star_glow = hidden_star.copy().set_stroke(width=10, opacity=0.3, color=GLOW_COLOR)
+        star_glow = hidden_star.copy().set_stroke(width=10, opacity=0.3, color=self.GLOW_COLOR)
 
         # ==========================================
         # ANIMATION SCRIPT (Sync with Voiceover)
@@ -59,7 +91,7 @@ class HiddenFiveReveal(Scene):
         # Dialogue: "...ek specific pattern mein draw karte hain..."
         # Action: Circles ek-ek karke draw honge (Lag_ratio se flow aayega)
         self.play(
-            Create(circles, lag_ratio=0.5), # Dheere dheere banenge
+            CreateRosette(circles, lag_ratio=0.5), # Dheere dheere banenge
             run_time=4,
             rate_func=smooth
         )
@@ -0,0 +1,56 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import numpy as np
+
+# Lottie JSON ke chhote pure-numpy tukde (vector_export.py inhe use karta hai).
+# Manim ke bina test ho sakte hain.
+DECIMALS = 2
+EMPTY_PATH = {"i": [], "o": [], "v": [], "c": False}
+
+
+def rounded(array, decimals=DECIMALS):
+    return np.round(array, decimals).tolist()
+
+
+def lottie_path(points, closed):
+    # Manim subpath (4 points per cubic) -> Lottie vertices + relative tangents
+    anchors = points[0::4]
+    vertices = np.vstack([anchors, points[-1:]])
+    out_tangents = np.zeros_like(vertices)
+    in_tangents = np.zeros_like(vertices)
+    out_tangents[:-1] = points[1::4] - anchors
+    in_tangents[1:] = points[2::4] - vertices[1:]
+    if closed:
+        in_tangents[0] = in_tangents[-1]
+        vertices, in_tangents, out_tangents = vertices[:-1], in_tangents[:-1], out_tangents[:-1]
+    return {"i": rounded(in_tangents), "o": rounded(out_tangents), "v": rounded(vertices), "c": closed}
+
+
+def animated(keys, wrap=True):
+    # keys = [(frame, value)], pehle se delta (lagataar same value nahi)
+    if len(keys) == 1:
+        return {"a": 0, "k": keys[0][1]}
+    return {"a": 1, "k": [{"t": frame, "s": [value] if wrap else value, "h": 1} for frame, value in keys]}
+
+
+def dedupe(keys):
+    result = []
+    for frame, value in keys:
+        if not result or result[-1][1] != value:
+            result.append((frame, value))
+    return result
+
+
+def static_transform(two_d=False):
+    dims = [0, 0] if two_d else [0, 0, 0]
+    return {
+        "o": {"a": 0, "k": 100},
+        "r": {"a": 0, "k": 0},
+        "p": {"a": 0, "k": dims},
+        "a": {"a": 0, "k": dims},
+        "s": {"a": 0, "k": [100] * len(dims)},
+    }
@@ -0,0 +1,103 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+from manim import *
+import numpy as np
+
+
+class MultiStrokeMixin:
+    # Jo mobjects get_stroke_passes() dete hain (GlowStroke, CircleRosette),
+    # unke liye ek hi point buffer se kai strokes draw hote hain.
+    # Har pass = (subpaths, rgba, width); same subpaths dobara set nahi hote.
+    # rgba ek row ho sakti hai ya sheen jaisi kai rows (gradient).
+    # Jo get_mesh_faces(camera) dete hain (ShrineInstances), unke faces
+    # seedhe ek loop mein fill + stroke hote hain.
+    # Baaki saare mobjects normal Camera ki tarah.
+    def display_vectorized(self, vmobject, ctx):
+        if hasattr(vmobject, "get_mesh_faces"):
+            return self.display_mesh(vmobject, ctx)
+        if not hasattr(vmobject, "get_stroke_passes"):
+            return super().display_vectorized(vmobject, ctx)
+
+        current_subpaths = None
+        fill_rgbas = self.get_pass_fill(vmobject)
+        for subpaths, rgba, width in vmobject.get_stroke_passes():
+            rgbas = np.atleast_2d(rgba)
+            draw_stroke = width > 0 and rgbas[:, 3].max() > 0
+            if len(subpaths) == 0 or not (draw_stroke or fill_rgbas is not None):
+                continue
+            if subpaths is not current_subpaths:
+                self.set_cairo_context_subpaths(ctx, vmobject, subpaths)
+                current_subpaths = subpaths
+            if fill_rgbas is not None:
+                # Har pass pehle apna fill, phir stroke - alag copies jaisa
+                self.set_cairo_context_color(ctx, fill_rgbas, vmobject)
+                ctx.fill_preserve()
+            if not draw_stroke:
+                continue
+            self.set_cairo_context_color(ctx, rgbas, vmobject)
+            ctx.set_line_width(width * self.cairo_line_width_multiple)
+            ctx.stroke_preserve()
+        return self
+
+    def get_pass_fill(self, vmobject):
+        # fill_each_pass wale mobjects (GlowPath): fill dikhta ho toh har
+        # pass ke saath (set_opacity se glow layers translucent disks banti thi)
+        if not getattr(vmobject, "fill_each_pass", False):
+            return None
+        fill_rgbas = vmobject.get_fill_rgbas()
+        if len(fill_rgbas) == 0 or fill_rgbas[:, 3].max() == 0:
+            return None
+        return fill_rgbas
+
+    def display_mesh(self, vmobject, ctx):
+        # Faces pehle se culled aur peeche se aage ke order mein; projection ek hi call mein
+        faces, fill_rgbas, stroke_rgba, stroke_width = vmobject.get_mesh_faces(self)
+        if len(faces) == 0:
+            return self
+        flat = self.transform_points_pre_display(vmobject, faces.reshape(-1, 3))
+        faces = flat.reshape(faces.shape)
+
+        draw_stroke = stroke_width > 0 and stroke_rgba[3] > 0
+        ctx.set_line_width(stroke_width * self.cairo_line_width_multiple)
+        for corners, rgba in zip(faces, fill_rgbas):
+            ctx.new_path()
+            ctx.move_to(*corners[0][:2])
+            for corner in corners[1:]:
+                ctx.line_to(*corner[:2])
+            ctx.close_path()
+            self.set_cairo_context_color(ctx, rgba[np.newaxis], vmobject)
+            ctx.fill_preserve()
+            if draw_stroke:
+                self.set_cairo_context_color(ctx, stroke_rgba[np.newaxis], vmobject)
+                ctx.stroke_preserve()
+        return self
+
+    def set_cairo_context_subpaths(self, ctx, vmobject, subpaths):
+        # Ek jaise lambe subpaths (N, k, 3) ho toh projection ek hi call mein
+        if isinstance(subpaths, np.ndarray):
+            flat = self.transform_points_pre_display(vmobject, subpaths.reshape(-1, 3))
+            subpaths = flat.reshape(subpaths.shape)
+        else:
+            subpaths = [self.transform_points_pre_display(vmobject, s) for s in subpaths]
+
+        ctx.new_path()
+        for points in subpaths:
+            ctx.new_sub_path()
+            ctx.move_to(*points[0][:2])
+            for p1, p2, p3 in zip(points[1::4], points[2::4], points[3::4]):
+                ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
+            if vmobject.consider_points_equals_2d(points[0], points[-1]):
+                ctx.close_path()
+        return self
+
+
+class MultiStrokeCamera(MultiStrokeMixin, Camera):
+    pass
+
+
+class MultiStrokeThreeDCamera(MultiStrokeMixin, ThreeDCamera):
+    pass
@@ -0,0 +1,165 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from manim import *
+from manim.utils.file_ops import write_to_movie
+
+from held_frames import encoder_command
+from target_geometry import TARGET_PRESETS, crop_frame, parse_target
+
+# NATURE_TARGETS=720p,vertical manim -qh sacred_cinematic.py SacredGeometryCinematic
+# python multi_target.py sacred_cinematic.py SacredGeometryCinematic -q h --targets 720p vertical
+#
+# Scene ek hi baar chalta hai (construct, updaters, bezier geometry) aur har
+# frame par main movie ke saath har target ka apna camera usi state ko
+# rasterize karta hai - apna resolution, apna crop - aur apne ffmpeg pipe mein
+# bhejta hai. Output: <Scene>_<target>.mp4 main movie ke bagal mein.
+TARGETS_ENV = "NATURE_TARGETS"
+
+
+class RenderTarget:
+    def __init__(self, spec, camera, movie_file_path):
+        self.name, self.pixel_width, self.pixel_height, self.offset = parse_target(spec)
+        frame_width, frame_height = crop_frame(
+            self.pixel_width, self.pixel_height, config.frame_width, config.frame_height
+        )
+        # Scene ka camera class hi (3D, multi-stroke sab)
+        self.camera = type(camera)(
+            pixel_width=self.pixel_width,
+            pixel_height=self.pixel_height,
+            frame_width=frame_width,
+            frame_height=frame_height,
+            frame_rate=camera.frame_rate,
+        )
+        self.static_image = None
+        path = Path(movie_file_path)
+        self.file_path = path.with_name(f"{path.stem}_{self.name}{path.suffix}")
+        self.writing_process = None
+
+    def sync(self, camera):
+        # Scene sirf main camera ko badalta hai: background, 3D orientation, frame center
+        target = self.camera
+        if target.background_color is not camera.background_color:
+            target.background_color = camera.background_color
+        if isinstance(camera, ThreeDCamera):
+            target.set_phi(camera.get_phi())
+            target.set_theta(camera.get_theta())
+            target.set_gamma(camera.get_gamma())
+            target.set_focal_distance(camera.get_focal_distance())
+            target.set_zoom(camera.get_zoom())
+            target.light_source = camera.light_source
+            target.fixed_in_frame_mobjects = camera.fixed_in_frame_mobjects
+            target.fixed_orientation_mobjects = camera.fixed_orientation_mobjects
+        target.frame_center = camera.frame_center + self.offset
+
+    def capture(self, camera, mobjects, background=None):
+        self.sync(camera)
+        if background is not None:
+            self.camera.set_frame_to_background(background)
+        else:
+            self.camera.reset()
+        self.camera.capture_mobjects(mobjects)
+
+    def write(self, num_frames=1):
+        if self.writing_process is None:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            command = encoder_command(self.pixel_width, self.pixel_height, self.file_path)
+            self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        frame = self.camera.pixel_array.tobytes()
+        for _ in range(num_frames):
+            self.writing_process.stdin.write(frame)
+
+    def close(self):
+        if self.writing_process is None:
+            return
+        self.writing_process.stdin.close()
+        self.writing_process.wait()
+        self.writing_process = None
+        logger.info("Target %(name)s ready at %(path)s", {"name": self.name, "path": self.file_path})
+
+
+class MultiTargetMixin:
+    # Renderer ke liye. extra_targets (ya NATURE_TARGETS) khaali ho toh kuch nahi.
+    extra_targets = ()
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self.target_scene = scene
+        specs = self.extra_targets or [
+            spec for spec in os.environ.get(TARGETS_ENV, "").split(",") if spec.strip()
+        ]
+        self.targets = []
+        if not specs or not write_to_movie():
+            return
+        # Render cache hit wale plays rasterize hi nahi hote - targets ke
+        # frames chhoot jaate, isliye is mode mein caching band
+        config.disable_caching = True
+        logger.warning("Extra output targets: render cache is off for this render")
+        self.targets = [
+            RenderTarget(spec, self.camera, self.file_writer.movie_file_path) for spec in specs
+        ]
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        static_image = super().save_static_frame_data(scene, static_mobjects)
+        for target in getattr(self, "targets", []):
+            target.static_image = None
+            if static_mobjects and not self.skip_animations:
+                target.capture(self.camera, static_mobjects)
+                target.static_image = np.array(target.camera.pixel_array)
+        return static_image
+
+    def add_frame(self, frame, num_frames=1):
+        # Har frame (freeze_current_frame ka bhi) yahin se nikalta hai
+        if not self.skip_animations:
+            scene = self.target_scene
+            for target in self.targets:
+                if target.static_image is not None:
+                    target.capture(self.camera, scene.moving_mobjects, target.static_image)
+                else:
+                    target.capture(self.camera, list_update(scene.mobjects, scene.foreground_mobjects))
+                target.write(num_frames)
+        super().add_frame(frame, num_frames)
+
+    def scene_finished(self, scene):
+        super().scene_finished(scene)
+        for target in getattr(self, "targets", []):
+            target.close()
+
+
+def main():
+    from nature_renderer import enable_feature
+    from parallel_render import QUALITY_FLAGS, apply_config, load_scene_class
+
+    parser = argparse.ArgumentParser(description="Render a scene once into several resolutions and crops.")
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("--targets", nargs="+", required=True, help=f"{', '.join(TARGET_PRESETS)} or WxH[@x,y]")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), default=None)
+    parser.add_argument("--media-dir", default=None)
+    args = parser.parse_args()
+
+    for spec in args.targets:
+        parse_target(spec)
+    overrides = {}
+    if args.quality:
+        overrides["quality"] = QUALITY_FLAGS[args.quality]
+    if args.media_dir:
+        overrides["media_dir"] = args.media_dir
+    apply_config(args.scene_file, overrides)
+    MultiTargetMixin.extra_targets = tuple(args.targets)
+    enable_feature("multi_target")
+    load_scene_class(args.scene_file, args.scene_name)().render()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import importlib
+import os
+from functools import lru_cache
+
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from backdrop import BackdropCacheMixin
+from held_frames import HoldFrameFileWriter, HoldFrameMixin
+from profiling import install_from_env
+from render_cache import RenderCacheMixin
+
+# Opt-in subsystems: (naam, env variable, module, renderer mixin, file writer).
+# Default renderer mein sirf hamesha-on hisse hain; inmein se koi tabhi import
+# hota hai aur MRO mein aata hai jab uska env variable set ho (khaali ya "0"
+# nahi) ya uska CLI enable_feature() bulaye. Env variable wahi jo module ka
+# *_ENV hai. Order = MRO order (upar wala pehle).
+OPT_IN_FEATURES = (
+    ("vector_export", None, "vector_export", "VectorExportMixin", None),
+    ("checkpoints", "NATURE_CHECKPOINTS", "checkpoints", "CheckpointMixin", None),
+    ("draft", "NATURE_DRAFT", "draft", "DraftBudgetMixin", None),
+    ("multi_target", "NATURE_TARGETS", "multi_target", "MultiTargetMixin", None),
+    ("frame_ring", "NATURE_FRAME_RING", "frame_pipe", "FramePipeMixin", "FramePipeFileWriter"),
+)
+
+_enabled = set()
+
+
+def enable_feature(name):
+    # CLI entry points (vector_export.py, checkpoints.py, multi_target.py) ke liye
+    if name not in {feature[0] for feature in OPT_IN_FEATURES}:
+        raise ValueError(f"Unknown renderer feature {name!r}")
+    _enabled.add(name)
+
+
+def enabled_features():
+    return tuple(
+        name for name, env, *_ in OPT_IN_FEATURES
+        if name in _enabled or (env and os.environ.get(env, "") not in ("", "0"))
+    )
+
+
+class NatureFileWriter(RenderCacheMixin, HoldFrameFileWriter):
+    # Partial movies shared LRU cache mein (render_cache.py), frozen waits
+    # ek hi frame (held_frames.py)
+    pass
+
+
+class NatureRenderer(HoldFrameMixin, BackdropCacheMixin, CairoRenderer):
+    # Saare scenes ka Cairo renderer:
+    # - static backdrop plays ke beech cache (backdrop.py)
+    # - frozen waits ek hi frame + ffmpeg hold (held_frames.py)
+    # - unchanged plays edits ke baad bhi cache se (render_cache.py)
+    # NatureRenderer(...) enabled opt-in features (OPT_IN_FEATURES) ke mixins
+    # ke saath bani subclass deta hai; koi feature on nahi toh yahi class.
+    default_file_writer_class = NatureFileWriter
+
+    def __new__(cls, *args, **kwargs):
+        if cls is NatureRenderer:
+            cls = composed_renderer(enabled_features())
+        return super().__new__(cls)
+
+    def __init__(self, camera_class=None, **kwargs):
+        # Opt-in: NATURE_PROFILE set ho tabhi timing hooks lagte hain (dekho
+        # profiling.py). Import par nahi - sirf jab renderer sach mein bane.
+        install_from_env()
+        kwargs.setdefault("file_writer_class", self.default_file_writer_class)
+        super().__init__(camera_class=camera_class, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def composed_renderer(features):
+    if not features:
+        return NatureRenderer
+    mixins, writers = [], []
+    for name, _, module_name, mixin, writer in OPT_IN_FEATURES:
+        if name not in features:
+            continue
+        module = importlib.import_module(module_name)
+        mixins.append(getattr(module, mixin))
+        if writer:
+            writers.append(getattr(module, writer))
+    logger.info("NatureRenderer features: %(features)s", {"features": ", ".join(features)})
+    file_writer = type("NatureFileWriter", (*writers, NatureFileWriter), {}) if writers else NatureFileWriter
+    return type("NatureRenderer", (*mixins, NatureRenderer), {"default_file_writer_class": file_writer})
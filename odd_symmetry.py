@@ -7,59 +7,91 @@ YouTube: https://www.youtube.com/@MathRize
 from manim import *
 import numpy as np
 
+from draft import apply_sheen
+from nature_renderer import NatureRenderer
+from polar_geometry import rose_sample_count
+from rose_curve import RoseCurve
+from tex_cache import cached_math_tex
+
+def polar_plane():
+    # Faint Polar Grid (Scientific Look). Coordinates ke degree / radius
+    # labels bhi MathTex hain - tex_cache.warm_up isi function se inhe
+    # pehle hi compile karta hai.
+    return PolarPlane(
+        radius_max=3.5,
+        size=7,
+        azimuth_units="degrees",
+        azimuth_label_font_size=24,
+        radius_step=1,
+        stroke_opacity=0.2, # Very subtle
+        background_line_style={"stroke_color": TEAL}
+    ).add_coordinates()
+
+
 class OddNumberSymmetry(Scene):
+    # Sweep parameters (dekho sweep.py). N_VALUES[0] se shuru, phir har value
+    # par ek morph; COLORS[i] = N_VALUES[i] par graph ka rang
+    N_VALUES = (1, 3, 5, 7)
+    COLORS = (YELLOW, YELLOW, GOLD, PINK)
+    LABEL_COLOR = ORANGE
+    BACKGROUND = "#101010"
+
+    def __init__(self, renderer=None, **kwargs):
+        super().__init__(renderer=renderer or NatureRenderer(), **kwargs)
+
+    @classmethod
+    def check_parameters(cls):
+        # Sweep overrides: har N value ka ek rang, warna zip chupchaap morphs chhod deta
+        if len(cls.N_VALUES) < 1:
+            raise ValueError(f"{cls.__name__}: N_VALUES must have at least one value")
+        if len(cls.COLORS) != len(cls.N_VALUES):
+            raise ValueError(
+                f"{cls.__name__}: COLORS has {len(cls.COLORS)} entries but N_VALUES has "
+                f"{len(cls.N_VALUES)}; give one colour per N value"
+            )
+
     def construct(self):
+        self.check_parameters()
+
         # 1. SETUP: Cinematic Dark Theme
-        self.camera.background_color = "#101010" # Dark Grey/Black
+        self.camera.background_color = self.BACKGROUND # Dark Grey/Black
 
         # 2. THE STAGE: Faint Polar Grid (Scientific Look)
-        plane = PolarPlane(
-            radius_max=3.5,
-            size=7,
-            azimuth_units="degrees",
-            azimuth_label_font_size=24,
-            radius_step=1,
-            stroke_opacity=0.2, # Very subtle
-            background_line_style={"stroke_color": TEAL}
-        ).add_coordinates()
+        plane = polar_plane()
         
         # 3. THE VARIABLE (ValueTracker)
         # Yeh 'n' ki value hold karega jo change hoti rahegi
-        n_tracker = ValueTracker(1) 
+        n_tracker = ValueTracker(self.N_VALUES[0])
 
         # 4. THE GLOWING GRAPH (The Hero)
-        # always_redraw ka matlab hai jab 'n' change hoga, graph update hoga
-        def get_curve():
-            n = n_tracker.get_value()
-            return ParametricFunction(
-                lambda t: plane.polar_to_point(2.5 * np.cos(n * t), t),
-                t_range = [0, 2*PI], # 0 to 2PI for full rotation
-                color = YELLOW,
-                stroke_width = 6
-            ).set_stroke(opacity=1).set_sheen(0.5, direction=UR)
+        # RoseCurve apne points har frame in-place update karta hai jab 'n' change hoga
+        # Sheen draft mode mein skip (dekho draft.py)
+        graph = apply_sheen(RoseCurve(
+            n_tracker,
+            amplitude=2.5,
+            plane=plane,
+            n_samples=rose_sample_count(max(self.N_VALUES)), # Sabse bada 'n' (default 7)
+            color=self.COLORS[0],
+            stroke_width=6
+        ).set_stroke(opacity=1), 0.5, direction=UR)
 
         # Glow Effect: Ek moti (thick) transparent line peeche
-        def get_glow():
-            n = n_tracker.get_value()
-            return ParametricFunction(
-                lambda t: plane.polar_to_point(2.5 * np.cos(n * t), t),
-                t_range = [0, 2*PI],
-                color = YELLOW,
-                stroke_width = 15, # Motai zyada
-                stroke_opacity = 0.3 # Transparency kam
-            )
-
-        graph = always_redraw(get_curve)
-        glow = always_redraw(get_glow)
+        # Same evaluation share karti hai, dobara sampling nahi
+        glow = graph.add_layer(
+            color=self.COLORS[0],
+            stroke_width=15, # Motai zyada
+            stroke_opacity=0.3 # Transparency kam
+        )
 
         # 5. THE DYNAMIC EQUATION
         # Isme hum 'n' ko alag color denge
-        equation_text = MathTex(r"r = \cos(", "n", r"\theta)").scale(1.5).to_corner(UL)
-        equation_text[1].set_color(ORANGE) # 'n' ko highlight kiya
+        equation_text = cached_math_tex(r"r = \cos(", "n", r"\theta)").scale(1.5).to_corner(UL)
+        equation_text[1].set_color(self.LABEL_COLOR) # 'n' ko highlight kiya
         
         # Number indicator jo change hoga
+        # (har frame naya MathTex nahi - same string ka cached copy)
         number_label = always_redraw(lambda: 
-            MathTex(f"n = {n_tracker.get_value():.0f}", color=ORANGE)
+            cached_math_tex(f"n = {n_tracker.get_value():.0f}", color=self.LABEL_COLOR)
             .scale(1.5)
             .next_to(equation_text, DOWN)
         )
@@ -75,37 +107,23 @@ class OddNumberSymmetry(Scene):
         self.play(Create(glow), Create(graph), run_time=1.5)
         self.wait(0.5)
 
-        # MORPH: 1 -> 3 (Triangle/3 Petals)
-        # Script: "Jab hum equation mein odd numbers — jaise 3..."
-        self.play(
-            n_tracker.animate.set_value(3),
-            run_time=2,
-            rate_func=smooth
-        )
-        self.wait(1)
-
-        # MORPH: 3 -> 5 (Champa/5 Petals)
-        # Script: "...5..."
-        self.play(
-            n_tracker.animate.set_value(5), # 5 Petals
-            graph.animate.set_color(GOLD),  # Color change for impact
-            glow.animate.set_color(GOLD),
-            run_time=2,
-            rate_func=smooth
-        )
-        # Yahan Champa ka reference aayega script mein
-        self.wait(1)
-
-        # MORPH: 5 -> 7 (7 Petals)
-        # Script: "...7 use karte hain..."
-        self.play(
-            n_tracker.animate.set_value(7),
-            graph.animate.set_color(PINK), # Another color change
-            glow.animate.set_color(PINK),
-            run_time=2,
-            rate_func=smooth
-        )
-        self.wait(2)
+        # MORPHS: 1 -> 3 -> 5 -> 7
+        # Script: "Jab hum equation mein odd numbers — jaise 3, 5 (Champa),
+        # 7 use karte hain..."
+        morphs = list(zip(self.N_VALUES[1:], self.COLORS[:-1], self.COLORS[1:]))
+        for i, (n, old_color, color) in enumerate(morphs):
+            # Rang badle toh updater chalta rahe taaki color ke saath morph bhi dikhe
+            recolor = [] if ManimColor(color) == ManimColor(old_color) else [
+                graph.animate(suspend_mobject_updating=False).set_color(color),
+                glow.animate.set_color(color),
+            ]
+            self.play(
+                n_tracker.animate.set_value(n),
+                *recolor,
+                run_time=2,
+                rate_func=smooth
+            )
+            self.wait(2 if i == len(morphs) - 1 else 1)
         
         # Final Polish: Rotate the whole thing slowly (Cinematic finish)
         self.play(
@@ -0,0 +1,221 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import argparse
+import importlib.util
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from importlib.machinery import SourceFileLoader
+from pathlib import Path
+
+from manim import *
+from manim import __version__
+from manim.utils.exceptions import EndSceneEarlyException
+
+from held_frames import HoldFrameFileWriter
+from render_cache import evict_render_cache, render_cache_bytes, render_cache_dir
+
+# Har scene self.play / self.wait ki ek seedhi chain hai, aur har play apni
+# partial movie file banata hai. Yahan har worker poora construct() chalata
+# hai, par sirf apne segment (from..upto) ke plays render karta hai - usse
+# pehle ke plays skip hote hain (koi rasterize nahi, sirf state aage badhti
+# hai). Har worker apne partial files ke path order mein lautata hai (render
+# cache mein pehle se maujood segments dobara render nahi hote), aur aakhir
+# mein unhe order se jodna serial render jaisa hi stream deta hai (ffmpeg -c copy).
+COUNT_ONLY = sys.maxsize
+
+QUALITY_FLAGS = {q["flag"]: name for name, q in QUALITIES.items() if q["flag"]}
+
+
+def load_scene_class(scene_file, scene_name):
+    # "Nature Decode" jaisi bina extension wali file bhi chalti hai
+    scene_file = Path(scene_file).resolve()
+    sys.path.insert(0, str(scene_file.parent))
+    module_name = scene_file.stem.replace(" ", "_")
+    loader = SourceFileLoader(module_name, str(scene_file))
+    spec = importlib.util.spec_from_loader(module_name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return getattr(module, scene_name)
+
+
+def apply_config(scene_file, overrides):
+    config.input_file = str(Path(scene_file).resolve())
+    for key, value in overrides.items():
+        setattr(config, key, value)
+
+
+def count_plays(scene_file, scene_name, overrides):
+    # Dry run, saare plays skip: sirf ginti chahiye. config.dry_run = True
+    # write_to_movie / format hamesha ke liye band kar deta hai, isliye yeh
+    # apne alag one-shot process mein chalta hai (render workers mein nahi)
+    apply_config(scene_file, overrides)
+    config.dry_run = True
+    config.from_animation_number = COUNT_ONLY
+    scene = load_scene_class(scene_file, scene_name)()
+    scene.render()
+    return scene.renderer.num_plays
+
+
+def segment_ranges(n_plays, segment_size):
+    # [(first, last)] dono inclusive
+    return [
+        (first, min(first + segment_size, n_plays) - 1)
+        for first in range(0, n_plays, segment_size)
+    ]
+
+
+def stop_after_play(renderer, last):
+    # manim ka upto_animation_number 0 ko "koi limit nahi" maanta hai
+    # (config["upto_animation_number"] and ...), toh segment (0, 0) poora
+    # scene render kar deta. Isliye apni check: play 'last' ke baad scene khatam.
+    play = renderer.play
+
+    def limited_play(scene, *args, **kwargs):
+        if renderer.num_plays > last:
+            raise EndSceneEarlyException()
+        return play(scene, *args, **kwargs)
+
+    renderer.play = limited_play
+
+
+def render_segment(scene_file, scene_name, first, last, overrides):
+    apply_config(scene_file, overrides)
+    config.from_animation_number = first
+    HoldFrameFileWriter.segment_only = True
+
+    start = time.perf_counter()
+    scene = load_scene_class(scene_file, scene_name)()
+    stop_after_play(scene.renderer, last)
+    scene.render()
+    file_writer = scene.renderer.file_writer
+    partial_files = [path for path in file_writer.partial_movie_files if path is not None]
+    cache_stats = (file_writer.cache_hits, file_writer.cache_misses)
+    return partial_files, str(file_writer.movie_file_path), time.perf_counter() - start, cache_stats
+
+
+def combine_segments(partial_files, movie_file_path):
+    # SceneFileWriter.combine_files wala hi ffmpeg command
+    movie_file_path = Path(movie_file_path)
+    file_list = Path(partial_files[0]).parent / "partial_movie_file_list.txt"
+    with file_list.open("w", encoding="utf-8") as fp:
+        fp.write("# This file is used internally by FFMPEG.\n")
+        for path in partial_files:
+            fp.write(f"file 'file:{Path(path).as_posix()}'\n")
+    command = [
+        config.ffmpeg_executable,
+        "-y",
+        "-f", "concat",
+        "-safe", "0",
+        "-i", str(file_list),
+        "-loglevel", config.ffmpeg_loglevel.lower(),
+        "-metadata", f"comment=Rendered with Manim Community v{__version__}",
+        "-nostdin",
+        "-c", "copy",
+        "-an",
+        str(movie_file_path),
+    ]
+    subprocess.run(command, check=True)
+    return movie_file_path
+
+
+def render_serial(scene_file, scene_name, overrides):
+    # Speedup ki tulna ke liye asli serial render (alag file naam)
+    apply_config(scene_file, overrides)
+    config.output_file = f"{scene_name}_serial"
+    start = time.perf_counter()
+    load_scene_class(scene_file, scene_name)().render()
+    return time.perf_counter() - start
+
+
+def run_once(context, function, *args):
+    # Naye process mein ek hi call, phir process khatam (config wahin rehta hai)
+    with ProcessPoolExecutor(1, mp_context=context) as pool:
+        return pool.submit(function, *args).result()
+
+
+def render_parallel(scene_file, scene_name, workers=None, segment_size=1, compare_serial=False, **overrides):
+    workers = workers or os.cpu_count()
+    if compare_serial:
+        # Dono render poore hon - cache hits se tulna bekaar ho jaati
+        overrides["disable_caching"] = True
+    apply_config(scene_file, overrides)
+    # spawn: har worker ka apna saaf manim config
+    context = multiprocessing.get_context("spawn")
+    n_plays = run_once(context, count_plays, scene_file, scene_name, overrides)
+    segments = segment_ranges(n_plays, segment_size)
+    with ProcessPoolExecutor(workers, mp_context=context) as pool:
+        start = time.perf_counter()
+        results = list(pool.map(
+            render_segment,
+            *zip(*[(scene_file, scene_name, first, last, overrides) for first, last in segments]),
+        ))
+        wall = time.perf_counter() - start
+
+    partial_files = [path for files, _, _, _ in results for path in files]
+    movie_file_path = combine_segments(partial_files, results[0][1])
+    if not config.disable_caching:
+        evict_render_cache(render_cache_dir(), render_cache_bytes(), keep=partial_files)
+
+    hits = sum(stats[0] for _, _, _, stats in results)
+    misses = sum(stats[1] for _, _, _, stats in results)
+    logger.info(
+        "Render cache for %(scene)s: %(hits)d hits, %(misses)d misses",
+        {"scene": scene_name, "hits": hits, "misses": misses},
+    )
+
+    # Segment time = workers ka kul busy time (fast-forward bhi shaamil) -
+    # yeh serial render ka naap nahi, sirf parallelism ka
+    busy = sum(elapsed for _, _, elapsed, _ in results)
+    logger.info(
+        "%(scene)s: %(plays)d plays in %(segments)d segments on %(workers)d workers "
+        "(%(cores)d cores): %(wall).1fs wall, %(busy).1fs total segment time (busy/wall %(ratio).2f)",
+        {
+            "scene": scene_name, "plays": n_plays, "segments": len(segments),
+            "workers": workers, "cores": os.cpu_count(), "wall": wall,
+            "busy": busy, "ratio": busy / wall if wall else 0.0,
+        },
+    )
+    if compare_serial:
+        serial = run_once(context, render_serial, scene_file, scene_name, overrides)
+        logger.info(
+            "%(scene)s: serial render %(serial).1fs vs parallel %(wall).1fs, measured speedup %(speedup).2fx",
+            {"scene": scene_name, "serial": serial, "wall": wall, "speedup": serial / wall if wall else 0.0},
+        )
+    logger.info("File ready at %(path)s", {"path": movie_file_path})
+    return movie_file_path
+
+
+if __name__ == "__main__":
+    # python parallel_render.py pattern_of_five.py PatternOfFive -w 4 -q l
+    parser = argparse.ArgumentParser(description="Render a scene's plays in parallel worker processes.")
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--segment-size", type=int, default=1, help="plays per worker task")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), default=None)
+    parser.add_argument("--media-dir", default=None)
+    parser.add_argument("--disable-caching", action="store_true")
+    parser.add_argument("--compare-serial", action="store_true",
+                        help="also render serially (caching off for both) and log the measured speedup")
+    args = parser.parse_args()
+
+    overrides = {}
+    if args.quality:
+        overrides["quality"] = QUALITY_FLAGS[args.quality]
+    if args.media_dir:
+        overrides["media_dir"] = args.media_dir
+    if args.disable_caching:
+        overrides["disable_caching"] = True
+    render_parallel(
+        args.scene_file, args.scene_name,
+        workers=args.workers, segment_size=args.segment_size,
+        compare_serial=args.compare_serial, **overrides
+    )
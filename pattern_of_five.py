@@ -7,21 +7,39 @@ YouTube: https://www.youtube.com/@MathRize
 from manim import *
 import numpy as np
 
+from nature_renderer import NatureRenderer
+from rose_curve import get_rose_curve
+
 class PatternOfFive(ThreeDScene):
+    # Sweep parameters (dekho sweep.py). Har COLORS entry ek flower hai jo
+    # ring par jaata hai; pentagon unhi ke centers se banta hai
+    K = 5
+    FLOWER_COLOR = GOLD
+    # FIX 1: 'CREAM' ki jagah Hex code
+    COLORS = (RED_D, PINK, YELLOW_D, ORANGE, "#FFFDD0")
+    SPREAD_RADIUS = 4.0
+    BACKGROUND = "#050505"
+
+    def __init__(self, renderer=None, **kwargs):
+        # NatureRenderer: static backdrop cache + frozen waits (dekho nature_renderer.py)
+        super().__init__(
+            renderer=renderer or NatureRenderer(camera_class=ThreeDCamera),
+            camera_class=ThreeDCamera,
+            **kwargs
+        )
+
     def construct(self):
         # 1. SETUP: Cinematic Dark Mode & 3D Camera
-        self.camera.background_color = "#050505"
+        self.camera.background_color = self.BACKGROUND
         self.set_camera_orientation(phi=75*DEGREES, theta=-30*DEGREES)
 
         # 2. DEFINE THE MATHEMATICAL FLOWER
         def get_math_flower(color_theme):
-            return ParametricFunction(
-                lambda t: np.array([
-                    1.5 * np.cos(5*t) * np.cos(t), 
-                    1.5 * np.cos(5*t) * np.sin(t),
-                    0 
-                ]),
-                t_range=[0, 2*PI],
+            # Points shared geometry cache se copy hote hain, toh 6 flowers
+            # ke liye sampling sirf ek baar hoti hai
+            return get_rose_curve(
+                self.K,
+                amplitude=1.5,
                 fill_opacity=0.4, 
                 fill_color=color_theme, 
                 stroke_color=color_theme, 
@@ -29,20 +47,18 @@ class PatternOfFive(ThreeDScene):
             )
 
         # 3. INITIAL STATE
-        center_flower = get_math_flower(GOLD)
+        center_flower = get_math_flower(self.FLOWER_COLOR)
         self.play(GrowFromCenter(center_flower), run_time=1.5)
         self.wait(0.5)
 
         # 4. THE REPETITION
         flowers_group = VGroup()
         
-        # FIX 1: 'CREAM' ki jagah Hex code
-        colors = [RED_D, PINK, YELLOW_D, ORANGE, "#FFFDD0"] 
-        
-        radius_of_spread = 4.0 
+        colors = self.COLORS
+        radius_of_spread = self.SPREAD_RADIUS
 
-        for i in range(5):
-            angle = i * (2*PI / 5) + PI/2 
+        for i in range(len(colors)):
+            angle = i * (2*PI / len(colors)) + PI/2 
             
             target_pos = np.array([
                 radius_of_spread * np.cos(angle),
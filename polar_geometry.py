@@ -0,0 +1,82 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+from functools import lru_cache
+
+import numpy as np
+
+TAU = 2 * np.pi
+
+# Har cos(k*theta) period (ek petal ka aana-jaana) ke liye itne samples.
+# Catmull-Rom handles ke saath 64 samples par error ~1e-6 hai.
+SAMPLES_PER_PERIOD = 64
+MIN_SAMPLES = 128
+
+# Kitne alag (k, amplitude, t_range, density) curves memory mein rahenge
+ROSE_CACHE_SIZE = 64
+
+
+def rose_sample_count(k, t_range=(0, TAU)):
+    # Density k ke saath badhti hai: zyada petals = zyada samples,
+    # chhote k par bekaar ka oversampling nahi
+    span = abs(t_range[1] - t_range[0])
+    periods = max(abs(k), 1) * span / TAU
+    return max(MIN_SAMPLES, int(np.ceil(SAMPLES_PER_PERIOD * periods)))
+
+
+def theta_grid(t_range=(0, TAU), n_samples=None, k=1):
+    # Ek extra sample shuru se pehle aur do end ke baad, taaki dono
+    # ends par bhi Catmull-Rom ko padosi anchors mil jayein
+    if n_samples is None:
+        n_samples = rose_sample_count(k, t_range)
+    t_min, t_max = t_range
+    step = (t_max - t_min) / n_samples
+    return t_min + np.arange(-1, n_samples + 2) * step
+
+
+def catmull_rom_bezier_points(samples):
+    # Catmull-Rom -> cubic bezier: har segment ke handles padosi anchors se
+    # aate hain, isliye koi Python loop nahi chahiye
+    n_curves = len(samples) - 3
+    points = np.empty((4 * n_curves, samples.shape[1]))
+    points[0::4] = samples[1:-2]
+    points[1::4] = samples[1:-2] + (samples[2:-1] - samples[:-3]) / 6
+    points[2::4] = samples[2:-1] - (samples[3:] - samples[1:-2]) / 6
+    points[3::4] = samples[2:-1]
+    return points
+
+
+def rose_bezier_points_on_grid(k, amplitude, cos_theta, sin_theta, thetas):
+    # r = A*cos(k*theta) ko poore theta grid par ek saath evaluate karo.
+    # Cache ke bina wala version - jab k har frame badalta hai (ValueTracker)
+    r = amplitude * np.cos(k * thetas)
+    samples = np.column_stack([r * cos_theta, r * sin_theta, np.zeros_like(r)])
+    return catmull_rom_bezier_points(samples)
+
+
+@lru_cache(maxsize=ROSE_CACHE_SIZE)
+def _cached_rose_bezier_points(k, amplitude, t_range, n_samples):
+    thetas = theta_grid(t_range, n_samples)
+    points = rose_bezier_points_on_grid(
+        k, amplitude, np.cos(thetas), np.sin(thetas), thetas
+    )
+    points.setflags(write=False)
+    return points
+
+
+def rose_bezier_points(k, amplitude=1.0, t_range=(0, TAU), n_samples=None):
+    # Bezier control points of r = A*cos(k*theta), shape (4*n_curves, 3).
+    # Har call ko apni copy milti hai, cache wala array kabhi nahi badalta.
+    t_range = (float(t_range[0]), float(t_range[1]))
+    if n_samples is None:
+        n_samples = rose_sample_count(k, t_range)
+    return _cached_rose_bezier_points(
+        float(k), float(amplitude), t_range, int(n_samples)
+    ).copy()
+
+
+def rose_cache_info():
+    return _cached_rose_bezier_points.cache_info()
@@ -0,0 +1,192 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import functools
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.family import extract_mobject_family_members
+
+# NATURE_PROFILE=profiles/ manim -ql odd_symmetry.py OddNumberSymmetry
+# Har scene ke liye profiles/<Scene>.trace.json (chrome://tracing ya
+# ui.perfetto.dev mein kholo) aur profiles/<Scene>.summary.txt.
+# Hooks pehla NatureRenderer banne par lagte hain (module import par nahi);
+# env variable set nahi hai toh kuch bhi wrap nahi hota - zero overhead.
+PROFILE_ENV = "NATURE_PROFILE"
+
+
+def profiled_methods():
+    # (class, method, stage). Sirf wahi methods jo class khud define karti hai;
+    # ek stage ke andar wahi stage dobara aaye (super() chain) toh ek hi span.
+    from backdrop import BackdropCacheMixin
+    from frame_pipe import FramePipeFileWriter
+    from held_frames import HoldFrameFileWriter
+    from rose_curve import RoseCurve
+    from shrine import ShrineInstances
+
+    return [
+        (CairoRenderer, "play", "play"),
+        (CairoRenderer, "render", "frame"),
+        (Scene, "update_to_time", "animations"),
+        (Scene, "update_mobjects", "updaters"),
+        (ParametricFunction, "generate_points", "bezier"),
+        (RoseCurve, "update_curve", "bezier"),
+        (SingleStringMathTex, "__init__", "tex"),
+        (ThreeDCamera, "get_mobjects_to_display", "3d_sort"),
+        (ShrineInstances, "get_mesh_faces", "3d_sort"),
+        (Camera, "capture_mobjects", "rasterize"),
+        (ThreeDCamera, "capture_mobjects", "rasterize"),
+        (CairoRenderer, "save_static_frame_data", "static_frame"),
+        (BackdropCacheMixin, "save_static_frame_data", "static_frame"),
+        (SceneFileWriter, "open_movie_pipe", "ffmpeg"),
+        (HoldFrameFileWriter, "open_held_movie_pipe", "ffmpeg"),
+        (SceneFileWriter, "write_frame", "ffmpeg"),
+        (FramePipeFileWriter, "write_frame", "ffmpeg"),
+        (SceneFileWriter, "close_movie_pipe", "ffmpeg"),
+        (SceneFileWriter, "combine_to_movie", "ffmpeg"),
+        (CairoRenderer, "scene_finished", "finish"),
+    ]
+
+
+def play_info(renderer, scene, *args, **kwargs):
+    family = extract_mobject_family_members(scene.mobjects, only_those_with_points=True)
+    names = ", ".join(type(animation).__name__ for animation in scene.animations or [])
+    return {
+        "name": f"play {renderer.num_plays - 1}: {names}",
+        "mobjects": len(family),
+        "points": sum(len(mob.points) for mob in family),
+    }
+
+
+class Profiler:
+    def __init__(self, output_dir):
+        self.output_dir = Path(output_dir)
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self.events = []
+        self.active = set()
+        self.frames = 0
+
+    def wrap(self, method, stage, describe=None):
+        profiler = self
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            if stage in profiler.active:
+                return method(*args, **kwargs)
+            profiler.active.add(stage)
+            frames = profiler.frames
+            blocks = sys.getallocatedblocks()
+            start = time.perf_counter()
+            completed = False
+            try:
+                result = method(*args, **kwargs)
+                completed = True
+                return result
+            finally:
+                end = time.perf_counter()
+                profiler.active.discard(stage)
+                info = describe(*args, **kwargs) if describe and completed else {}
+                if stage == "frame":
+                    profiler.frames += 1
+                else:
+                    info["frames"] = profiler.frames - frames
+                info["alloc_blocks"] = sys.getallocatedblocks() - blocks
+                profiler.record(stage, start, end, info)
+
+        wrapper.__wrapped_by_profiler__ = method
+        return wrapper
+
+    def record(self, stage, start, end, info):
+        self.events.append({
+            "name": info.pop("name", stage),
+            "cat": stage,
+            "ph": "X",
+            "ts": (start - self.origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": self.pid,
+            "tid": 0,
+            "args": info,
+        })
+
+    def summary(self, scene_name):
+        stages = defaultdict(lambda: [0, 0.0, 0])
+        plays = [event for event in self.events if event["cat"] == "play"]
+        for event in self.events:
+            stage = stages[event["cat"]]
+            stage[0] += 1
+            stage[1] += event["dur"] / 1000
+            stage[2] += event["args"]["alloc_blocks"]
+        total = sum(event["dur"] for event in plays) / 1000
+
+        lines = [
+            f"Profile: {scene_name}  ({len(plays)} plays, {self.frames} frames, {total:.1f} ms in plays)",
+            "",
+            f"{'stage':<14}{'calls':>8}{'total ms':>12}{'mean ms':>10}{'% plays':>9}{'net blocks':>12}",
+        ]
+        for name, (calls, ms, blocks) in sorted(stages.items(), key=lambda item: -item[1][1]):
+            share = 100 * ms / total if total else 0.0
+            lines.append(f"{name:<14}{calls:>8}{ms:>12.1f}{ms / calls:>10.3f}{share:>9.1f}{blocks:>12}")
+        lines += ["", "(stages nest: frame includes rasterize and ffmpeg, animations includes updaters)", ""]
+        lines.append(f"{'play':<40}{'ms':>10}{'frames':>8}{'mobjects':>10}{'points':>10}")
+        for event in plays:
+            args = event["args"]
+            lines.append(
+                f"{event['name'][:39]:<40}{event['dur'] / 1000:>10.1f}{args['frames']:>8}"
+                f"{args.get('mobjects', 0):>10}{args.get('points', 0):>10}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def export(self, scene_name):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # parallel_render.py ke workers: har process ki alag file
+        stem = scene_name if multiprocessing.parent_process() is None else f"{scene_name}.{self.pid}"
+        trace_path = self.output_dir / f"{stem}.trace.json"
+        summary_path = self.output_dir / f"{stem}.summary.txt"
+        with trace_path.open("w", encoding="utf-8") as fp:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, fp)
+        summary_path.write_text(self.summary(scene_name), encoding="utf-8")
+        logger.info("Profile written to %(trace)s and %(summary)s", {"trace": trace_path, "summary": summary_path})
+        # benchmark.py yahin se pichle scene ke events padhta hai
+        self.last_events = self.events
+        self.events = []
+        self.frames = 0
+        self.origin = time.perf_counter()
+
+
+def install(output_dir):
+    profiler = Profiler(output_dir)
+    for cls, name, stage in profiled_methods():
+        if name not in cls.__dict__:
+            continue
+        describe = play_info if stage == "play" else None
+        setattr(cls, name, profiler.wrap(cls.__dict__[name], stage, describe))
+
+    # Scene khatam: pehle finish (combine) record ho, phir export
+    finished = CairoRenderer.scene_finished
+
+    @functools.wraps(finished)
+    def scene_finished(renderer, scene):
+        finished(renderer, scene)
+        profiler.export(type(scene).__name__)
+
+    CairoRenderer.scene_finished = scene_finished
+    return profiler
+
+
+def install_from_env():
+    output_dir = os.environ.get(PROFILE_ENV)
+    if output_dir and not getattr(install_from_env, "profiler", None):
+        install_from_env.profiler = install(output_dir)
+    return getattr(install_from_env, "profiler", None)
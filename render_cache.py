@@ -0,0 +1,114 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import hashlib
+import os
+from pathlib import Path
+
+from manim import *
+
+from segment_cache import evict_render_cache, incoming_path, segment_name
+
+# Har play/wait ki partial movie ek shared, content-addressed folder mein:
+# naam = manim ka play hash (scene state + animation params + camera) +
+# config key (resolution, fps, format...). Scene mein sirf aakhri morph ka
+# color badla? Pehle ke saare plays ka naam wahi rahega aur woh cache se aayenge.
+RENDER_CACHE_DIR_ENV = "NATURE_RENDER_CACHE_DIR"
+RENDER_CACHE_MB_ENV = "NATURE_RENDER_CACHE_MB"
+RENDER_CACHE_MB = 2048
+
+# Renderer/file writer ka output badle (jaise held_frames.py) toh yeh badhao
+RENDER_CACHE_VERSION = 1
+
+
+def render_cache_dir():
+    cache_dir = os.environ.get(RENDER_CACHE_DIR_ENV)
+    cache_dir = Path(cache_dir) if cache_dir else Path(config.media_dir) / "render_cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def render_cache_bytes():
+    return int(float(os.environ.get(RENDER_CACHE_MB_ENV, RENDER_CACHE_MB)) * 1024 * 1024)
+
+
+def config_key():
+    # Woh settings jo partial movie ke pixels/encoding badalti hain
+    parts = (
+        RENDER_CACHE_VERSION,
+        config.pixel_width,
+        config.pixel_height,
+        config.frame_rate,
+        config.movie_file_extension,
+        config.transparent,
+        str(config.background_color),
+    )
+    return hashlib.sha1(repr(parts).encode()).hexdigest()[:16]
+
+
+class RenderCacheMixin:
+    # SceneFileWriter ke liye. manim ka apna cache har scene ke folder mein,
+    # sirf file count (max_files_cached) se saaf hota hai aur config ko key
+    # mein nahi ginta. Yeh partial files ko render_cache_dir() mein rakhta hai,
+    # size ke hisaab se LRU evict karta hai aur hits/misses ginta hai.
+    def init_output_directories(self, scene_name):
+        super().init_output_directories(scene_name)
+        self.scene_name = scene_name
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_commit = None
+        if not config.dry_run:
+            self.render_cache_dir = render_cache_dir()
+            self.config_key = config_key()
+
+    def cached_segment_path(self, hash_animation):
+        return self.render_cache_dir / segment_name(hash_animation, self.config_key, config.movie_file_extension)
+
+    def is_already_cached(self, hash_invocation):
+        if not hasattr(self, "render_cache_dir") or not write_to_movie():
+            return False
+        path = self.cached_segment_path(hash_invocation)
+        if path.exists():
+            self.cache_hits += 1
+            # LRU ke liye "abhi use hua"
+            os.utime(path)
+            return True
+        self.cache_misses += 1
+        return False
+
+    def add_partial_movie_file(self, hash_animation):
+        if hash_animation is None or config.disable_caching or not write_to_movie():
+            return super().add_partial_movie_file(hash_animation)
+        path = str(self.cached_segment_path(hash_animation))
+        self.partial_movie_files.append(path)
+        self.sections[-1].partial_movie_files.append(path)
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        # Pehle temp file mein likho, poora hone par rename (segment_cache.incoming_path)
+        self.cache_commit = None
+        if allow_write and file_path is None and not config.disable_caching and write_to_movie():
+            final_path = Path(self.partial_movie_files[self.renderer.num_plays])
+            if final_path.parent == self.render_cache_dir:
+                file_path = incoming_path(final_path)
+                self.cache_commit = (file_path, final_path)
+        super().begin_animation(allow_write, file_path)
+
+    def end_animation(self, allow_write=False):
+        super().end_animation(allow_write)
+        if self.cache_commit is not None:
+            os.replace(*self.cache_commit)
+            self.cache_commit = None
+
+    def finish(self):
+        if self.cache_hits or self.cache_misses:
+            logger.info(
+                "Render cache for %(scene)s: %(hits)d hits, %(misses)d misses",
+                {"scene": self.scene_name, "hits": self.cache_hits, "misses": self.cache_misses},
+            )
+        super().finish()
+
+    def clean_cache(self):
+        evict_render_cache(self.render_cache_dir, render_cache_bytes(), keep=self.partial_movie_files)
@@ -0,0 +1,295 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import argparse
+import ast
+import importlib
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+
+# python render_daemon.py serve &            # ek baar: manim import + caches warm
+# python render_daemon.py list
+# python render_daemon.py render PatternOfFive -q l --set media_dir=out
+# python render_daemon.py stop
+#
+# Daemon process manim aur repo ke helper modules ek baar import karke TeX /
+# geometry caches garam rakhta hai. Har job ke liye woh fork hota hai: child
+# ko sab kuch pehle se imported milta hai, apna alag manim config hota hai,
+# aur render ke baad khatam - daemon ka state kabhi nahi badalta.
+SOCKET_ENV = "NATURE_DAEMON_SOCKET"
+DEFAULT_SOCKET = "/tmp/nature_render.sock"
+ROOT = Path(__file__).resolve().parent
+logger = logging.getLogger("manim")
+
+# manim ke scene base classes; isi file mein inse bani classes bhi scenes hain
+SCENE_BASES = {
+    "Scene",
+    "ThreeDScene",
+    "MovingCameraScene",
+    "ZoomedScene",
+    "VectorScene",
+    "LinearTransformationScene",
+}
+
+
+def base_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def parse_source(path):
+    # Sirf .py aur bina extension wali files ("Nature Decode"); jo Python nahi woh skip
+    if not path.is_file() or path.suffix not in ("", ".py"):
+        return None
+    try:
+        return ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except (SyntaxError, UnicodeDecodeError, ValueError):
+        return None
+
+
+def discover_scenes(root=ROOT):
+    # Import kiye bina, sirf source parse karke: {scene class: file}
+    scenes = {}
+    for path in sorted(Path(root).iterdir()):
+        tree = parse_source(path)
+        if tree is None:
+            continue
+        known = set(SCENE_BASES)
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and any(base_name(base) in known for base in node.bases):
+                known.add(node.name)
+                scenes[node.name] = path
+    return scenes
+
+
+def scene_imports(scene_files, root=ROOT):
+    # Scene files jo top-level modules import karti hain (manim, rose_curve, ...)
+    modules = set()
+    for path in set(scene_files):
+        tree = parse_source(path)
+        if tree is None:
+            continue
+        for node in tree.body:
+            if isinstance(node, ast.Import):
+                modules.update(alias.name.split(".")[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                modules.add(node.module.split(".")[0])
+    return sorted(modules)
+
+
+def warm_step(step, function, *args):
+    # Warm-up sirf speed ke liye hai: koi step fail ho (scene file mein import
+    # error, LaTeX nahi mila) toh log karke aage - daemon phir bhi chalta hai,
+    # us scene ka render job apni error khud bhejega
+    try:
+        function(*args)
+    except Exception as error:
+        logger.warning(
+            "Warm-up: %(step)s failed (%(error)s), continuing without it",
+            {"step": step, "error": f"{type(error).__name__}: {error}"},
+        )
+        return False
+    return True
+
+
+def warm_imports(scene_files):
+    # Har module alag se; jo fail hue unke naam
+    return [
+        module for module in scene_imports(scene_files)
+        if not warm_step(f"import {module}", importlib.import_module, module)
+    ]
+
+
+def warm_tex():
+    import tex_cache
+
+    tex_cache.warm_up()
+
+
+def warm_geometry():
+    from polar_geometry import rose_bezier_points
+    from shrine_geometry import LOD_SEGMENTS, shrine_mesh
+
+    # ChampaPolar (r = cos 5t) aur PatternOfFive ke flowers
+    rose_bezier_points(5)
+    rose_bezier_points(5, amplitude=1.5)
+    for segments in LOD_SEGMENTS:
+        shrine_mesh(segments)
+
+
+def warm_up(scenes):
+    # Daemon start par ek baar: imports, TeX labels, geometry caches
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    warm_imports(scenes.values())
+    warm_step("TeX labels", warm_tex)
+    warm_step("geometry caches", warm_geometry)
+
+
+def render_job(scene_file, scene_name, overrides, received, conn):
+    # Forked child: apna config, ek scene, phir exit
+    try:
+        from manim.renderer.cairo_renderer import CairoRenderer
+        from parallel_render import QUALITY_FLAGS, apply_config, load_scene_class
+
+        first_frame = []
+        render = CairoRenderer.render
+
+        def timed_render(renderer, *args, **kwargs):
+            if not first_frame:
+                first_frame.append(time.perf_counter())
+            return render(renderer, *args, **kwargs)
+
+        CairoRenderer.render = timed_render
+        if overrides.get("quality") in QUALITY_FLAGS:
+            overrides["quality"] = QUALITY_FLAGS[overrides["quality"]]
+        apply_config(scene_file, overrides)
+        scene = load_scene_class(scene_file, scene_name)()
+        scene.render()
+        conn.send({
+            "ok": True,
+            "scene": scene_name,
+            "movie": str(getattr(scene.renderer.file_writer, "movie_file_path", "")),
+            "time_to_first_frame_s": first_frame[0] - received if first_frame else None,
+            "wall_s": time.perf_counter() - received,
+        })
+    except Exception as error:
+        conn.send({"ok": False, "scene": scene_name, "error": f"{type(error).__name__}: {error}"})
+    finally:
+        conn.close()
+
+
+class RenderRequestHandler(socketserver.StreamRequestHandler):
+    # Ek line = ek JSON request, ek line = ek JSON response
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                response = self.server.dispatch(json.loads(line))
+            except (ValueError, KeyError, TypeError) as error:
+                response = {"ok": False, "error": f"{type(error).__name__}: {error}"}
+            self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+
+class RenderDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path, jobs=1):
+        self.scenes = discover_scenes()
+        self.slots = threading.Semaphore(jobs)
+        self.context = multiprocessing.get_context("fork")
+        warm_up(self.scenes)
+        super().__init__(str(socket_path), RenderRequestHandler)
+
+    def dispatch(self, request):
+        command = request.get("cmd", "render")
+        if command == "list":
+            self.scenes = discover_scenes()
+            return {"ok": True, "scenes": {name: str(path) for name, path in self.scenes.items()}}
+        if command == "shutdown":
+            threading.Thread(target=self.shutdown).start()
+            return {"ok": True}
+        if command == "render":
+            return self.render(request["scene"], request.get("config", {}))
+        return {"ok": False, "error": f"unknown command {command!r}"}
+
+    def render(self, scene_name, overrides):
+        received = time.perf_counter()
+        if scene_name not in self.scenes:
+            # Nayi file ya nayi class: dobara scan
+            self.scenes = discover_scenes()
+        if scene_name not in self.scenes:
+            return {"ok": False, "error": f"unknown scene {scene_name!r}"}
+
+        # Queue: ek waqt mein sirf `jobs` renders
+        with self.slots:
+            receiver, sender = self.context.Pipe(duplex=False)
+            process = self.context.Process(
+                target=render_job,
+                args=(self.scenes[scene_name], scene_name, dict(overrides), received, sender),
+            )
+            process.start()
+            sender.close()
+            try:
+                result = receiver.recv()
+            except EOFError:
+                result = {"ok": False, "scene": scene_name, "error": "render process died"}
+            process.join()
+        return result
+
+
+def request(payload, socket_path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        client.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+        with client.makefile("r", encoding="utf-8") as reader:
+            return json.loads(reader.readline())
+
+
+def parse_overrides(pairs):
+    overrides = {}
+    for pair in pairs:
+        key, _, value = pair.partition("=")
+        try:
+            overrides[key] = json.loads(value)
+        except ValueError:
+            overrides[key] = value
+    return overrides
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm render daemon for the Nature Decode scenes.")
+    parser.add_argument("--socket", default=os.environ.get(SOCKET_ENV, DEFAULT_SOCKET))
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve")
+    serve.add_argument("--jobs", type=int, default=1, help="renders at the same time")
+    commands.add_parser("list")
+    commands.add_parser("stop")
+    render = commands.add_parser("render")
+    render.add_argument("scene")
+    render.add_argument("-q", "--quality", default=None)
+    render.add_argument("--set", nargs="*", default=[], metavar="KEY=VALUE", help="manim config overrides")
+    args = parser.parse_args()
+
+    socket_path = Path(args.socket)
+    if args.command == "serve":
+        if socket_path.exists():
+            socket_path.unlink()
+        with RenderDaemon(socket_path, jobs=args.jobs) as daemon:
+            print(f"Render daemon ready on {socket_path} ({len(daemon.scenes)} scenes)", flush=True)
+            try:
+                daemon.serve_forever()
+            finally:
+                socket_path.unlink(missing_ok=True)
+        return 0
+
+    if args.command == "list":
+        response = request({"cmd": "list"}, socket_path)
+    elif args.command == "stop":
+        response = request({"cmd": "shutdown"}, socket_path)
+    else:
+        overrides = parse_overrides(args.set)
+        if args.quality:
+            overrides["quality"] = args.quality
+        response = request({"cmd": "render", "scene": args.scene, "config": overrides}, socket_path)
+    print(json.dumps(response, indent=2))
+    return 0 if response.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+from manim import *
+import numpy as np
+
+from draft import draft_sample_count
+from polar_geometry import (
+    rose_bezier_points,
+    rose_bezier_points_on_grid,
+    rose_sample_count,
+    theta_grid,
+)
+
+
+def get_rose_curve(k, amplitude=1.0, t_range=(0, TAU), n_samples=None, **kwargs):
+    # Static r = A*cos(k*theta): points shared geometry cache se copy hote hain,
+    # ParametricFunction ki tarah dobara sampling / bezier fitting nahi
+    # Draft mode mein kam samples (dekho draft.py)
+    n_samples = draft_sample_count(n_samples or rose_sample_count(k, t_range))
+    curve = VMobject(**kwargs)
+    curve.set_points(rose_bezier_points(k, amplitude, t_range, n_samples))
+    return curve
+
+
+class RoseCurve(VMobject):
+    # r = A*cos(n*theta) jiska 'n' ek ValueTracker se aata hai.
+    # always_redraw har frame naya ParametricFunction banata tha; yeh wahi
+    # point array rakhta hai aur har frame usko in-place overwrite karta hai.
+    # n_samples ko scene ke sabse bade 'n' ke hisaab se rakho (rose_sample_count).
+    def __init__(
+        self,
+        n_tracker,
+        amplitude=1.0,
+        plane=None,
+        n_samples=None,
+        **kwargs
+    ):
+        self.n_tracker = n_tracker
+        self.amplitude = amplitude
+        self.layers = []
+
+        # Fixed theta grid (ek baar hi banta hai)
+        if n_samples is None:
+            n_samples = rose_sample_count(n_tracker.get_value())
+        n_samples = draft_sample_count(n_samples)
+        self.thetas = theta_grid(n_samples=n_samples)
+        self.cos_theta = np.cos(self.thetas)
+        self.sin_theta = np.sin(self.thetas)
+
+        # Plane ka origin aur unit vectors - polar_to_point ek linear map hai,
+        # toh per-point call ki jagah ek matrix multiply kaafi hai
+        if plane is None:
+            self.origin = ORIGIN.astype(float)
+            self.basis = np.array([RIGHT, UP], dtype=float)
+        else:
+            self.origin = np.array(plane.polar_to_point(0, 0), dtype=float)
+            self.basis = np.array([
+                plane.polar_to_point(1, 0),
+                plane.polar_to_point(1, PI / 2),
+            ], dtype=float) - self.origin
+
+        super().__init__(**kwargs)
+        self.add_updater(lambda m: m.update_curve())
+
+    def generate_points(self):
+        self.set_points(self.get_curve_points())
+
+    def get_curve_points(self):
+        points = rose_bezier_points_on_grid(
+            self.n_tracker.get_value(),
+            self.amplitude,
+            self.cos_theta,
+            self.sin_theta,
+            self.thetas,
+        )
+        return self.origin + points[:, :2] @ self.basis
+
+    def add_layer(self, **style):
+        # Glow jaisi extra strokes: alag mobject, par points isi curve ki
+        # evaluation se copy hote hain (dobara sampling nahi hoti)
+        layer = VMobject(**style)
+        layer.set_points(self.points.copy())
+        self.layers.append(layer)
+        return layer
+
+    def update_curve(self):
+        points = self.get_curve_points()
+        for mob in [self, *self.layers]:
+            if mob.points.shape == points.shape:
+                mob.points[:] = points
+            else:
+                mob.set_points(points.copy())
+        return self
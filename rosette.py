@@ -0,0 +1,94 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+from manim import *
+import numpy as np
+
+from circle_geometry import (
+    CIRCLE_CURVES,
+    circle_bezier_points,
+    n_fold_centers,
+    partial_bezier_blocks,
+    staggered_proportions,
+)
+
+
+class CircleRosette(VMobject):
+    # Saare N circles ek hi contiguous point array mein (circle i = ek block).
+    # Har circle ka color/opacity stroke_rgbas ki ek row hai aur width
+    # stroke_width * width_scales[i]. Sirf stroke draw hota hai (fill nahi),
+    # MultiStrokeCamera / MultiStrokeThreeDCamera ke saath.
+    def __init__(self, centers, radius=1.0, colors=None, width_scales=None, start_angle=0.0, **kwargs):
+        self.centers = np.array(centers, dtype=float)
+        self.radii = np.broadcast_to(np.asarray(radius, dtype=float), (len(self.centers),)).copy()
+        self.start_angle = start_angle
+        self.n_circles = len(self.centers)
+        self.n_curves = CIRCLE_CURVES
+        super().__init__(**kwargs)
+
+        # Ek row har circle ke liye
+        self.stroke_rgbas = np.repeat(self.stroke_rgbas[:1], self.n_circles, axis=0)
+        if colors is not None:
+            self.set_circle_colors(colors)
+        if width_scales is None:
+            width_scales = np.ones(self.n_circles)
+        self.width_scales = np.array(width_scales, dtype=float)
+
+    @classmethod
+    def n_fold(cls, n, radius, ring_radius, angle_offset=0.0, **kwargs):
+        # n circles ek ring par, 360/n degree ke gap se
+        return cls(n_fold_centers(n, ring_radius, angle_offset), radius=radius, **kwargs)
+
+    def generate_points(self):
+        self.set_points(circle_bezier_points(
+            self.centers, self.radii, self.start_angle, self.n_curves
+        ))
+
+    def set_circle_colors(self, colors):
+        colors = [ManimColor(color).to_rgb() for color in colors]
+        self.stroke_rgbas[:, :3] = np.resize(np.array(colors), (self.n_circles, 3))
+        return self
+
+    def get_circle_blocks(self):
+        return self.points.reshape(self.n_circles, 4 * self.n_curves, 3)
+
+    def get_stroke_passes(self):
+        # Ek jaisi style wale circles ek hi path mein - aam taur par poora
+        # rosette ek hi stroke call hai, chahe N kitna bhi bada ho
+        if self.get_num_points() == 0:
+            return []
+        rgbas = self.get_stroke_rgbas()
+        if len(rgbas) != self.n_circles:
+            rgbas = np.resize(rgbas, (self.n_circles, 4))
+        widths = self.stroke_width * self.width_scales
+        styles, groups = np.unique(
+            np.column_stack([rgbas, widths]), axis=0, return_inverse=True
+        )
+        groups = groups.reshape(-1)
+        blocks = self.get_circle_blocks()
+        return [
+            (blocks[groups == i], style[:4], style[4])
+            for i, style in enumerate(styles)
+        ]
+
+
+class CreateRosette(Animation):
+    # Create(VGroup, lag_ratio=...) jaisa staggered draw, par N alag
+    # submobject animations ki jagah ek hi animation saare circles ke
+    # proportions vectorized nikaalti hai
+    def __init__(self, rosette, lag_ratio=0.0, introducer=True, **kwargs):
+        super().__init__(rosette, lag_ratio=lag_ratio, introducer=introducer, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        rosette = self.mobject
+        proportions = staggered_proportions(self.rate_func, alpha, rosette.n_circles, self.lag_ratio)
+        points = partial_bezier_blocks(
+            self.starting_mobject.points, proportions, rosette.n_curves
+        )
+        if rosette.points.shape == points.shape:
+            rosette.points[:] = points
+        else:
+            rosette.set_points(points)
@@ -7,42 +7,55 @@ YouTube: https://www.youtube.com/@MathRize
 from manim import *
 import numpy as np
 
+from circle_geometry import circle_intersections, ring_polygon
+from draft import apply_sheen
+from glow import GlowStroke
+from multi_stroke import MultiStrokeCamera
+from nature_renderer import NatureRenderer
+
 # --- Custom Colors for Premium Look ---
 RICH_GOLD = "#FFD700" # Gehra Sona
 AMBER_GLOW = "#FF4500" # Aag jaisa Narangi
 DEEP_BRONZE = "#CD7F32"
 
+# --- HELPER FUNCTION FOR TRUE GLOW ---
+# Yeh function ek object ke peeche multiple dhundhli layers banata hai
+# Saari layers ek hi GlowStroke hain (har member ki geometry ek baar), camera unhe draw karta hai
+def make_glowing_stroke(mobject, glow_color, layers=4, max_width=20, base_opacity=0.4):
+    glow_layers = GlowStroke(mobject, glow_color, layers=layers, max_width=max_width, base_opacity=base_opacity)
+    # Asli object ko sabse upar rakho
+    return VGroup(glow_layers, mobject)
+# ------------------------------------
+
 class SacredGeometryCinematic(Scene):
+    # Sweep parameters (dekho sweep.py)
+    RADIUS = 2.5
+    CENTER_COLOR = RICH_GOLD
+    CIRCLE_COLOR = DEEP_BRONZE
+    SYMMETRY_COLOR = AMBER_GLOW
+    BACKGROUND = "#050505" # Almost black
+
+    def __init__(self, renderer=None, **kwargs):
+        # Glow layers ek hi path se draw hoti hain (dekho glow.py, multi_stroke.py)
+        super().__init__(
+            renderer=renderer or NatureRenderer(camera_class=MultiStrokeCamera),
+            camera_class=MultiStrokeCamera,
+            **kwargs
+        )
+
     def construct(self):
         # 1. ATMOSPHERE: Not just black, but dark vignette
-        self.camera.background_color = "#050505" # Almost black
-
-        RADIUS = 2.5
-
-        # --- HELPER FUNCTION FOR TRUE GLOW ---
-        # Yeh function ek object ke peeche multiple dhundhli layers banata hai
-        def make_glowing_stroke(mobject, glow_color, layers=4, max_width=20, base_opacity=0.4):
-            glow_group = VGroup()
-            for i in range(layers):
-                # Har layer pichli se thodi moti aur zyada transparent hogi
-                width = max_width * (i + 1) / layers
-                opacity = base_opacity * (1 - (i / layers))
-                glow_layer = mobject.copy()
-                glow_layer.set_stroke(width=width, color=glow_color, opacity=opacity)
-                glow_layer.set_fill(opacity=0)
-                glow_group.add(glow_layer)
-            # Asli object ko sabse upar rakho
-            glow_group.add(mobject)
-            return glow_group
+        self.camera.background_color = self.BACKGROUND
 
+        RADIUS = self.RADIUS
 
         # --- OBJECTS CREATION ---
 
         # 1. The Central Circle (Molten Gold Look)
-        center_circle_base = Circle(radius=RADIUS, color=RICH_GOLD, stroke_width=5)
-        center_circle_base.set_sheen(0.8, direction=UR) # Metallic Shine
+        center_circle_base = Circle(radius=RADIUS, color=self.CENTER_COLOR, stroke_width=5)
+        apply_sheen(center_circle_base, 0.8, direction=UR) # Metallic Shine (draft mein nahi)
         # Isko thoda sa glow dete hain
-        center_circle = make_glowing_stroke(center_circle_base, RICH_GOLD, layers=3, max_width=12, base_opacity=0.2)
+        center_circle = make_glowing_stroke(center_circle_base, self.CENTER_COLOR, layers=3, max_width=12, base_opacity=0.2)
 
         # 2. The 5 Surrounding Circles (Bronze/Gold Mix)
         surrounding_circles_group = VGroup()
@@ -51,28 +64,35 @@ class SacredGeometryCinematic(Scene):
             new_center = np.array([RADIUS * np.cos(angle_rad), RADIUS * np.sin(angle_rad), 0])
             
             # Base circle
-            circle_base = Circle(radius=RADIUS, color=DEEP_BRONZE, stroke_width=3)
+            circle_base = Circle(radius=RADIUS, color=self.CIRCLE_COLOR, stroke_width=3)
             # Ispe kam glow rakhenge taaki focus beech mein rahe
-            glowing_circle = make_glowing_stroke(circle_base, DEEP_BRONZE, layers=2, max_width=8, base_opacity=0.15)
+            glowing_circle = make_glowing_stroke(circle_base, self.CIRCLE_COLOR, layers=2, max_width=8, base_opacity=0.15)
             glowing_circle.move_to(new_center)
             surrounding_circles_group.add(glowing_circle)
 
 
         # 3. The Resulting Symmetry (The Fiery Reveal)
-        # Calculation for perfect fit
-        pentagon_base = RegularPolygon(n=5, color=AMBER_GLOW, stroke_width=6)
-        pentagon_scale_factor = RADIUS * np.sqrt((3 - np.sqrt(5))/2) * 1.236
-        pentagon_base.scale(pentagon_scale_factor)
-        pentagon_base.rotate(180*DEGREES + 36*DEGREES) 
+        # Perfect fit: pentagon ke vertices seedha circles ke intersections se
+        # (sabse andar wali 5 points ki ring, pehle jaisa 306 degree se shuru)
+        circle_centers = [center_circle_base.get_center()] + [c[-1].get_center() for c in surrounding_circles_group]
+        intersections = circle_intersections(circle_centers, RADIUS)
+        start_angle = 90*DEGREES + 180*DEGREES + 36*DEGREES
+        pentagon_points = ring_polygon(intersections, 5, start_angle=start_angle)
+        pentagon_base = Polygon(*pentagon_points, color=self.SYMMETRY_COLOR, stroke_width=6)
         
         # Star inside
-        pentagram_base = Star(n=5, outer_radius=pentagon_base.width/2, color=AMBER_GLOW, stroke_width=4)
-        pentagram_base.rotate(180*DEGREES + 36*DEGREES)
+        pentagram_base = Star(
+            n=5,
+            outer_radius=np.linalg.norm(pentagon_points[0]),
+            start_angle=start_angle,
+            color=self.SYMMETRY_COLOR,
+            stroke_width=4
+        )
         
         symmetry_base = VGroup(pentagon_base, pentagram_base)
         
         # ISKO SABSE ZYADA GLOW DENGE (Intense Fire Effect)
-        final_symmetry = make_glowing_stroke(symmetry_base, AMBER_GLOW, layers=6, max_width=40, base_opacity=0.5)
+        final_symmetry = make_glowing_stroke(symmetry_base, self.SYMMETRY_COLOR, layers=6, max_width=40, base_opacity=0.5)
 
 
         # --- ANIMATION SEQUENCE (Slow & Majestic) ---
@@ -0,0 +1,66 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import logging
+import os
+import re
+from pathlib import Path
+
+# Shared render cache ki files (render_cache.py), manim ke bina
+logger = logging.getLogger("manim")
+
+# "<camera>_<animations>_<mobjects>_<config key><ext>" - manim ka play hash
+# teen crc32 numbers hai, config key 16 hex
+SEGMENT_NAME = re.compile(r"^\d+_\d+_\d+_[0-9a-f]{16}\.\w+$")
+INCOMING_DIR = "incoming"
+
+
+def segment_name(hash_animation, key, extension):
+    return f"{hash_animation}_{key}{extension}"
+
+
+def incoming_path(final_path, pid=None):
+    # Har process apni temp file incoming/ mein likhta hai, poori hone par
+    # os.replace - do workers ek hi segment likhein toh bhi adhoori file
+    # kabhi final naam par nahi dikhti
+    final_path = Path(final_path)
+    incoming = final_path.parent / INCOMING_DIR
+    incoming.mkdir(exist_ok=True)
+    return incoming / f"{final_path.stem}.{pid or os.getpid()}{final_path.suffix}"
+
+
+def evict_render_cache(cache_dir, max_bytes, keep=()):
+    # LRU: sabse purana use (mtime) pehle jaata hai, jab tak folder limit mein na aa jaye.
+    # Sirf segment naam wali files: folder mein koi aur file ho toh woh nahi chhoti.
+    keep = {Path(path).resolve() for path in keep if path is not None}
+    files = []
+    for path in Path(cache_dir).iterdir():
+        if not SEGMENT_NAME.match(path.name) or not path.is_file():
+            continue
+        try:
+            files.append((path, path.stat()))
+        except FileNotFoundError:
+            # Doosre worker ne abhi evict kar di
+            continue
+    total = sum(stat.st_size for _, stat in files)
+    removed = 0
+    for path, stat in sorted(files, key=lambda item: item[1].st_mtime):
+        if total <= max_bytes:
+            break
+        if path.resolve() in keep:
+            continue
+        try:
+            path.unlink()
+            removed += 1
+        except FileNotFoundError:
+            pass
+        total -= stat.st_size
+    if removed:
+        logger.info(
+            "Render cache: evicted %(removed)d old segments, %(mb).0f MB left in %(dir)s",
+            {"removed": removed, "mb": total / (1024 * 1024), "dir": cache_dir},
+        )
+    return removed
@@ -0,0 +1,100 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+from manim import *
+import numpy as np
+
+from circle_geometry import staggered_proportions
+from draft import draft_lod_bias
+from shrine_geometry import PLINTH_CENTER, SHRINE_HEIGHT, shrine_draw_list
+
+# ThreeDCamera ka default light source (plain Camera ke liye)
+DEFAULT_LIGHT_SOURCE = 9 * DOWN + 7 * LEFT + 10 * OUT
+
+
+class ShrineInstances(VMobject):
+    # Saare shrines (chabootra + shikhara) ek hi mobject. Har instance ke
+    # points sirf do anchors hain: base aur top (ek seedhi curve). Mesh har
+    # LOD ke liye shrine_geometry.shrine_mesh mein ek baar banta hai aur draw
+    # ke waqt position + scale se copy hota hai - shift/scale/GrowFromPoint
+    # jaise transforms anchors par chalte hain, mesh unke peeche aata hai.
+    # Shrines hamesha seedhe (OUT ki taraf) khade rehte hain.
+    # MultiStrokeCamera / MultiStrokeThreeDCamera ke saath draw hota hai.
+    def __init__(self, positions, scales=1.0, fill_color=GOLD, fill_opacity=1, stroke_color=GOLD, stroke_width=1, **kwargs):
+        self.bases = np.array(positions, dtype=float)
+        self.n_shrines = len(self.bases)
+        self.scales = np.broadcast_to(np.asarray(scales, dtype=float), (self.n_shrines,)).copy()
+        self.lod_levels = np.zeros(self.n_shrines, dtype=int)
+        super().__init__(
+            fill_color=fill_color,
+            fill_opacity=fill_opacity,
+            stroke_color=stroke_color,
+            stroke_width=stroke_width,
+            shade_in_3d=True,
+            **kwargs
+        )
+
+    def generate_points(self):
+        points = np.empty((self.n_shrines, 4, 3))
+        points[:, :2] = self.bases[:, None]
+        points[:, 2:] = (self.bases + np.outer(self.scales * SHRINE_HEIGHT, OUT))[:, None]
+        self.set_points(points.reshape(-1, 3))
+
+    def get_bases(self):
+        return self.points[0::4]
+
+    def get_tops(self):
+        return self.points[3::4]
+
+    def get_scales(self):
+        return np.linalg.norm(self.get_tops() - self.get_bases(), axis=1) / SHRINE_HEIGHT
+
+    def get_plinth_centers(self):
+        bases = self.get_bases()
+        return bases + (self.get_tops() - bases) * (PLINTH_CENTER / SHRINE_HEIGHT)
+
+    def get_mesh_faces(self, camera):
+        # (faces, fill rgba har face ki, stroke rgba, stroke width) - faces
+        # pehle se culled aur peeche se aage ke order mein
+        if isinstance(camera, ThreeDCamera):
+            rot_matrix = camera.get_rotation_matrix()
+            focal_distance = camera.get_focal_distance()
+            zoom = camera.get_zoom()
+            light_source = camera.light_source.points[0]
+        else:
+            rot_matrix, focal_distance, zoom = np.identity(3), np.inf, 1
+            light_source = DEFAULT_LIGHT_SOURCE
+        pixels_per_unit = zoom * camera.pixel_height / camera.frame_height
+
+        faces, _, shade, self.lod_levels = shrine_draw_list(
+            self.get_bases(), self.get_scales(), rot_matrix,
+            np.asarray(camera.frame_center, dtype=float), focal_distance,
+            pixels_per_unit, light_source, lod_bias=draft_lod_bias(),
+        )
+        fill_rgba = self.get_fill_rgbas()[0]
+        fill_rgbas = np.repeat(fill_rgba[np.newaxis], len(faces), axis=0)
+        fill_rgbas[:, :3] = np.clip(fill_rgba[:3] + shade[:, None], 0, 1)
+        return faces, fill_rgbas, self.get_stroke_rgbas()[0], self.get_stroke_width()
+
+
+class RiseShrines(Animation):
+    # Har shrine apne base se uthta hai (GrowFromPoint(shrine, bottom) jaisa),
+    # saare instances ek hi animation mein, lag_ratio ke saath
+    def __init__(self, shrines, lag_ratio=0.0, introducer=True, **kwargs):
+        super().__init__(shrines, lag_ratio=lag_ratio, introducer=introducer, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        shrines = self.mobject
+        n = shrines.n_shrines
+        growth = staggered_proportions(self.rate_func, alpha, n, self.lag_ratio)
+
+        start = self.starting_mobject.points.reshape(n, 4, 3)
+        bases = start[:, 0]
+        tops = bases + growth[:, None] * (start[:, 3] - bases)
+        points = np.empty((n, 4, 3))
+        points[:, :2] = bases[:, None]
+        points[:, 2:] = tops[:, None]
+        shrines.points[:] = points.reshape(-1, 3)
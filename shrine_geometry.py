@@ -0,0 +1,141 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+from functools import lru_cache
+
+import numpy as np
+
+TAU = 2 * np.pi
+
+# Scale 1 wala shrine, base point origin par, OUT = +z. Naap wahi jo
+# create_temple_structure ke Cube(0.7).stretch(0.4) + Cone(0.35, 0.8) ke the.
+PLINTH_SIDE = 0.7
+PLINTH_BOTTOM = 0.01
+PLINTH_TOP = 0.29
+PLINTH_CENTER = (PLINTH_BOTTOM + PLINTH_TOP) / 2
+SPIRE_RADIUS = 0.35
+SPIRE_HEIGHT = 0.8
+SHRINE_HEIGHT = PLINTH_TOP + SPIRE_HEIGHT
+SHRINE_RADIUS = np.linalg.norm([PLINTH_SIDE, PLINTH_SIDE, SHRINE_HEIGHT]) / 2
+
+# LOD: spire ke segments, aur shrine screen par kam se kam kitne pixels ka
+# ho tab woh level chune. manim ka Cone 32x32 = 1024 faces tha.
+LOD_SEGMENTS = (32, 16, 8, 4)
+LOD_MIN_PIXELS = (200, 60, 20, 0)
+
+PLINTH, SPIRE = 0, 1
+
+
+def plinth_faces():
+    # Chabootra: 6 quads, har face ke corners bahar se dekhne par counter-clockwise
+    h = PLINTH_SIDE / 2
+    x0, x1, y0, y1, z0, z1 = -h, h, -h, h, PLINTH_BOTTOM, PLINTH_TOP
+    return np.array([
+        [[x0, y0, z0], [x0, y1, z0], [x1, y1, z0], [x1, y0, z0]],
+        [[x0, y0, z1], [x1, y0, z1], [x1, y1, z1], [x0, y1, z1]],
+        [[x0, y0, z0], [x1, y0, z0], [x1, y0, z1], [x0, y0, z1]],
+        [[x1, y0, z0], [x1, y1, z0], [x1, y1, z1], [x1, y0, z1]],
+        [[x1, y1, z0], [x0, y1, z0], [x0, y1, z1], [x1, y1, z1]],
+        [[x0, y1, z0], [x0, y0, z0], [x0, y0, z1], [x0, y1, z1]],
+    ])
+
+
+def spire_faces(segments):
+    # Shikhara: har segment ek triangle, apex dohraya gaya taaki sab faces 4 corners ke hon
+    angles = np.linspace(0, TAU, segments + 1)
+    ring = np.column_stack([
+        SPIRE_RADIUS * np.cos(angles),
+        SPIRE_RADIUS * np.sin(angles),
+        np.full_like(angles, PLINTH_TOP),
+    ])
+    apex = np.array([0, 0, SHRINE_HEIGHT])
+    faces = np.empty((segments, 4, 3))
+    faces[:, 0] = ring[:-1]
+    faces[:, 1] = ring[1:]
+    faces[:, 2] = apex
+    faces[:, 3] = apex
+    return faces
+
+
+def face_normals(faces):
+    normals = np.cross(faces[..., 1, :] - faces[..., 0, :], faces[..., 2, :] - faces[..., 0, :])
+    return normals / np.linalg.norm(normals, axis=-1, keepdims=True)
+
+
+@lru_cache(maxsize=len(LOD_SEGMENTS))
+def shrine_mesh(segments):
+    # Har LOD ki geometry sirf ek baar; instances iske transformed copies hain
+    faces = np.concatenate([plinth_faces(), spire_faces(segments)])
+    normals = face_normals(faces)
+    parts = np.repeat([PLINTH, SPIRE], [6, segments])
+    for array in (faces, normals, parts):
+        array.setflags(write=False)
+    return faces, normals, parts
+
+
+def lod_levels(pixel_sizes):
+    return np.sum(np.asarray(pixel_sizes)[:, None] < np.array(LOD_MIN_PIXELS[:-1])[None, :], axis=1)
+
+
+def shrine_draw_list(bases, scales, rot_matrix, frame_center, focal_distance, pixels_per_unit, light_source, lod_bias=0):
+    # Saare instances ke visible faces, peeche se aage (painter's order):
+    # door wala shrine pehle, har shrine mein pehle chabootra phir shikhara.
+    # Returns (faces (M, 4, 3), normals (M, 3), shade factors (M,), levels (n,))
+    bases = np.asarray(bases, dtype=float)
+    scales = np.asarray(scales, dtype=float)
+    rot_matrix = np.asarray(rot_matrix, dtype=float)
+    centers = bases + np.outer(scales * SHRINE_HEIGHT / 2, [0, 0, 1])
+    depths = np.dot(centers - frame_center, rot_matrix.T)[:, 2]
+
+    # Projected size -> LOD (perspective: d / (d - z))
+    if np.isfinite(focal_distance):
+        perspective = focal_distance / np.maximum(focal_distance - depths, 1e-6)
+        camera_position = frame_center + rot_matrix.T @ np.array([0, 0, focal_distance])
+    else:
+        perspective = np.ones_like(depths)
+        camera_position = None
+    levels = lod_levels(2 * SHRINE_RADIUS * scales * perspective * pixels_per_unit)
+    # lod_bias: draft previews mein har shrine itne level mota
+    levels = np.minimum(levels + lod_bias, len(LOD_SEGMENTS) - 1)
+
+    visible = scales > 1e-6
+    order = np.argsort(depths, kind="stable")
+    order = order[visible[order]]
+    rank = np.empty(len(bases), dtype=int)
+    rank[order] = np.arange(len(order))
+
+    faces_list, normals_list, keys_list = [], [], []
+    for level in np.unique(levels[order]):
+        members = order[levels[order] == level]
+        unit_faces, unit_normals, parts = shrine_mesh(LOD_SEGMENTS[level])
+        faces = bases[members, None, None, :] + scales[members, None, None, None] * unit_faces[None]
+        faces_list.append(faces.reshape(-1, 4, 3))
+        normals_list.append(np.broadcast_to(unit_normals, (len(members),) + unit_normals.shape).reshape(-1, 3))
+        keys_list.append((rank[members][:, None] * 2 + parts[None, :]).reshape(-1))
+
+    if not faces_list:
+        return np.zeros((0, 4, 3)), np.zeros((0, 3)), np.zeros(0), levels
+
+    faces = np.concatenate(faces_list)
+    normals = np.concatenate(normals_list)
+    draw_order = np.argsort(np.concatenate(keys_list), kind="stable")
+    faces, normals = faces[draw_order], normals[draw_order]
+
+    # Back-face culling: camera ki taraf peeth wale faces draw hi nahi hote
+    face_centers = faces.mean(axis=1)
+    if camera_position is not None:
+        to_camera = camera_position - face_centers
+    else:
+        to_camera = np.broadcast_to(rot_matrix[2], face_centers.shape)
+    front = np.einsum("ij,ij->i", normals, to_camera) > 0
+    faces, normals, face_centers = faces[front], normals[front], face_centers[front]
+
+    # manim ka get_shaded_rgb, par face center par ek hi baar
+    to_sun = light_source - face_centers
+    to_sun /= np.linalg.norm(to_sun, axis=1, keepdims=True)
+    shade = 0.5 * np.einsum("ij,ij->i", normals, to_sun) ** 3
+    shade[shade < 0] *= 0.5
+    return faces, normals, shade, levels
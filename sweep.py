@@ -0,0 +1,143 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import manim
+from manim import *
+
+from parallel_render import QUALITY_FLAGS, apply_config, load_scene_class
+from render_daemon import discover_scenes, warm_up
+from sweep_grid import parameter_grid, parse_values, scene_parameters, variant_names
+
+# python sweep.py ChampaPolar K=3,5,7,9 -q l
+# python sweep.py HiddenFiveReveal FOLDS=5,6,7 STAR_COLOR=RED,TEAL -w 4
+# python sweep.py OddNumberSymmetry --grid morphs.json   # {"N_VALUES": [[1, 3, 5], [1, 5, 9]]}
+# python sweep.py PatternOfFive --list                   # declared parameters
+#
+# Scene ke parameters uski UPPERCASE class attributes hain (K, R, FOLDS,
+# SCALE_FACTOR, COLORS, ...). Har combination ek variant hai: scene class ka
+# subclass jisme woh attributes override hain, toh movie file ka naam bhi
+# variant ka naam hai. Workers ek hi baar warm hote hain (imports, rose /
+# shrine geometry) aur kai variants render karte hain; TeX aur render cache
+# disk par hain, toh sab workers share karte hain - variants ke common plays
+# (jaise backdrop wale) dobara render nahi hote.
+
+
+def check_variants(scene_class, variants, names):
+    # Scene apni check_parameters classmethod de toh har variant spawn se
+    # pehle jaancho (jaise OddNumberSymmetry: len(COLORS) == len(N_VALUES))
+    if not hasattr(scene_class, "check_parameters"):
+        return
+    for name, values in zip(names, variants):
+        variant = type(name, (scene_class,), dict(values))
+        variant.check_parameters()
+
+
+def init_worker(scene_file, scene_name):
+    # Har worker process ek baar: imports aur geometry caches
+    warm_up({scene_name: Path(scene_file)})
+
+
+def render_variant(scene_file, scene_name, name, values, overrides):
+    apply_config(scene_file, overrides)
+    scene_class = load_scene_class(scene_file, scene_name)
+    variant = type(name, (scene_class,), dict(values))
+
+    start = time.perf_counter()
+    scene = variant()
+    scene.render()
+    return variant.__name__, str(scene.renderer.file_writer.movie_file_path), time.perf_counter() - start
+
+
+def render_sweep(scene_name, grid, workers=None, **overrides):
+    scene_file = discover_scenes()[scene_name]
+    scene_class = load_scene_class(scene_file, scene_name)
+    variants = parameter_grid(scene_class, grid)
+    names = variant_names(scene_name, variants)
+    check_variants(scene_class, variants, names)
+    workers = min(workers or os.cpu_count(), len(variants))
+
+    # spawn: har worker ka apna saaf manim config (parallel_render.py jaisa)
+    context = multiprocessing.get_context("spawn")
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        workers, mp_context=context, initializer=init_worker, initargs=(scene_file, scene_name)
+    ) as pool:
+        futures = [
+            pool.submit(render_variant, scene_file, scene_name, name, values, overrides)
+            for name, values in zip(names, variants)
+        ]
+        results = []
+        for future in futures:
+            name, movie_file_path, elapsed = future.result()
+            logger.info("%(name)s: %(elapsed).1fs -> %(path)s", {"name": name, "elapsed": elapsed, "path": movie_file_path})
+            results.append((name, movie_file_path, elapsed))
+    wall = time.perf_counter() - start
+
+    logger.info(
+        "%(scene)s sweep: %(variants)d variants on %(workers)d workers in %(wall).1fs "
+        "(%(throughput).0f variants/hour)",
+        {
+            "scene": scene_name, "variants": len(results), "workers": workers,
+            "wall": wall, "throughput": 3600 * len(results) / wall if wall else 0.0,
+        },
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render every combination of a scene's parameters.")
+    parser.add_argument("scene_name")
+    parser.add_argument("params", nargs="*", metavar="NAME=VALUES", help="e.g. K=3,5,7 or COLORS=[(RED, BLUE)]")
+    parser.add_argument("--grid", type=Path, default=None, help="JSON file: {name: [values]}")
+    parser.add_argument("--list", action="store_true", help="print declared parameters and exit")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), default=None)
+    parser.add_argument("--media-dir", default=None)
+    args = parser.parse_args()
+
+    scenes = discover_scenes()
+    if args.scene_name not in scenes:
+        parser.error(f"unknown scene {args.scene_name!r}; known: {', '.join(sorted(scenes))}")
+    if args.list:
+        scene_class = load_scene_class(scenes[args.scene_name], args.scene_name)
+        for name, value in scene_parameters(scene_class).items():
+            print(f"{name} = {value!r}")
+        return 0
+
+    grid = json.loads(args.grid.read_text(encoding="utf-8")) if args.grid else {}
+    for param in args.params:
+        name, sep, values = param.partition("=")
+        if not sep:
+            parser.error(f"expected NAME=VALUES, got {param!r}")
+        try:
+            grid[name] = parse_values(values, vars(manim))
+        except ValueError as error:
+            parser.error(f"{name}: {error}")
+
+    overrides = {}
+    if args.quality:
+        overrides["quality"] = QUALITY_FLAGS[args.quality]
+    if args.media_dir:
+        overrides["media_dir"] = args.media_dir
+    try:
+        render_sweep(args.scene_name, grid, workers=args.workers, **overrides)
+    except ValueError as error:
+        # Galat ya mismatched parameters: koi render spawn hone se pehle
+        parser.error(str(error))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import ast
+import hashlib
+import itertools
+import operator
+import re
+from collections import Counter
+
+# sweep.py ke parameter grid aur variant naam, manim ke bina.
+# Manim ke naam (GOLD, PI, ...) 'names' mapping se aate hain.
+MAX_NAME_LENGTH = 80
+
+OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+def scene_parameters(scene_class):
+    # Repo ki scene classes (manim ki nahi) ke UPPERCASE attributes, parent pehle
+    parameters = {}
+    for cls in reversed(scene_class.__mro__):
+        if cls.__module__.split(".")[0] in ("manim", "builtins"):
+            continue
+        parameters.update({name: value for name, value in vars(cls).items() if name.isupper()})
+    return parameters
+
+
+def evaluate(node, names):
+    # literal_eval jaisa, par manim ke naam (TEAL, PI) aur arithmetic (PI/2, 2*TAU/5) bhi.
+    # Function calls, attributes waghera nahi.
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name) and node.id in names:
+        return names[node.id]
+    if isinstance(node, (ast.Tuple, ast.List)):
+        values = [evaluate(item, names) for item in node.elts]
+        return tuple(values) if isinstance(node, ast.Tuple) else values
+    if isinstance(node, ast.UnaryOp) and type(node.op) in OPERATORS:
+        return OPERATORS[type(node.op)](evaluate(node.operand, names))
+    if isinstance(node, ast.BinOp) and type(node.op) in OPERATORS:
+        return OPERATORS[type(node.op)](evaluate(node.left, names), evaluate(node.right, names))
+    raise ValueError(f"not a literal: {ast.unparse(node)!r}")
+
+
+def parse_literal(text, names=None):
+    return evaluate(ast.parse(text.strip(), mode="eval").body, names or {})
+
+
+def parse_values(text, names=None):
+    # "3,5,7", "RED,TEAL" ya "[(1, 3, 5), (1, 5, 9)]" -> values ki list; "5" -> [5].
+    # Jo literal nahi (jaise "#FC6255") woh seedha string. Khaali value ValueError.
+    try:
+        value = parse_literal(text, names)
+    except (ValueError, SyntaxError, TypeError, ArithmeticError):
+        values = []
+        for item in text.split(","):
+            if not item.strip():
+                raise ValueError(f"empty value in {text!r}")
+            try:
+                values.append(parse_literal(item, names))
+            except (ValueError, SyntaxError, TypeError, ArithmeticError):
+                values.append(item.strip())
+        return values
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def parameter_grid(scene_class, grid):
+    declared = scene_parameters(scene_class)
+    unknown = sorted(set(grid) - set(declared))
+    if unknown:
+        raise ValueError(
+            f"{scene_class.__name__} has no parameter(s) {', '.join(unknown)}; "
+            f"declared: {', '.join(sorted(declared))}"
+        )
+    for name, values in grid.items():
+        if not isinstance(values, list) or not values:
+            raise ValueError(f"{name} needs a non-empty list of values, got {values!r}")
+        repeated = [value for value, count in Counter(map(repr, values)).items() if count > 1]
+        if repeated:
+            raise ValueError(f"{name} lists {', '.join(repeated)} more than once")
+    names = list(grid)
+    return [dict(zip(names, combo)) for combo in itertools.product(*(grid[name] for name in names))]
+
+
+def value_slug(value):
+    # 1.5 -> 1p5, -2 -> m2, "#FC6255" -> FC6255: sirf letters aur digits
+    text = str(value).replace(".", "p").replace("-", "m")
+    return re.sub(r"[^0-9A-Za-z]+", "", text)
+
+
+def values_digest(values):
+    return hashlib.sha1(repr(sorted(values.items())).encode("utf-8")).hexdigest()[:10]
+
+
+def variant_name(scene_name, values):
+    # ChampaPolar_K7, HiddenFiveReveal_FOLDS6_STAR_COLORFC6255
+    slug = "_".join(f"{name}{value_slug(value)}" for name, value in values.items())
+    name = f"{scene_name}_{slug}" if slug else scene_name
+    if len(name) > MAX_NAME_LENGTH:
+        name = f"{scene_name}_{values_digest(values)}"
+    return name
+
+
+def variant_names(scene_name, variants):
+    # Slug mein brackets/commas nahi bachte ((1, 35) aur (13, 5) dono "135"),
+    # toh takraane wale naamon ke peeche values ka hash - har movie file alag
+    names = [variant_name(scene_name, values) for values in variants]
+    counts = Counter(names)
+    return [
+        name if counts[name] == 1 else f"{name}_{values_digest(values)}"
+        for name, values in zip(names, variants)
+    ]
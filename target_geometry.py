@@ -0,0 +1,52 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import numpy as np
+
+# multi_target.py ke output targets: size aur crop, manim ke bina.
+# name: (pixel_width, pixel_height). Aspect ratio main frame se alag ho toh
+# frame ka beech wala hissa crop hota hai (vertical = 9:16 shorts cut).
+TARGET_PRESETS = {
+    "1080p": (1920, 1080),
+    "720p": (1280, 720),
+    "480p": (854, 480),
+    "vertical": (1080, 1920),
+    "square": (1080, 1080),
+}
+
+
+def even_size(pixels):
+    # yuv420p (libx264) ko width aur height dono even chahiye: odd ho toh ek pixel badha do
+    return max(2, pixels + pixels % 2)
+
+
+def parse_target(spec):
+    # "720p", "1080x1350" ya "1080x1920@1.5,0" (crop ka center, scene units mein)
+    spec, _, offset = spec.strip().partition("@")
+    if spec in TARGET_PRESETS:
+        width, height = TARGET_PRESETS[spec]
+    else:
+        try:
+            width, height = (int(value) for value in spec.lower().split("x"))
+        except ValueError:
+            raise ValueError(
+                f"Unknown output target {spec!r}; use WxH or one of {', '.join(TARGET_PRESETS)}"
+            ) from None
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Output target {spec!r} needs a positive width and height")
+    try:
+        x, y = (float(value) for value in offset.split(",")) if offset else (0.0, 0.0)
+    except ValueError:
+        raise ValueError(f"Crop center of {spec!r} must be x,y, got {offset!r}") from None
+    return spec, even_size(width), even_size(height), np.array([x, y, 0.0])
+
+
+def crop_frame(pixel_width, pixel_height, frame_width, frame_height):
+    # Main frame ke andar sabse bada hissa jiska aspect ratio target jaisa ho
+    aspect = pixel_width / pixel_height
+    if aspect <= frame_width / frame_height:
+        return frame_height * aspect, frame_height
+    return frame_width, frame_width / aspect
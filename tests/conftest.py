@@ -0,0 +1,11 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import sys
+from pathlib import Path
+
+# Modules repo ke root par hain (flat layout)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
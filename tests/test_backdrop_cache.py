@@ -0,0 +1,110 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import numpy as np
+
+from backdrop_cache import BackdropCache, camera_fingerprint, mobject_fingerprint
+
+
+class Mob:
+    # VMobject ke sirf woh attributes jo fingerprint padhta hai
+    def __init__(self, *submobjects):
+        self.points = np.array([[0.0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+        self.fill_rgbas = np.array([[0.0, 0, 0, 0]])
+        self.stroke_rgbas = np.array([[1.0, 1, 1, 1]])
+        self.stroke_width = 4
+        self.sheen_factor = 0.0
+        self.sheen_direction = np.array([-1.0, 1, 0])
+        self.z_index = 0
+        self.submobjects = list(submobjects)
+
+    def get_family(self):
+        family = [self]
+        for sub in self.submobjects:
+            family += sub.get_family()
+        return family
+
+
+class Camera:
+    def __init__(self):
+        self.background_color = "#000000"
+        self.background_opacity = 1
+        self.frame_center = np.zeros(3)
+        self.frame_width = 14.2
+        self.frame_height = 8.0
+        self.pixel_array = np.zeros((1080, 1920, 4), dtype=np.uint8)
+
+
+def test_fingerprint_is_stable():
+    mob = Mob()
+    assert mobject_fingerprint(mob) == mobject_fingerprint(mob)
+
+
+def test_point_color_and_z_index_change_the_fingerprint():
+    mob = Mob()
+    before = mobject_fingerprint(mob)
+    mob.points[2, 0] += 1e-6
+    assert mobject_fingerprint(mob) != before
+
+    before = mobject_fingerprint(mob)
+    mob.stroke_rgbas = np.array([[1.0, 0, 0, 1]])
+    assert mobject_fingerprint(mob) != before
+
+    before = mobject_fingerprint(mob)
+    mob.z_index = 1
+    assert mobject_fingerprint(mob) != before
+
+
+def test_submobject_change_changes_the_group_fingerprint():
+    # PolarPlane jaisa VGroup: khud ke points khaali, lines submobjects mein
+    line = Mob()
+    group = Mob(line)
+    group.points = np.zeros((0, 3))
+    before = mobject_fingerprint(group)
+    line.stroke_rgbas = np.array([[0.0, 0, 1, 1]])
+    assert mobject_fingerprint(group) != before
+
+
+def test_equal_copies_are_different_mobjects():
+    assert mobject_fingerprint(Mob()) != mobject_fingerprint(Mob())
+
+
+def test_camera_fingerprint_tracks_frame():
+    camera = Camera()
+    before = camera_fingerprint(camera)
+    camera.frame_center = np.array([0.5, 0, 0])
+    assert camera_fingerprint(camera) != before
+
+
+def test_prefix_match_reuses_cached_image():
+    plane, label, dot = Mob(), Mob(), Mob()
+    key = camera_fingerprint(Camera())
+    cache = BackdropCache()
+    first = [mobject_fingerprint(plane), mobject_fingerprint(label)]
+    assert cache.reusable(key, first) is None
+    image = np.ones((4, 4, 4), dtype=np.uint8)
+    cache.store(key, first, image, hit=False, seconds=0.2)
+
+    # Wahi backdrop + ek naya dot: cached image se shuru, sirf dot draw
+    second = first + [mobject_fingerprint(dot)]
+    assert cache.reusable(key, second) == 2
+    assert cache.image is image
+    cache.store(key, second, image, hit=True, seconds=0.05)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert np.isclose(cache.saved_seconds(), 0.15)
+
+
+def test_changed_layer_or_camera_misses():
+    plane, label = Mob(), Mob()
+    key = camera_fingerprint(Camera())
+    cache = BackdropCache()
+    cache.store(key, [mobject_fingerprint(plane), mobject_fingerprint(label)], np.ones(1), hit=False, seconds=0.1)
+
+    plane.z_index = 2
+    assert cache.reusable(key, [mobject_fingerprint(plane), mobject_fingerprint(label)]) is None
+    assert cache.reusable(key + 1, cache.fingerprints) is None
+    # Static list chhota ho gaya (label hata) toh bhi poora redraw
+    assert cache.reusable(key, cache.fingerprints[:1]) is None
@@ -0,0 +1,47 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import pytest
+
+from checkpoint_index import parse_range, plays_for_window
+
+# 30 fps: play 0 frames 0-29, play 1 frames 30-44, play 2 frames 45-89
+INDEX = {
+    "frame_rate": 30,
+    "plays": [{"time": 0.0}, {"time": 1.0}, {"time": 1.5}],
+    "end_time": 3.0,
+}
+
+
+@pytest.mark.parametrize("first, last, expected", [
+    (0, 90, (0, 2)),
+    (0, 30, (0, 0)),     # last frame play 1 ki pehli frame se pehle
+    (0, 31, (0, 1)),
+    (30, 31, (1, 1)),    # first frame theek play 1 ki shuruaat par
+    (29, 30, (0, 0)),
+    (44, 46, (1, 2)),
+    (45, 90, (2, 2)),
+    (89, 90, (2, 2)),
+])
+def test_window_maps_to_plays(first, last, expected):
+    assert plays_for_window(INDEX, first, last) == expected
+
+
+def test_zero_length_play_is_skipped():
+    # Do plays ek hi frame par shuru hon toh pehle wale mein koi frame nahi
+    index = dict(INDEX, plays=[{"time": 0.0}, {"time": 1.0}, {"time": 1.0}])
+    assert plays_for_window(index, 30, 40) == (2, 2)
+
+
+@pytest.mark.parametrize("first, last", [(-1, 10), (10, 10), (20, 10), (0, 91)])
+def test_window_outside_scene_raises(first, last):
+    with pytest.raises(ValueError, match="outside 0:90"):
+        plays_for_window(INDEX, first, last)
+
+
+def test_parse_range():
+    assert parse_range("12:13.5") == (12.0, 13.5)
+    assert parse_range("720:780", int) == (720, 780)
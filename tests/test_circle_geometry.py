@@ -0,0 +1,203 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import numpy as np
+import pytest
+
+from circle_geometry import (
+    CIRCLE_CURVES,
+    candidate_pairs,
+    circle_bezier_points,
+    circle_intersections,
+    dedupe_points,
+    n_fold_centers,
+    partial_bezier_blocks,
+    ring_polygon,
+    staggered_proportions,
+    star_cycles,
+    star_order,
+)
+
+
+def brute_force_intersections(centers, radii, tol=1e-6):
+    points = []
+    for a in range(len(centers)):
+        for b in range(a + 1, len(centers)):
+            delta = centers[b] - centers[a]
+            d = np.linalg.norm(delta)
+            if d <= tol or d > radii[a] + radii[b] + tol or d < abs(radii[a] - radii[b]) - tol:
+                continue
+            along = (radii[a] ** 2 - radii[b] ** 2 + d ** 2) / (2 * d)
+            h = np.sqrt(max(radii[a] ** 2 - along ** 2, 0))
+            base = centers[a] + along * delta / d
+            perp = np.array([-delta[1], delta[0]]) / d
+            points += [base + h * perp, base - h * perp]
+    return np.array(points).reshape(-1, 2)
+
+
+def assert_same_points(actual, expected, tol=1e-6):
+    assert len(actual) == len(expected)
+    distances = np.linalg.norm(actual[:, None, :2] - expected[None, :, :2], axis=2)
+    assert distances.min(axis=1).max() < tol
+    assert distances.min(axis=0).max() < tol
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_intersections_match_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(-5, 5, (40, 2))
+    radii = rng.choice([0.2, 1.0, 3.0, 9.0], 40) * rng.uniform(0.5, 1.5, 40)
+    expected = brute_force_intersections(centers, radii)
+    expected = dedupe_points(np.column_stack([expected, np.zeros(len(expected))]))
+    assert_same_points(circle_intersections(centers, radii), expected)
+
+
+def test_n_fold_intersections_are_symmetric():
+    centers = n_fold_centers(5, 1.2)
+    points = circle_intersections(centers, 2.0)
+    assert len(points) % 5 == 0
+    np.testing.assert_allclose(points[:, 2], 0)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_candidate_pairs_cover_every_touching_pair_once(seed):
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(-10, 10, (60, 2))
+    radii = rng.choice([0.1, 0.5, 2.0, 8.0], 60)
+    i, j = candidate_pairs(centers, radii)
+
+    pairs = {tuple(sorted(pair)) for pair in zip(i.tolist(), j.tolist())}
+    assert len(pairs) == len(i)
+    assert all(a != b for a, b in pairs)
+    d = np.linalg.norm(centers[:, None] - centers[None], axis=2)
+    touching = {(a, b) for a in range(60) for b in range(a + 1, 60) if d[a, b] <= radii[a] + radii[b]}
+    assert touching <= pairs
+
+
+def test_one_big_circle_keeps_candidates_near_linear():
+    # Pehle cell size sabse bade radius se tha: 10k circles -> ~5e7 pairs
+    rng = np.random.default_rng(0)
+    n = 10_000
+    centers = rng.uniform(0, 100, (n, 2))
+    radii = np.full(n, 0.5)
+    radii[0] = 50.0
+    i, _ = candidate_pairs(centers, radii)
+    assert len(i) < 20 * n
+
+
+def test_dedupe_merges_points_across_a_cell_boundary():
+    tol = 1e-6
+    # Dono points alag grid cells mein (round karne par bhi), par tol ke andar
+    points = np.array([[2.49e-6, 0, 0], [2.51e-6, 0, 0], [5.0, 5.0, 0]])
+    np.testing.assert_array_equal(dedupe_points(points, tol), points[[0, 2]])
+
+
+def test_dedupe_keeps_points_farther_than_tol():
+    points = np.array([[0.0, 0, 0], [3e-6, 0, 0], [0.0, 3e-6, 0]])
+    np.testing.assert_array_equal(dedupe_points(points, 1e-6), points)
+
+
+def test_star_order_five():
+    assert star_order(5, 2) == [0, 2, 4, 1, 3]
+
+
+@pytest.mark.parametrize("n, density, n_cycles", [(4, 2, 2), (6, 2, 2), (8, 2, 2), (6, 3, 3), (7, 2, 1), (8, 3, 1)])
+def test_star_cycles_visit_every_vertex_once(n, density, n_cycles):
+    cycles = star_cycles(n, density)
+    assert len(cycles) == n_cycles
+    for cycle in cycles:
+        # Koi cycle apne aap ko dohrata nahi (pehle [0, 2, 4, 0, 2, 4] aata tha)
+        assert len(set(cycle)) == len(cycle) == n // n_cycles
+    assert sorted(v for cycle in cycles for v in cycle) == list(range(n))
+
+
+@pytest.mark.parametrize("n", [4, 6, 8])
+def test_star_order_rejects_compound_stars(n):
+    with pytest.raises(ValueError):
+        star_order(n, 2)
+
+
+def test_star_cycles_reject_density_multiple_of_n():
+    with pytest.raises(ValueError):
+        star_cycles(5, 5)
+
+
+@pytest.mark.parametrize("folds", range(3, 10))
+def test_hidden_star_ring_exists_for_every_fold_count(folds):
+    # HiddenFiveReveal ki geometry: R = 2, centers R * 0.6 ki ring par
+    centers = n_fold_centers(folds, 1.2, np.pi / 2)
+    star_points = ring_polygon(circle_intersections(centers, 2.0), folds, start_angle=np.pi / 2)
+    assert len(star_points) == folds
+
+
+def reference_partial(block, proportion):
+    # Ek circle ke liye pointwise_become_partial(0, proportion): Bernstein
+    # form se split, baaki curves end point par collapse
+    curves = block.reshape(CIRCLE_CURVES, 4, -1).copy()
+    index, t = divmod(proportion * CIRCLE_CURVES, 1)
+    index = int(index)
+    if index == CIRCLE_CURVES:
+        index, t = CIRCLE_CURVES - 1, 1.0
+    p0, p1, p2, p3 = curves[index]
+    s = 1 - t
+    end = s ** 3 * p0 + 3 * s * s * t * p1 + 3 * s * t * t * p2 + t ** 3 * p3
+    curves[index] = [p0, s * p0 + t * p1, s * s * p0 + 2 * s * t * p1 + t * t * p2, end]
+    curves[index + 1:] = end
+    return curves.reshape(-1, block.shape[-1])
+
+
+PROPORTIONS = [0.0, 1e-9, 0.1, 0.125, 0.3, 0.5, 0.77, 0.999, 1.0]
+
+
+def rosette_points():
+    centers = n_fold_centers(len(PROPORTIONS), 1.5, 0.2)
+    return circle_bezier_points(centers, np.linspace(0.5, 1.5, len(PROPORTIONS)), start_angle=0.4)
+
+
+def test_partial_blocks_match_reference():
+    points = rosette_points()
+    partial = partial_bezier_blocks(points, PROPORTIONS)
+    blocks = points.reshape(len(PROPORTIONS), -1, 3)
+    for block, part, proportion in zip(blocks, partial.reshape(blocks.shape), PROPORTIONS):
+        np.testing.assert_allclose(part, reference_partial(block, proportion), atol=1e-12)
+
+
+def test_partial_blocks_ends():
+    points = rosette_points()
+    n = len(PROPORTIONS)
+    np.testing.assert_allclose(partial_bezier_blocks(points, np.ones(n)), points, atol=1e-12)
+    empty = partial_bezier_blocks(points, np.zeros(n)).reshape(n, -1, 3)
+    starts = points.reshape(n, -1, 3)[:, :1]
+    np.testing.assert_allclose(empty, np.broadcast_to(starts, empty.shape), atol=1e-12)
+    # Input array nahi badalta
+    np.testing.assert_array_equal(points, rosette_points())
+
+
+def test_partial_blocks_match_manim():
+    bezier = pytest.importorskip("manim.utils.bezier")
+    points = rosette_points()
+    partial = partial_bezier_blocks(points, PROPORTIONS).reshape(len(PROPORTIONS), CIRCLE_CURVES, 4, 3)
+    blocks = points.reshape(len(PROPORTIONS), CIRCLE_CURVES, 4, 3)
+    for block, part, proportion in zip(blocks, partial, PROPORTIONS):
+        index, residue = bezier.integer_interpolate(0, CIRCLE_CURVES, proportion)
+        expected = bezier.partial_bezier_points(block[index], 0, residue)
+        np.testing.assert_allclose(part[index], expected, atol=1e-12)
+        np.testing.assert_allclose(part[:index], block[:index], atol=1e-12)
+
+
+def test_staggered_proportions_calls_rate_func_once_per_value():
+    calls = []
+
+    def rate(t):
+        calls.append(t)
+        return t * t
+
+    # 40 members, lag 0.1: alpha 0.5 par kuch poore, kuch shuru bhi nahi hue
+    proportions = staggered_proportions(rate, 0.5, 40, 0.1)
+    full_length = 39 * 0.1 + 1
+    sub_alphas = np.clip(0.5 * full_length - np.arange(40) * 0.1, 0, 1)
+    np.testing.assert_allclose(proportions, sub_alphas ** 2)
+    assert len(calls) == len(np.unique(sub_alphas)) == 12
@@ -0,0 +1,116 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import pytest
+
+import draft_levels
+from draft_levels import (
+    DRAFT_ENV,
+    DRAFT_LEVELS,
+    MIN_DRAFT_SAMPLES,
+    draft_budget,
+    draft_level,
+    draft_resolution,
+    draft_sample_count,
+    escalate_draft_level,
+    glow_layer_indices,
+    reset_draft_level,
+    set_draft_level,
+)
+
+
+@pytest.fixture
+def budget(monkeypatch):
+    # Draft mode 40 ms/frame, har test naye level se
+    monkeypatch.setenv(DRAFT_ENV, "40")
+    reset_draft_level()
+    yield 40.0
+    reset_draft_level()
+
+
+@pytest.fixture
+def final(monkeypatch):
+    monkeypatch.delenv(DRAFT_ENV, raising=False)
+    reset_draft_level()
+    yield
+    reset_draft_level()
+
+
+@pytest.mark.parametrize("value, expected", [("", None), ("0", None), ("25", 25.0), ("yes", 40.0)])
+def test_budget_from_env(monkeypatch, value, expected):
+    monkeypatch.setenv(DRAFT_ENV, value)
+    assert draft_budget() == expected
+
+
+def test_final_render_is_untouched(final):
+    assert draft_level() == 0
+    assert list(glow_layer_indices(8)) == list(range(8))
+    assert draft_sample_count(500) == 500
+    assert draft_resolution((32, 32)) == (32, 32)
+
+
+def test_draft_starts_at_level_one(budget):
+    assert draft_level() == 1
+
+
+@pytest.mark.parametrize("level, layers, expected", [
+    (1, 8, [0, 4, 7]),
+    (2, 8, [0, 7]),
+    (3, 8, [0]),
+    (1, 3, [0, 1, 2]),
+    (1, 2, [0, 1]),
+])
+def test_glow_layer_indices(budget, level, layers, expected):
+    set_draft_level(level, "test")
+    assert list(glow_layer_indices(layers)) == expected
+
+
+@pytest.mark.parametrize("level, n_samples, expected", [
+    (1, 640, 320),
+    (3, 640, 80),
+    (3, 100, MIN_DRAFT_SAMPLES),
+    (1, 10, 10),     # minimum se kam kabhi badhta nahi
+])
+def test_draft_sample_count(budget, level, n_samples, expected):
+    set_draft_level(level, "test")
+    assert draft_sample_count(n_samples) == expected
+
+
+@pytest.mark.parametrize("level, resolution, expected", [
+    (1, (32, 32), (6, 6)),
+    (3, (32, 32), (3, 3)),
+    (2, (8, 2), (4, 2)),
+])
+def test_draft_resolution(budget, level, resolution, expected):
+    set_draft_level(level, "test")
+    assert draft_resolution(resolution) == expected
+
+
+def test_escalates_only_over_budget(budget):
+    escalate_draft_level([0.030, 0.035], play=0)
+    assert draft_level() == 1
+    escalate_draft_level([], play=1)
+    assert draft_level() == 1
+    escalate_draft_level([0.030, 0.060], play=2)
+    assert draft_level() == 2
+    for play in range(3, 10):
+        escalate_draft_level([0.5], play)
+    assert draft_level() == len(DRAFT_LEVELS) - 1
+
+
+def test_no_escalation_without_budget(final):
+    escalate_draft_level([10.0], play=0)
+    assert draft_level() == 0
+
+
+def test_reset_rereads_budget(monkeypatch, budget):
+    set_draft_level(3, "test")
+    glow_layer_indices(8)
+    assert draft_levels._logged
+    monkeypatch.delenv(DRAFT_ENV)
+    reset_draft_level()
+    assert draft_level() == 0
+    assert not draft_levels._logged
@@ -0,0 +1,78 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import logging
+import os
+import signal
+import sys
+
+import numpy as np
+import pytest
+
+from frame_ring import MIN_RING_SLOTS, RING_ENV, FrameRing, ring_slots
+
+needs_fork = pytest.mark.skipif(sys.platform == "win32", reason="FrameRing needs fork")
+
+SHAPE = (4, 5, 4)
+
+
+@pytest.fixture
+def ring():
+    ring = FrameRing(SHAPE, 3)
+    yield ring
+    ring.shutdown()
+
+
+@needs_fork
+def test_repeat_writes_the_frame_it_repeats(ring, tmp_path):
+    # Repeat ke baad producer turant agla frame draw karta hai - repeat kiya
+    # slot tab tak overwrite nahi hona chahiye
+    out = tmp_path / "frames.bin"
+    ring.open(["sh", "-c", f"cat > {out}"])
+    pixel_array, expected = ring.current, []
+    for i in range(40):
+        pixel_array[:] = i
+        pixel_array = ring.submit()
+        expected += [i] * (1 + i % 3)
+        for _ in range(i % 3):
+            ring.repeat()
+        pixel_array[:] = 255
+    assert ring.close() == 0
+    frames = np.fromfile(out, dtype=np.uint8).reshape(-1, *SHAPE)
+    assert [int(frame[0, 0, 0]) for frame in frames] == expected
+
+
+@needs_fork
+@pytest.mark.parametrize("command", [["sh", "-c", "exit 3"], ["/nonexistent/ffmpeg"]])
+def test_encoder_failure_raises_instead_of_hanging(ring, command):
+    ring.open(command)
+    with pytest.raises(RuntimeError):
+        for _ in range(1000):
+            ring.submit()
+        ring.close()
+
+
+@needs_fork
+def test_dead_encoder_process_raises(ring):
+    ring.open(["sh", "-c", "sleep 30"])
+    os.kill(ring.process.pid, signal.SIGKILL)
+    with pytest.raises(RuntimeError, match="died|exited"):
+        for _ in range(10):
+            ring.submit()
+
+
+@pytest.mark.parametrize("value, slots", [("", 0), ("0", 0), ("8", 8), (" 3 ", 3)])
+def test_ring_slots(monkeypatch, value, slots):
+    monkeypatch.setenv(RING_ENV, value)
+    assert ring_slots() == slots
+
+
+@pytest.mark.parametrize("value, message", [(str(MIN_RING_SLOTS - 1), "below the minimum"), ("-1", "below the minimum"), ("many", "not a slot count")])
+def test_bad_ring_slots_warn(monkeypatch, caplog, value, message):
+    monkeypatch.setenv(RING_ENV, value)
+    with caplog.at_level(logging.WARNING, logger="manim"):
+        assert ring_slots() == 0
+    assert message in caplog.text
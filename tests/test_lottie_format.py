@@ -0,0 +1,55 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import numpy as np
+import pytest
+
+from circle_geometry import circle_bezier_points
+from lottie_format import DECIMALS, animated, dedupe, lottie_path
+
+# Handle = rounded vertex + rounded tangent, dono mein aadha last digit
+TOLERANCE = 10.0 ** -DECIMALS + 1e-9
+
+
+def bezier_points(path):
+    # Lottie path -> manim jaise 4 points per cubic
+    vertices, ins, outs = (np.array(path[key]) for key in ("v", "i", "o"))
+    n_curves = len(vertices) if path["c"] else len(vertices) - 1
+    points = []
+    for k in range(n_curves):
+        end = (k + 1) % len(vertices)
+        points += [vertices[k], vertices[k] + outs[k], vertices[end] + ins[end], vertices[end]]
+    return np.array(points)
+
+
+def test_closed_circle_round_trips():
+    points = circle_bezier_points([[3.0, -2.0, 0.0]], 2.5)[:, :2] * 100
+    path = lottie_path(points, closed=True)
+    assert path["c"] is True
+    assert len(path["v"]) == len(points) // 4
+    np.testing.assert_allclose(bezier_points(path), points, atol=TOLERANCE)
+
+
+def test_open_path_round_trips():
+    rng = np.random.default_rng(0)
+    points = rng.uniform(0, 500, (12, 2))
+    # Lagataar curves: har curve ka end agle ka start
+    points[4::4] = points[3:-1:4]
+    path = lottie_path(points, closed=False)
+    assert len(path["v"]) == 4
+    np.testing.assert_allclose(bezier_points(path), points, atol=TOLERANCE)
+
+
+@pytest.mark.parametrize("keys, expected", [
+    ([(0, 1.0)], {"a": 0, "k": 1.0}),
+    ([(0, 1.0), (5, 2.0)], {"a": 1, "k": [{"t": 0, "s": [1.0], "h": 1}, {"t": 5, "s": [2.0], "h": 1}]}),
+])
+def test_animated_holds_keyframes(keys, expected):
+    assert animated(keys) == expected
+
+
+def test_dedupe_keeps_only_changes():
+    assert dedupe([(0, "a"), (1, "a"), (2, "b"), (3, "b"), (4, "a")]) == [(0, "a"), (2, "b"), (4, "a")]
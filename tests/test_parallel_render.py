@@ -0,0 +1,49 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import shutil
+
+import pytest
+
+pytest.importorskip("manim")
+
+from parallel_render import render_segment, segment_ranges
+
+TWO_PLAYS = '''
+from manim import *
+
+from nature_renderer import NatureRenderer
+
+
+class TwoPlays(Scene):
+    def __init__(self, renderer=None, **kwargs):
+        super().__init__(renderer=renderer or NatureRenderer(), **kwargs)
+
+    def construct(self):
+        dot = Dot()
+        self.play(FadeIn(dot), run_time=0.2)
+        self.play(dot.animate.shift(RIGHT), run_time=0.2)
+'''
+
+
+def test_segment_ranges_cover_every_play_once():
+    assert segment_ranges(2, 1) == [(0, 0), (1, 1)]
+    assert segment_ranges(5, 2) == [(0, 1), (2, 3), (4, 4)]
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="needs ffmpeg")
+def test_two_play_scene_gives_two_partial_files(tmp_path):
+    # Segment (0, 0) pehle poora scene render karta tha (upto = 0 = no limit)
+    scene_file = tmp_path / "two_plays.py"
+    scene_file.write_text(TWO_PLAYS, encoding="utf-8")
+    overrides = {"media_dir": str(tmp_path / "media"), "quality": "low_quality", "disable_caching": True}
+
+    partial_files = []
+    for first, last in segment_ranges(2, 1):
+        files, _, _, _ = render_segment(str(scene_file), "TwoPlays", first, last, overrides)
+        assert len(files) == 1
+        partial_files += files
+    assert len(set(partial_files)) == 2
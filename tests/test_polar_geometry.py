@@ -0,0 +1,82 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import numpy as np
+import pytest
+
+from polar_geometry import (
+    MIN_SAMPLES,
+    SAMPLES_PER_PERIOD,
+    TAU,
+    catmull_rom_bezier_points,
+    rose_bezier_points,
+    rose_sample_count,
+    theta_grid,
+)
+
+
+@pytest.mark.parametrize("k", [0, 0.5, 1, 2])
+def test_sample_count_never_below_minimum(k):
+    assert rose_sample_count(k) == MIN_SAMPLES
+
+
+@pytest.mark.parametrize("k", [3, 5, 7.5, -7.5, 12])
+def test_sample_count_grows_with_petals(k):
+    n = rose_sample_count(k)
+    assert n == int(np.ceil(SAMPLES_PER_PERIOD * abs(k)))
+    assert n >= MIN_SAMPLES
+
+
+def test_sample_count_scales_with_range():
+    assert rose_sample_count(8, (0, 2 * TAU)) == 2 * rose_sample_count(8)
+    assert rose_sample_count(8, (TAU, 0)) == rose_sample_count(8)
+
+
+def test_catmull_rom_passes_through_samples():
+    rng = np.random.default_rng(5)
+    samples = rng.normal(size=(12, 3))
+    points = catmull_rom_bezier_points(samples)
+    assert points.shape == (4 * 9, 3)
+    # Har curve samples[i] se samples[i+1] tak, pehla aur aakhri sirf anchor ke padosi
+    np.testing.assert_array_equal(points[0::4], samples[1:-2])
+    np.testing.assert_array_equal(points[3::4], samples[2:-1])
+    # Lagataar curves: ek ka end agle ka start
+    np.testing.assert_array_equal(points[3:-4:4], points[4::4])
+
+
+@pytest.mark.parametrize("k, amplitude", [(1, 1.0), (2, 2.0), (5, 1.5), (2.5, 3.0)])
+def test_rose_points_lie_on_rose(k, amplitude):
+    points = rose_bezier_points(k, amplitude)
+    nodes = theta_grid(k=k)[1:-1]
+    r = amplitude * np.cos(k * nodes)
+    expected = np.column_stack([r * np.cos(nodes), r * np.sin(nodes), np.zeros_like(r)])
+    anchors = np.vstack([points[0::4], points[-1:]])
+    np.testing.assert_allclose(anchors, expected, atol=1e-12)
+
+    # Nodes ke beech bhi curve rose ke kaafi paas rehta hai
+    a, b, c, d = points[0::4], points[1::4], points[2::4], points[3::4]
+    middle = (a + 3 * b + 3 * c + d) / 8
+    mid_theta = (nodes[:-1] + nodes[1:]) / 2
+    r = amplitude * np.cos(k * mid_theta)
+    expected = np.column_stack([r * np.cos(mid_theta), r * np.sin(mid_theta)])
+    assert np.abs(middle[:, :2] - expected).max() < 1e-4 * amplitude
+
+
+def test_closed_rose_ends_where_it_starts():
+    points = rose_bezier_points(3, 2.0)
+    np.testing.assert_allclose(points[0], points[-1], atol=1e-12)
+
+
+def test_cache_hands_out_copies():
+    first = rose_bezier_points(4, 1.0)
+    fresh = first.copy()
+    first[:] = 99.0
+    again = rose_bezier_points(4, 1.0)
+    assert again is not first
+    assert again.flags.writeable
+    np.testing.assert_array_equal(again, fresh)
+    again += 1
+    np.testing.assert_array_equal(rose_bezier_points(4, 1.0), fresh)
@@ -0,0 +1,97 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import logging
+
+from render_daemon import ROOT, discover_scenes, scene_imports, warm_imports, warm_step
+
+SCENES = {
+    "flowers.py": '''
+from manim import *
+import numpy as np
+from rose_curve import rose_curve
+
+
+class Champa(Scene):
+    pass
+
+
+class Helper:
+    pass
+
+
+class FancyChampa(Champa):
+    pass
+
+
+class Orbit(manim.ThreeDScene):
+    pass
+''',
+    # Bina extension wali scene file ("Nature Decode" jaisi)
+    "Nature Draft": '''
+import os.path
+from . import sibling
+from glow import GlowStroke
+
+
+class Draft(MovingCameraScene):
+    pass
+''',
+    "broken.py": "class Broken(Scene)\n    pass\n",
+    "notes.txt": "class Text(Scene):\n    pass\n",
+}
+
+
+def write_scenes(root):
+    for name, source in SCENES.items():
+        (root / name).write_text(source, encoding="utf-8")
+    (root / "folder.py").mkdir()
+
+
+def test_discover_scenes(tmp_path):
+    write_scenes(tmp_path)
+    scenes = discover_scenes(tmp_path)
+    assert scenes == {
+        "Champa": tmp_path / "flowers.py",
+        "FancyChampa": tmp_path / "flowers.py",
+        "Orbit": tmp_path / "flowers.py",
+        "Draft": tmp_path / "Nature Draft",
+    }
+
+
+def test_scene_imports(tmp_path):
+    write_scenes(tmp_path)
+    files = [tmp_path / "flowers.py", tmp_path / "Nature Draft", tmp_path / "flowers.py"]
+    assert scene_imports(files) == ["glow", "manim", "numpy", "os", "rose_curve"]
+
+
+def test_scene_imports_skip_unparsable_files(tmp_path):
+    write_scenes(tmp_path)
+    assert scene_imports([tmp_path / "broken.py", tmp_path / "missing.py"]) == []
+
+
+def test_repo_scenes_are_found():
+    scenes = discover_scenes(ROOT)
+    assert scenes["ChampaPolar"].name == "Nature Decode"
+    assert scenes["HiddenFiveReveal"].name == "hidden_five_reveal.py"
+
+
+def test_warm_step_logs_and_continues(caplog):
+    def fail():
+        raise RuntimeError("no latex")
+
+    with caplog.at_level(logging.WARNING, logger="manim"):
+        assert warm_step("TeX labels", fail) is False
+        assert warm_step("nothing", lambda: None) is True
+    assert "TeX labels failed (RuntimeError: no latex)" in caplog.text
+
+
+def test_warm_imports_report_failures(tmp_path, caplog):
+    scene = tmp_path / "scene.py"
+    scene.write_text("import json\nimport no_such_module_for_warm_up\n", encoding="utf-8")
+    with caplog.at_level(logging.WARNING, logger="manim"):
+        assert warm_imports([scene]) == ["no_such_module_for_warm_up"]
+    assert "import no_such_module_for_warm_up failed" in caplog.text
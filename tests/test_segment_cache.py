@@ -0,0 +1,87 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import os
+from pathlib import Path
+
+from segment_cache import evict_render_cache, incoming_path, segment_name
+
+KEY = "0123456789abcdef"
+
+
+def make_segment(cache_dir, n, size=100, mtime=None):
+    path = cache_dir / segment_name(f"{n}_{n + 1}_{n + 2}", KEY, ".mp4")
+    path.write_bytes(b"x" * size)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_oldest_segments_go_first(tmp_path):
+    # Banne ke order se ulta mtime: sabse naya pehle bana
+    paths = [make_segment(tmp_path, n, mtime=1000 - n) for n in range(5)]
+    assert evict_render_cache(tmp_path, 300) == 2
+    assert [path.exists() for path in paths] == [True, True, True, False, False]
+
+
+def test_byte_cap(tmp_path):
+    for n in range(10):
+        make_segment(tmp_path, n, size=1000, mtime=n)
+    assert evict_render_cache(tmp_path, 10_000) == 0
+    assert evict_render_cache(tmp_path, 4_500) == 6
+    assert sum(path.stat().st_size for path in tmp_path.iterdir()) == 4_000
+
+
+def test_keep_set_survives(tmp_path):
+    paths = [make_segment(tmp_path, n, mtime=n) for n in range(4)]
+    # Sabse purane do abhi ke render mein use ho rahe hain
+    assert evict_render_cache(tmp_path, 200, keep=[str(paths[0]), paths[1], None]) == 2
+    assert [path.exists() for path in paths] == [True, True, False, False]
+
+
+def test_only_segment_files_are_evicted(tmp_path):
+    user_file = tmp_path / "notes.txt"
+    user_file.write_bytes(b"y" * 10_000)
+    os.utime(user_file, (0, 0))
+    stray_mp4 = tmp_path / "final_render.mp4"
+    stray_mp4.write_bytes(b"y" * 10_000)
+    os.utime(stray_mp4, (0, 0))
+    segment = make_segment(tmp_path, 1, mtime=10)
+    assert evict_render_cache(tmp_path, 0) == 1
+    assert user_file.exists() and stray_mp4.exists()
+    assert not segment.exists()
+
+
+def test_file_removed_by_another_worker(tmp_path, monkeypatch):
+    paths = [make_segment(tmp_path, n, mtime=n) for n in range(3)]
+    unlink = Path.unlink
+
+    def racing_unlink(self, *args, **kwargs):
+        # Doosra worker pehle hi hata chuka
+        os.remove(self)
+        return unlink(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "unlink", racing_unlink)
+    assert evict_render_cache(tmp_path, 100) == 0
+    assert [path.exists() for path in paths] == [False, False, True]
+
+
+def test_concurrent_writers_commit_whole_files(tmp_path):
+    final_path = tmp_path / segment_name("1_2_3", KEY, ".mp4")
+    first = incoming_path(final_path, pid=101)
+    second = incoming_path(final_path, pid=202)
+    assert first != second
+    assert first.parent == second.parent == tmp_path / "incoming"
+
+    first.write_bytes(b"a" * 500)
+    second.write_bytes(b"b" * 300)
+    # Eviction adhoori (incoming) files ko nahi dekhta
+    assert evict_render_cache(tmp_path, 0) == 0
+    os.replace(first, final_path)
+    assert final_path.read_bytes() == b"a" * 500
+    os.replace(second, final_path)
+    assert final_path.read_bytes() == b"b" * 300
+    assert list((tmp_path / "incoming").iterdir()) == []
@@ -0,0 +1,50 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import numpy as np
+import pytest
+
+from shrine_geometry import LOD_SEGMENTS, SHRINE_RADIUS, lod_levels, shrine_draw_list, shrine_mesh
+
+
+def test_lod_thresholds():
+    sizes = [1000, 200, 199.9, 60, 59.9, 20, 19.9, 0]
+    assert lod_levels(sizes).tolist() == [0, 0, 1, 1, 2, 2, 3, 3]
+
+
+def test_shrine_mesh_sizes():
+    for segments in LOD_SEGMENTS:
+        faces, normals, parts = shrine_mesh(segments)
+        assert faces.shape == (6 + segments, 4, 3)
+        assert np.allclose(np.linalg.norm(normals, axis=1), 1)
+        assert (parts == 1).sum() == segments
+
+
+def draw(scales, lod_bias=0, bases=None, focal_distance=np.inf):
+    # Seedha upar se dekhta camera; scale 1 wala shrine 1000 pixels ka
+    bases = np.zeros((len(scales), 3)) if bases is None else bases
+    return shrine_draw_list(
+        bases, scales, np.eye(3), np.zeros(3), focal_distance,
+        1000 / (2 * SHRINE_RADIUS), np.array([-10.0, 10.0, 10.0]), lod_bias=lod_bias,
+    )
+
+
+@pytest.mark.parametrize("lod_bias, expected", [(0, [0, 1, 2, 3]), (1, [1, 2, 3, 3]), (5, [3, 3, 3, 3])])
+def test_lod_bias_is_clamped_to_coarsest_level(lod_bias, expected):
+    _, _, _, levels = draw([1.0, 0.1, 0.03, 0.01], lod_bias)
+    assert levels.tolist() == expected
+
+
+def test_perspective_makes_near_shrines_finer():
+    bases = np.array([[0.0, 0.0, 0.0], [3.0, 0.0, 3.0]])
+    _, _, _, levels = draw([0.1, 0.1], bases=bases, focal_distance=5.0)
+    assert levels.tolist() == [1, 0]
+
+
+def test_zero_scale_shrines_draw_nothing():
+    faces, normals, shade, levels = draw([0.0, 0.0])
+    assert faces.shape == (0, 4, 3) and normals.shape == (0, 3) and shade.shape == (0,)
+    assert len(levels) == 2
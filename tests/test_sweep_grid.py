@@ -0,0 +1,115 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import math
+import re
+
+import pytest
+
+from sweep_grid import (
+    MAX_NAME_LENGTH,
+    parameter_grid,
+    parse_values,
+    scene_parameters,
+    variant_name,
+    variant_names,
+)
+
+# manim ke naamon ki jagah (sweep.py vars(manim) deta hai)
+NAMES = {"PI": math.pi, "TAU": 2 * math.pi, "BLUE": "#58C4DD", "RED": "#FC6255"}
+
+
+class BaseScene:
+    R = 2
+    COLORS = ("#FFFFFF",)
+    helper = "not a parameter"
+
+
+class RoseScene(BaseScene):
+    K = 5
+    R = 3
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("5", [5]),
+    ("3,5,7", [3, 5, 7]),
+    ("-1, 2.5", [-1, 2.5]),
+    ("[(1, 3, 5), (1, 5, 9)]", [(1, 3, 5), (1, 5, 9)]),
+    ("'a','b'", ["a", "b"]),
+    ("BLUE,RED", ["#58C4DD", "#FC6255"]),
+    ("PI/2", [math.pi / 2]),
+    ("PI/2, 2*TAU/5, -PI", [math.pi / 2, 2 * math.tau / 5, -math.pi]),
+    ("[(BLUE, RED)]", [("#58C4DD", "#FC6255")]),
+])
+def test_parse_values(text, expected):
+    assert parse_values(text, NAMES) == expected
+
+
+def test_non_literals_stay_strings():
+    assert parse_values("#FC6255,#FFFFFF", NAMES) == ["#FC6255", "#FFFFFF"]
+    assert parse_values("GOLDISH,3", NAMES) == ["GOLDISH", 3]
+    # Function calls kabhi evaluate nahi hote
+    assert parse_values("__import__('os')", NAMES) == ["__import__('os')"]
+
+
+@pytest.mark.parametrize("text", ["", " ", "3,,5", ",3"])
+def test_empty_values_are_rejected(text):
+    with pytest.raises(ValueError):
+        parse_values(text, NAMES)
+
+
+def test_scene_parameters_parent_first():
+    assert scene_parameters(RoseScene) == {"R": 3, "COLORS": ("#FFFFFF",), "K": 5}
+
+
+def test_parameter_grid_is_cartesian():
+    grid = parameter_grid(RoseScene, {"K": [3, 5], "R": [1, 2, 3]})
+    assert len(grid) == 6
+    assert grid[0] == {"K": 3, "R": 1}
+    assert grid[-1] == {"K": 5, "R": 3}
+
+
+@pytest.mark.parametrize("grid, message", [
+    ({"N": [1]}, "has no parameter"),
+    ({"K": []}, "non-empty list"),
+    ({"K": 5}, "non-empty list"),
+    ({"K": [3, 3]}, "more than once"),
+])
+def test_parameter_grid_rejects_bad_input(grid, message):
+    with pytest.raises(ValueError, match=message):
+        parameter_grid(RoseScene, grid)
+
+
+def test_variant_name_is_readable():
+    assert variant_name("ChampaPolar", {"K": 7}) == "ChampaPolar_K7"
+    assert variant_name("HiddenFiveReveal", {"FOLDS": 6, "STAR_COLOR": "#FC6255"}) == (
+        "HiddenFiveReveal_FOLDS6_STAR_COLORFC6255"
+    )
+    assert variant_name("ChampaPolar", {"K": 1.5}) == "ChampaPolar_K1p5"
+    assert variant_name("ChampaPolar", {"K": -2}) == "ChampaPolar_Km2"
+    assert variant_name("ChampaPolar", {}) == "ChampaPolar"
+
+
+def test_variant_names_are_unique_and_filesystem_safe():
+    grid = {
+        "K": [1.5, 15, -15, 1, 2.5],
+        "COLORS": [("#FFF", "#000"), "#FFF#000", [(1, 35)], [(13, 5)], "a/b\\c:*?"],
+    }
+    variants = parameter_grid(RoseScene, grid)
+    names = variant_names("RoseScene", variants)
+    assert len(set(names)) == len(variants) == 25
+    for name in names:
+        assert re.fullmatch(r"[0-9A-Za-z_]+", name)
+        assert len(name) <= MAX_NAME_LENGTH + 11
+    # Takraav na ho toh naam waisa hi
+    assert variant_names("RoseScene", [{"K": 3}, {"K": 5}]) == ["RoseScene_K3", "RoseScene_K5"]
+
+
+def test_long_names_fall_back_to_digest():
+    values = {"COLORS": tuple(f"#{n:06X}" for n in range(20))}
+    name = variant_name("PatternOfFive", values)
+    assert re.fullmatch(r"PatternOfFive_[0-9a-f]{10}", name)
+    assert name == variant_name("PatternOfFive", dict(values))
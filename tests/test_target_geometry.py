@@ -0,0 +1,69 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import numpy as np
+import pytest
+
+from target_geometry import TARGET_PRESETS, crop_frame, even_size, parse_target
+
+# manim ka default 16:9 frame
+FRAME_WIDTH, FRAME_HEIGHT = 8.0 * 16 / 9, 8.0
+
+
+@pytest.mark.parametrize("name", sorted(TARGET_PRESETS))
+def test_presets_are_even(name):
+    _, width, height, offset = parse_target(name)
+    assert (width, height) == TARGET_PRESETS[name]
+    assert width % 2 == 0 and height % 2 == 0
+    np.testing.assert_array_equal(offset, [0, 0, 0])
+
+
+@pytest.mark.parametrize("spec, size", [
+    ("1080x1350", (1080, 1350)),
+    ("1081x1921", (1082, 1922)),
+    ("853X479", (854, 480)),
+    ("1x1", (2, 2)),
+])
+def test_custom_sizes_round_to_even(spec, size):
+    assert parse_target(spec)[1:3] == size
+
+
+def test_crop_center():
+    name, width, height, offset = parse_target(" vertical@1.5,-0.25 ")
+    assert (name, width, height) == ("vertical", 1080, 1920)
+    np.testing.assert_array_equal(offset, [1.5, -0.25, 0])
+
+
+@pytest.mark.parametrize("spec", ["4k", "1080", "0x720", "-2x720", "1080x1920@1.5", "720p@a,b"])
+def test_bad_targets(spec):
+    with pytest.raises(ValueError):
+        parse_target(spec)
+
+
+def test_even_size():
+    assert [even_size(n) for n in (0, 1, 2, 3, 853, 854, 855)] == [2, 2, 2, 4, 854, 854, 856]
+
+
+def test_vertical_crop_from_landscape():
+    # 9:16 from 16:9: poori height, beech ki patli patti
+    width, height = crop_frame(1080, 1920, FRAME_WIDTH, FRAME_HEIGHT)
+    assert height == FRAME_HEIGHT
+    assert np.isclose(width, FRAME_HEIGHT * 9 / 16)
+
+
+@pytest.mark.parametrize("pixels", [(1920, 1080), (1280, 720), (854, 480), (1080, 1080), (1080, 1350), (2560, 1080)])
+def test_crop_fits_frame_with_target_aspect(pixels):
+    width, height = crop_frame(*pixels, FRAME_WIDTH, FRAME_HEIGHT)
+    assert np.isclose(width / height, pixels[0] / pixels[1])
+    assert width <= FRAME_WIDTH + 1e-12 and height <= FRAME_HEIGHT + 1e-12
+    # Sabse bada: ek dimension poora frame
+    assert np.isclose(width, FRAME_WIDTH) or np.isclose(height, FRAME_HEIGHT)
+
+
+def test_crop_from_portrait_frame():
+    width, height = crop_frame(1920, 1080, 4.5, 8.0)
+    assert width == 4.5
+    assert np.isclose(height, 4.5 * 9 / 16)
@@ -0,0 +1,108 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import importlib
+import os
+import sys
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from manim import *
+
+# Compiled TeX (SVG) manim ke tex_dir mein content-hash ke naam se save hota hai.
+# Yeh env variable set ho toh saare scenes aur render workers ek hi folder
+# share karte hain - ek baar compile, phir kabhi TeX subprocess nahi.
+TEX_DIR_ENV = "NATURE_TEX_DIR"
+if os.environ.get(TEX_DIR_ENV):
+    config.tex_dir = os.environ[TEX_DIR_ENV]
+
+# Process ke andar: same string dobara aaye toh SVG parse bhi nahi,
+# sirf dict lookup + copy
+TEX_CACHE_SIZE = 256
+_tex_templates = OrderedDict()
+
+# Scenes mein use hone wale saare labels (warm-up inhe pehle hi compile karta hai)
+WARMUP_TEX = [
+    (r"r = \cos(5\theta)",),
+    (r"r = \cos(", "n", r"\theta)"),
+    *[(f"n = {n}",) for n in range(10)],
+]
+
+# Scenes ke woh mobjects jo andar hi andar MathTex banate hain (jaise
+# PolarPlane.add_coordinates ke degree / radius labels): "module:function",
+# warm-up inhe ek baar bana deta hai
+WARMUP_BUILDERS = [
+    "odd_symmetry:polar_plane",
+]
+
+
+@contextmanager
+def tex_dir_lock():
+    # Kai render workers ek hi tex_dir share karte hain: ek waqt par ek hi
+    # process compile kare, taaki koi aadha likha SVG na padhe
+    tex_dir = config.get_dir("tex_dir")
+    tex_dir.mkdir(parents=True, exist_ok=True)
+    with open(tex_dir / ".nature_tex.lock", "a+b") as fp:
+        if fcntl is not None:
+            fcntl.flock(fp, fcntl.LOCK_EX)
+        else:
+            fp.seek(0)
+            msvcrt.locking(fp.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fp, fcntl.LOCK_UN)
+            else:
+                fp.seek(0)
+                msvcrt.locking(fp.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def cached_math_tex(*tex_strings, **kwargs):
+    key = (tex_strings, tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+    template = _tex_templates.get(key)
+    if template is None:
+        with tex_dir_lock():
+            template = MathTex(*tex_strings, **kwargs)
+        _tex_templates[key] = template
+        if len(_tex_templates) > TEX_CACHE_SIZE:
+            _tex_templates.popitem(last=False)
+    else:
+        _tex_templates.move_to_end(key)
+    return template.copy()
+
+
+def warm_up(labels=WARMUP_TEX, builders=WARMUP_BUILDERS):
+    # Har label aur builder ek baar banao: jo SVG pehle se tex_dir mein hai
+    # woh compile nahi hota, baaki ab ho jayenge. Poora warm-up lock ke
+    # andar - doosre workers ruk kar bane hue SVGs hi padhte hain.
+    tex_dir = config.get_dir("tex_dir")
+    with tex_dir_lock():
+        before = set(tex_dir.glob("*.svg"))
+        for tex_strings in labels:
+            key = (tex_strings, ())
+            if key not in _tex_templates:
+                _tex_templates[key] = MathTex(*tex_strings)
+        for builder in builders:
+            module_name, _, function = builder.partition(":")
+            getattr(importlib.import_module(module_name), function)()
+        compiled = len(set(tex_dir.glob("*.svg")) - before)
+    logger.info(
+        "TeX cache warm: %(labels)d labels, %(builders)d builders, %(compiled)d new SVGs compiled in %(dir)s",
+        {"labels": len(labels), "builders": len(builders), "compiled": compiled, "dir": tex_dir},
+    )
+    return compiled
+
+
+if __name__ == "__main__":
+    # python tex_cache.py ["extra label" ...]
+    warm_up(WARMUP_TEX + [(label,) for label in sys.argv[1:]])
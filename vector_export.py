@@ -0,0 +1,292 @@
+"""
+Project:  Nature Decode / Nature Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from manim import *
+import numpy as np
+
+from lottie_format import DECIMALS, EMPTY_PATH, animated, dedupe, lottie_path, rounded, static_transform
+
+# python vector_export.py odd_symmetry.py OddNumberSymmetry -q h
+# -> media/vector/OddNumberSymmetry.json (Lottie; lottie-web / LottieFiles player)
+#
+# Scene normal chalta hai, par koi pixel kaam nahi: har frame par har VMobject
+# ke projected bezier paths aur style record hote hain, aur sirf badli hui
+# values keyframe banti hain (hold keyframes, toh frozen waits aur static
+# backdrop ek hi keyframe). Har mobject (ya GlowPath / CircleRosette ka har
+# stroke pass) ek shape layer hai. Sheen / gradients ki jagah pehla rang;
+# ShrineInstances ke mesh aur images vector mein nahi aate (log hota hai).
+LOTTIE_VERSION = "5.7.4"
+
+
+class VectorTrack:
+    # Ek shape layer: paths, stroke, fill - har property ke delta keyframes
+    def __init__(self, name, first_frame, mobject):
+        self.name = name
+        self.first_frame = first_frame
+        # Reference rakhna zaroori: id() dobara use na ho
+        self.mobject = mobject
+        self.keys = {name: [] for name in ("paths", "stroke", "stroke_opacity", "width", "fill", "fill_opacity", "visible")}
+        self.n_paths = 0
+        self.has_fill = False
+
+    def set(self, prop, frame, value):
+        keys = self.keys[prop]
+        if not keys or keys[-1][1] != value:
+            keys.append((frame, value))
+
+    def to_layer(self, index, n_frames):
+        path_slots = [
+            dedupe([(frame, paths[j] if j < len(paths) else EMPTY_PATH) for frame, paths in self.keys["paths"]])
+            for j in range(self.n_paths)
+        ]
+        items = [{"ty": "sh", "ks": animated(keys)} for keys in path_slots]
+        # Lottie mein pehla item upar: stroke fill ke upar (manim jaisa)
+        items.append({
+            "ty": "st",
+            "c": animated(self.keys["stroke"], wrap=False),
+            "o": animated(self.keys["stroke_opacity"]),
+            "w": animated(self.keys["width"]),
+            "lc": 1,
+            "lj": 1,
+            "ml": 4,
+        })
+        if self.has_fill:
+            items.append({
+                "ty": "fl",
+                "c": animated(self.keys["fill"], wrap=False),
+                "o": animated(self.keys["fill_opacity"]),
+                "r": 1,
+            })
+        items.append({"ty": "tr", **static_transform(two_d=True)})
+
+        transform = static_transform()
+        transform["o"] = animated([(frame, 100 if visible else 0) for frame, visible in self.keys["visible"]])
+        return {
+            "ddd": 0,
+            "ind": index,
+            "ty": 4,
+            "nm": self.name,
+            "sr": 1,
+            "ks": transform,
+            "ao": 0,
+            "shapes": [{"ty": "gr", "nm": self.name, "it": items}],
+            "ip": self.first_frame,
+            "op": n_frames,
+            "st": 0,
+            "bm": 0,
+        }
+
+
+class VectorRecorder:
+    def __init__(self, scene_name, pixel_width, pixel_height, frame_rate):
+        self.scene_name = scene_name
+        self.pixel_width = pixel_width
+        self.pixel_height = pixel_height
+        self.frame_rate = frame_rate
+        self.tracks = {}
+        self.n_frames = 0
+        self.background = None
+        self.skipped = set()
+
+    def to_pixels(self, camera, mobject, points):
+        # 3D camera: project_points frame center khud hatata hai; 2D mein hum
+        points = camera.transform_points_pre_display(mobject, points)
+        if not isinstance(camera, ThreeDCamera):
+            points = points - camera.frame_center
+        scale = self.pixel_width / camera.frame_width
+        return np.column_stack([
+            self.pixel_width / 2 + scale * points[:, 0],
+            self.pixel_height / 2 - scale * points[:, 1],
+        ])
+
+    def path_shapes(self, camera, mobject, subpaths):
+        subpaths = [np.asarray(points) for points in subpaths if len(points) >= 4]
+        if not subpaths:
+            return []
+        # Saare subpaths ek hi projection call mein
+        flat = self.to_pixels(camera, mobject, np.concatenate(subpaths))
+        splits = np.cumsum([len(points) for points in subpaths])[:-1]
+        return [
+            lottie_path(pixels, bool(np.allclose(points[0], points[-1])))
+            for points, pixels in zip(subpaths, np.split(flat, splits))
+        ]
+
+    def items(self, camera, mobject):
+        # (paths, stroke rgba, width, fill rgba ya None)
+        if not isinstance(mobject, VMobject) or hasattr(mobject, "get_mesh_faces"):
+            self.skipped.add(type(mobject).__name__)
+            return []
+        width_scale = camera.cairo_line_width_multiple * self.pixel_width / camera.frame_width
+        if hasattr(mobject, "get_stroke_passes"):
+            return [
+                (self.path_shapes(camera, mobject, subpaths), np.atleast_2d(rgba)[0], width * width_scale, None)
+                for subpaths, rgba, width in mobject.get_stroke_passes()
+            ]
+        return [(
+            self.path_shapes(camera, mobject, mobject.get_subpaths()),
+            mobject.get_stroke_rgbas()[0],
+            mobject.get_stroke_width() * width_scale,
+            mobject.get_fill_rgbas()[0],
+        )]
+
+    def record(self, camera, scene, num_frames=1):
+        frame = self.n_frames
+        if self.background is None:
+            self.background = ManimColor(camera.background_color).to_hex()
+        mobjects = camera.get_mobjects_to_display(list_update(scene.mobjects, scene.foreground_mobjects))
+        seen = set()
+        for mobject in mobjects:
+            for index, (paths, stroke, width, fill) in enumerate(self.items(camera, mobject)):
+                key = (id(mobject), index)
+                track = self.tracks.get(key)
+                if track is None:
+                    name = f"{type(mobject).__name__} {len(self.tracks)}"
+                    track = self.tracks[key] = VectorTrack(name, frame, mobject)
+                seen.add(key)
+                track.n_paths = max(track.n_paths, len(paths))
+                track.set("paths", frame, paths)
+                track.set("stroke", frame, rounded([*stroke[:3], 1], 3))
+                track.set("stroke_opacity", frame, round(100 * float(stroke[3]), 1))
+                track.set("width", frame, round(float(width), DECIMALS))
+                if fill is not None and (track.has_fill or fill[3] > 0):
+                    track.has_fill = True
+                    track.set("fill", frame, rounded([*fill[:3], 1], 3))
+                    track.set("fill_opacity", frame, round(100 * float(fill[3]), 1))
+                track.set("visible", frame, True)
+        for key, track in self.tracks.items():
+            if key not in seen:
+                track.set("visible", frame, False)
+        self.n_frames += num_frames
+
+    def to_lottie(self):
+        n_frames = max(self.n_frames, 1)
+        # Pehle bane tracks neeche: Lottie mein pehli layer sabse upar
+        tracks = list(self.tracks.values())[::-1]
+        layers = [track.to_layer(index, n_frames) for index, track in enumerate(tracks, start=1)]
+        layers.append({
+            "ddd": 0,
+            "ind": len(layers) + 1,
+            "ty": 1,
+            "nm": "background",
+            "sr": 1,
+            "ks": static_transform(),
+            "ao": 0,
+            "sc": self.background or "#000000",
+            "sw": self.pixel_width,
+            "sh": self.pixel_height,
+            "ip": 0,
+            "op": n_frames,
+            "st": 0,
+            "bm": 0,
+        })
+        return {
+            "v": LOTTIE_VERSION,
+            "fr": self.frame_rate,
+            "ip": 0,
+            "op": n_frames,
+            "w": self.pixel_width,
+            "h": self.pixel_height,
+            "nm": self.scene_name,
+            "ddd": 0,
+            "assets": [],
+            "layers": layers,
+        }
+
+    def write(self, file_path):
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with file_path.open("w", encoding="utf-8") as fp:
+            json.dump(self.to_lottie(), fp, separators=(",", ":"))
+        return file_path
+
+
+class VectorExportMixin:
+    # Renderer ke liye (sirf enable_feature("vector_export") ke baad): frames
+    # rasterize nahi hote, sirf VectorRecorder mein record; scene khatam hone
+    # par Lottie JSON.
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self.vector_scene = scene
+        self.recorder = VectorRecorder(
+            type(scene).__name__, config.pixel_width, config.pixel_height, config.frame_rate
+        )
+        self.vector_started = time.perf_counter()
+
+    def update_frame(self, scene=None, *args, **kwargs):
+        if getattr(self, "recorder", None) is None:
+            return super().update_frame(scene, *args, **kwargs)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        if getattr(self, "recorder", None) is None:
+            return super().save_static_frame_data(scene, static_mobjects)
+        self.static_image = None
+        return None
+
+    def get_frame(self):
+        if getattr(self, "recorder", None) is None:
+            return super().get_frame()
+        return None
+
+    def add_frame(self, frame, num_frames=1):
+        if getattr(self, "recorder", None) is None:
+            return super().add_frame(frame, num_frames)
+        if self.skip_animations:
+            return
+        self.time += num_frames / self.camera.frame_rate
+        self.recorder.record(self.camera, self.vector_scene, num_frames)
+
+    def scene_finished(self, scene):
+        if getattr(self, "recorder", None) is None:
+            return super().scene_finished(scene)
+        if self.num_plays:
+            self.file_writer.finish()
+        recorder = self.recorder
+        file_path = recorder.write(Path(config.media_dir) / "vector" / f"{recorder.scene_name}.json")
+        if recorder.skipped:
+            logger.warning(
+                "Not vectorized (left out of %(path)s): %(types)s",
+                {"path": file_path, "types": ", ".join(sorted(recorder.skipped))},
+            )
+        logger.info(
+            "Vector export: %(frames)d frames, %(layers)d layers, %(kb).0f KB in %(elapsed).1fs -> %(path)s",
+            {
+                "frames": recorder.n_frames, "layers": len(recorder.tracks),
+                "kb": file_path.stat().st_size / 1024,
+                "elapsed": time.perf_counter() - self.vector_started, "path": file_path,
+            },
+        )
+
+
+def main():
+    from nature_renderer import enable_feature
+    from parallel_render import QUALITY_FLAGS, apply_config, load_scene_class
+
+    parser = argparse.ArgumentParser(description="Export a scene as a Lottie JSON animation (no rasterizing).")
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_FLAGS), default=None)
+    parser.add_argument("--media-dir", default=None)
+    args = parser.parse_args()
+
+    overrides = {"write_to_movie": False, "save_last_frame": False, "disable_caching": True}
+    if args.quality:
+        overrides["quality"] = QUALITY_FLAGS[args.quality]
+    if args.media_dir:
+        overrides["media_dir"] = args.media_dir
+    apply_config(args.scene_file, overrides)
+    enable_feature("vector_export")
+    load_scene_class(args.scene_file, args.scene_name)().render()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())